@@ -2,10 +2,19 @@ INSERT INTO calculations (title, name, description)
 VALUES ('N-е число Фибоначчи', 'fibonacci', 'Числа Фибоначчи - последовательность чисел, каждый член которой равен сумме двух предыдущих.
 Введите порядковый номер числа Фибоначчи и калькулятор выдаст вам соответствующее значение.'),
        ('Числа Фибоначчи', 'fibonacci_list', 'Числа Фибоначчи - последовательность чисел, каждый член которой равен сумме двух предыдущих.
-Введите n-ый член, для которого надо сформировать ряд Фибоначчи, и калькулятор выдаст вам последовательность до n-го члена.'),
+Введите n-ый член, для которого надо сформировать ряд Фибоначчи, и калькулятор выдаст вам последовательность до n-го члена.
+Целиком возвращается последовательность до 4888-го члена, более длинную запрашивайте фрагментами, задавая смещение и количество чисел.'),
        ('Расход топлива для поездки на заданное расстояние', 'fuel_consumption',
         'Калькулятор расхода топлива поможет рассчитать количество и стоимость топлива для поездки на заданное расстояние'),
        ('Вычитание матриц', 'matrix_sub', 'Вычитание матриц'),
+       ('Сложение матриц', 'matrix_add', 'Сложение матриц'),
+       ('Умножение матриц', 'matrix_mul',
+        'Произведение матриц: количество столбцов первой матрицы должно совпадать с количеством строк второй'),
+       ('Транспонирование матрицы', 'matrix_transpose', 'Транспонирование матрицы'),
+       ('Определитель матрицы', 'matrix_det', 'Определитель квадратной матрицы'),
+       ('Обратная матрица', 'matrix_inv', 'Обратная матрица для невырожденной квадратной матрицы'),
+       ('Система линейных уравнений', 'matrix_solve',
+        'Решение системы линейных уравнений n x = b с невырожденной квадратной матрицей n'),
        ('Проверка ряда чисел на совершенность', 'perfect_numbers', 'Совершенное число - число, равное сумме своих собственных делителей (то есть всех своих положительных делителей, отличных от самого числа).
 Введите ряд чисел через запятую для проверки наличия совершенных чисел.
 Пример: 4,5,28,496,6789,5235906'),
@@ -17,9 +26,16 @@ VALUES ('N-е число Фибоначчи', 'fibonacci', 'Числа Фибо
 
 INSERT INTO parameters (calculation_id, name, title, description, data_type, data_shape)
 VALUES ((SELECT id FROM calculations WHERE name = 'fibonacci'),
-        'n', 'Номер числа Фибоначчи', 'Введите целое положительное число', 'INT', 'SCALAR'),
+        'n', 'Номер числа Фибоначчи', 'Введите целое положительное число не больше 95701', 'INT', 'SCALAR'),
        ((SELECT id FROM calculations WHERE name = 'fibonacci_list'),
-        'n', 'Длина последовательности', 'Введите целое положительное число', 'INT', 'SCALAR'),
+        'n', 'Длина последовательности', 'Введите целое положительное число не больше 95701', 'INT', 'SCALAR'),
+       ((SELECT id FROM calculations WHERE name = 'fibonacci_list'),
+        'offset', 'Смещение', 'Количество пропускаемых первых чисел последовательности (по умолчанию 0)', 'INT',
+        'SCALAR'),
+       ((SELECT id FROM calculations WHERE name = 'fibonacci_list'),
+        'limit', 'Количество чисел',
+        'Наибольшее количество возвращаемых чисел (по умолчанию - до n-го числа, без ограничения n не больше 4888)',
+        'INT', 'SCALAR'),
        ((SELECT id FROM calculations WHERE name = 'fuel_consumption'),
         'distance', 'Сколько хотите проехать', 'Введите неотрицательное вещественное число', 'FLOAT', 'SCALAR'),
        ((SELECT id FROM calculations WHERE name = 'fuel_consumption'),
@@ -34,8 +50,34 @@ VALUES ((SELECT id FROM calculations WHERE name = 'fibonacci'),
         'n', 'Матрица', 'Введите значения в матрицу', 'FLOAT', 'MATRIX'),
        ((SELECT id FROM calculations WHERE name = 'matrix_sub'),
         'm', 'Матрица', 'Введите значения в матрицу', 'FLOAT', 'MATRIX'),
+       ((SELECT id FROM calculations WHERE name = 'matrix_add'),
+        'n', 'Матрица', 'Введите значения в матрицу', 'FLOAT', 'MATRIX'),
+       ((SELECT id FROM calculations WHERE name = 'matrix_add'),
+        'm', 'Матрица', 'Введите значения в матрицу', 'FLOAT', 'MATRIX'),
+       ((SELECT id FROM calculations WHERE name = 'matrix_mul'),
+        'n', 'Матрица', 'Введите значения в матрицу', 'FLOAT', 'MATRIX'),
+       ((SELECT id FROM calculations WHERE name = 'matrix_mul'),
+        'm', 'Матрица', 'Введите значения в матрицу', 'FLOAT', 'MATRIX'),
+       ((SELECT id FROM calculations WHERE name = 'matrix_transpose'),
+        'n', 'Матрица', 'Введите значения в матрицу', 'FLOAT', 'MATRIX'),
+       ((SELECT id FROM calculations WHERE name = 'matrix_det'),
+        'n', 'Матрица', 'Введите значения в матрицу', 'FLOAT', 'MATRIX'),
+       ((SELECT id FROM calculations WHERE name = 'matrix_inv'),
+        'n', 'Матрица', 'Введите значения в матрицу', 'FLOAT', 'MATRIX'),
+       ((SELECT id FROM calculations WHERE name = 'matrix_solve'),
+        'n', 'Матрица', 'Введите значения в матрицу', 'FLOAT', 'MATRIX'),
+       ((SELECT id FROM calculations WHERE name = 'matrix_solve'),
+        'b', 'Правая часть', 'Введите правые части уравнений', 'FLOAT', 'LIST'),
        ((SELECT id FROM calculations WHERE name = 'perfect_numbers'),
         'numbers', 'Ряд чисел для проверки на совершенность', 'Введите ряд целых чисел через запятую', 'INT', 'LIST'),
+       ((SELECT id FROM calculations WHERE name = 'perfect_numbers'),
+        'lo', 'Начало диапазона', 'Необязательная нижняя граница проверяемого диапазона', 'INT', 'SCALAR'),
+       ((SELECT id FROM calculations WHERE name = 'perfect_numbers'),
+        'hi', 'Конец диапазона', 'Необязательная верхняя граница проверяемого диапазона (не больше 10^11)',
+        'INT', 'SCALAR'),
+       ((SELECT id FROM calculations WHERE name = 'perfect_numbers'),
+        'classify', 'Классификация диапазона', 'Подсчитать избыточные и недостаточные числа диапазона',
+        'BOOL', 'SCALAR'),
        ((SELECT id FROM calculations WHERE name = 'quadratic_equation'),
         'a', 'Коэффициент a', 'Введите любое вещественное число кроме 0', 'FLOAT', 'SCALAR'),
        ((SELECT id FROM calculations WHERE name = 'quadratic_equation'),
@@ -46,10 +88,40 @@ VALUES ((SELECT id FROM calculations WHERE name = 'fibonacci'),
         'text', 'Исходный текст', 'Введите, пожалуйства, исходный текст', 'STRING', 'SCALAR'),
        ((SELECT id FROM calculations WHERE name = 'substring_in_a_string'), 'findtext', 'Строка для поиска',
         'Введите, пожалуйства, строку, которую нужно найти', 'STRING', 'SCALAR'),
+       ((SELECT id FROM calculations WHERE name = 'substring_in_a_string'), 'mode', 'Режим поиска',
+        'word (целые слова подряд), substring (последовательность символов) или auto', 'STRING', 'SCALAR'),
        ((SELECT id FROM calculations WHERE name = 'simplex_method'),
         'tableau', 'Матрица коэффициентов', 'Матрица коэффициентов', 'FLOAT', 'MATRIX'),
        ((SELECT id FROM calculations WHERE name = 'simplex_method'),
-        'basic_var', 'Базисные переменные', 'Базисные переменные', 'FLOAT', 'LIST');
+        'basic_var', 'Базисные переменные', 'Базисные переменные', 'FLOAT', 'LIST'),
+       ((SELECT id FROM calculations WHERE name = 'simplex_method'),
+        'pivot_rule', 'Правило выбора ведущего столбца',
+        'dantzig (наибольший коэффициент), steepest_edge (наискорейшее ребро) или bland (правило Бленда)',
+        'STRING', 'SCALAR'),
+       ((SELECT id FROM calculations WHERE name = 'simplex_method'),
+        'c', 'Коэффициенты целевой функции', 'Разреженная форма: коэффициенты минимизируемой функции c·x', 'FLOAT', 'LIST'),
+       ((SELECT id FROM calculations WHERE name = 'simplex_method'),
+        'b', 'Правые части ограничений', 'Разреженная форма: правые части ограничений A x = b', 'FLOAT', 'LIST'),
+       ((SELECT id FROM calculations WHERE name = 'simplex_method'),
+        'a_rows', 'Строки элементов A', 'Разреженная форма: номера строк (от 0) ненулевых элементов A', 'INT', 'LIST'),
+       ((SELECT id FROM calculations WHERE name = 'simplex_method'),
+        'a_cols', 'Столбцы элементов A', 'Разреженная форма: номера столбцов (от 0) ненулевых элементов A',
+        'INT', 'LIST'),
+       ((SELECT id FROM calculations WHERE name = 'simplex_method'),
+        'a_values', 'Значения элементов A', 'Разреженная форма: значения ненулевых элементов A', 'FLOAT', 'LIST'),
+       ((SELECT id FROM calculations WHERE name = 'simplex_method'),
+        'problem_id', 'Идентификатор задачи',
+        'Идентификатор из предыдущего ответа: решение начнётся с переданного в basic_var итогового базиса',
+        'STRING', 'SCALAR'),
+       ((SELECT id FROM calculations WHERE name = 'simplex_method'),
+        'max_iterations', 'Предел итераций', 'Наибольшее количество итераций, не больше 100000', 'INT', 'SCALAR'),
+       ((SELECT id FROM calculations WHERE name = 'simplex_method'),
+        'time_limit', 'Предел времени', 'Наибольшее время решения в секундах, не больше 8', 'FLOAT', 'SCALAR'),
+       ((SELECT id FROM calculations WHERE name = 'simplex_method'),
+        'integer_var', 'Целые переменные', 'Номера (от 1) переменных, которые должны быть целыми', 'INT', 'LIST'),
+       ((SELECT id FROM calculations WHERE name = 'simplex_method'),
+        'workers', 'Количество процессов', 'Количество процессов, параллельно вычисляющих узлы метода ветвей и границ',
+        'INT', 'SCALAR');
 
 INSERT INTO outputs (calculation_id, name, title, description, data_type, data_shape)
 VALUES ((SELECT id FROM calculations WHERE name = 'fibonacci'),
@@ -62,11 +134,27 @@ VALUES ((SELECT id FROM calculations WHERE name = 'fibonacci'),
         'cost', 'Стоимость топлива (руб)', 'Стоимость топлива в рублях', 'FLOAT', 'SCALAR'),
        ((SELECT id FROM calculations WHERE name = 'matrix_sub'),
         'result', 'Матрица', 'Матрица, полученная в процессе вычитания', 'FLOAT', 'MATRIX'),
+       ((SELECT id FROM calculations WHERE name = 'matrix_add'),
+        'result', 'Матрица', 'Сумма матриц', 'FLOAT', 'MATRIX'),
+       ((SELECT id FROM calculations WHERE name = 'matrix_mul'),
+        'result', 'Матрица', 'Произведение матриц', 'FLOAT', 'MATRIX'),
+       ((SELECT id FROM calculations WHERE name = 'matrix_transpose'),
+        'result', 'Матрица', 'Транспонированная матрица', 'FLOAT', 'MATRIX'),
+       ((SELECT id FROM calculations WHERE name = 'matrix_det'),
+        'result', 'Определитель', 'Определитель матрицы', 'FLOAT', 'SCALAR'),
+       ((SELECT id FROM calculations WHERE name = 'matrix_inv'),
+        'result', 'Матрица', 'Обратная матрица', 'FLOAT', 'MATRIX'),
+       ((SELECT id FROM calculations WHERE name = 'matrix_solve'),
+        'result', 'Решение', 'Значения неизвестных', 'FLOAT', 'LIST'),
        ((SELECT id FROM calculations WHERE name = 'perfect_numbers'),
         'has_perfect', 'Проверка наличия совершенных чисел', 'Указывает есть ли в исходном списке совершенные числа',
         'BOOL', 'SCALAR'),
        ((SELECT id FROM calculations WHERE name = 'perfect_numbers'),
         'perfect_numbers', 'Совершенные числа', 'Список совершенных чисел', 'INT', 'LIST'),
+       ((SELECT id FROM calculations WHERE name = 'perfect_numbers'),
+        'abundant_count', 'Избыточные числа', 'Количество избыточных чисел диапазона', 'INT', 'SCALAR'),
+       ((SELECT id FROM calculations WHERE name = 'perfect_numbers'),
+        'deficient_count', 'Недостаточные числа', 'Количество недостаточных чисел диапазона', 'INT', 'SCALAR'),
        ((SELECT id FROM calculations WHERE name = 'quadratic_equation'),
         'roots', 'Корни уравнения', 'Значения корней или сообщение, что корней нет', 'STRING', 'SCALAR'),
        ((SELECT id FROM calculations WHERE name = 'substring_in_a_string'),
@@ -75,4 +163,21 @@ VALUES ((SELECT id FROM calculations WHERE name = 'fibonacci'),
         'optimal_solution', 'Оптимальное решение',
         'Решение, при котором обеспечивается максимальное (минимальное) значение целевой функции', 'FLOAT', 'LIST'),
        ((SELECT id FROM calculations WHERE name = 'simplex_method'),
-        'optimal_value', 'Оптимальное значение', 'Оптимальное значение', 'FLOAT', 'SCALAR');
\ No newline at end of file
+        'optimal_value', 'Оптимальное значение', 'Оптимальное значение', 'FLOAT', 'SCALAR'),
+       ((SELECT id FROM calculations WHERE name = 'simplex_method'),
+        'iterations', 'Количество итераций', 'Количество выполненных замен базиса', 'INT', 'SCALAR'),
+       ((SELECT id FROM calculations WHERE name = 'simplex_method'),
+        'basis', 'Итоговый базис', 'Номера базисных переменных оптимального решения', 'INT', 'LIST'),
+       ((SELECT id FROM calculations WHERE name = 'simplex_method'),
+        'problem_id', 'Идентификатор задачи', 'Идентификатор матрицы ограничений для повторного решения',
+        'STRING', 'SCALAR'),
+       ((SELECT id FROM calculations WHERE name = 'simplex_method'),
+        'shadow_prices', 'Теневые цены', 'Изменение оптимального значения на единицу увеличения правой части',
+        'FLOAT', 'LIST'),
+       ((SELECT id FROM calculations WHERE name = 'simplex_method'),
+        'reduced_costs', 'Приведённые стоимости', 'Приведённые стоимости переменных в итоговом базисе',
+        'FLOAT', 'LIST'),
+       ((SELECT id FROM calculations WHERE name = 'simplex_method'),
+        'gap', 'Разрыв', 'Относительный разрыв между найденным целым решением и нижней границей', 'FLOAT', 'SCALAR'),
+       ((SELECT id FROM calculations WHERE name = 'simplex_method'),
+        'nodes', 'Количество узлов', 'Количество узлов, вычисленных методом ветвей и границ', 'INT', 'SCALAR');
\ No newline at end of file
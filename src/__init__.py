@@ -39,14 +39,49 @@ PATH_CONFIG = 'path_config'
 ALGORITHM_CONFIG = 'algorithm_config'
 """Ключ для раздела конфигурации с настройками для алгоритмов"""
 
+CACHE_CONFIG = 'cache_config'
+"""Ключ для раздела конфигурации кэша результатов алгоритмов"""
+
+SPOOL_CONFIG = 'spool_config'
+"""Ключ для раздела конфигурации каталога загруженных файлов матриц"""
+
 IS_TEST_APP = 'IS_TEST_APP'
 """Переменная среды, свидетельствующая о проведении тестировании модуля main"""
 
 EXECUTE_TIMEOUT = 'execute_timeout'
 """Ключ в конфигурации алгоритмов для задания времени выполнения алгоритма"""
 
+EXECUTE_TIMEOUTS = 'execute_timeouts'
+"""Ключ в конфигурации алгоритмов для задания времени выполнения отдельных
+алгоритмов, переопределяющего значение execute_timeout"""
+
+BATCH_MAX_SIZE = 'batch_max_size'
+"""Ключ в конфигурации алгоритмов для задания максимального количества
+наборов параметров в пакетном запросе"""
+
+EXECUTOR_CONFIG = 'executor'
+"""Ключ в конфигурации алгоритмов для раздела настроек пулов выполнения"""
+
+REGISTRY_REFRESH_INTERVAL = 'registry_refresh_interval'
+"""Ключ в конфигурации алгоритмов для задания периода обновления реестра
+алгоритмов (в секундах, 0 - без периодического обновления)"""
+
 ALGORITHMS_ENDPOINT = '/api/algorithms'
 """Конечная точка для API"""
 
+FILES_ENDPOINT = '/api/files'
+"""Конечная точка для загрузки и скачивания файлов матриц"""
+
+NDJSON_MEDIA_TYPE = 'application/x-ndjson'
+"""Тип содержимого потокового ответа: по одному элементу списка в строке"""
+
+NPY_MEDIA_TYPE = 'application/x-npy'
+"""Тип содержимого двоичного тела запроса и ответа: архив .npz с массивом
+NumPy на каждый параметр"""
+
+MSGPACK_MEDIA_TYPE = 'application/msgpack'
+"""Тип содержимого двоичного тела запроса и ответа: словарь MessagePack,
+массивы в котором передаются в формате .npy"""
+
 TIME_OVER_MSG = 'Время для выполнения алгоритма истекло'
 """Сообщение об ошибке таймаута"""
@@ -1,15 +1,26 @@
 from sqladmin import ModelView
 
+from src.algorithms_registry import algorithms_registry
 from src.models import Calculations, Outputs, Parameters
 
 
-class CalculationsAdmin(ModelView, model=Calculations):
+class RegistryRefreshMixin:
+    """Обновляет реестр алгоритмов после изменений, сохранённых через админку"""
+
+    async def after_model_change(self, data, model, is_created, request) -> None:
+        await algorithms_registry.refresh()
+
+    async def after_model_delete(self, model, request) -> None:
+        await algorithms_registry.refresh()
+
+
+class CalculationsAdmin(RegistryRefreshMixin, ModelView, model=Calculations):
     column_list = [c.name for c in Calculations.__table__.c] + [Calculations.parameters, Calculations.outputs]
 
 
-class ParametersAdmin(ModelView, model=Parameters):
+class ParametersAdmin(RegistryRefreshMixin, ModelView, model=Parameters):
     column_list = [c.name for c in Parameters.__table__.c] + [Parameters.calculation]
 
 
-class OutputAdmin(ModelView, model=Outputs):
+class OutputAdmin(RegistryRefreshMixin, ModelView, model=Outputs):
     column_list = [c.name for c in Outputs.__table__.c] + [Parameters.calculation]
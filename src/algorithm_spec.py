@@ -0,0 +1,153 @@
+"""Описание реализации алгоритма для универсального обработчика запросов."""
+from typing import Any, Callable, Iterator, Optional, Type, Union, get_args, get_origin
+
+import numpy as np
+from fastapi import HTTPException
+from pydantic import BaseModel
+from starlette import status
+
+from src.errors import ErrorMessages
+from src.executor import INLINE
+from src.wire_formats import encode
+
+ErrorMapping = tuple[Type[Exception], Optional[str], ErrorMessages]
+"""Правило преобразования исключения алгоритма в ответ API: тип исключения,
+фрагмент его сообщения (None - любое сообщение) и код ошибки"""
+
+
+class AlgorithmSpec:
+    """Связывает функцию алгоритма с моделями входных и выходных данных.
+
+    Валидатор входных данных и сериализатор результата извлекаются из
+    моделей один раз при создании описания, поэтому обработка запроса
+    сводится к поиску описания по имени и одному проходу валидации.
+
+    batch_function - необязательная функция, вычисляющая результаты для
+    списка наборов параметров за один проход. Для каждого набора она
+    возвращает результат либо исключение, как если бы вызывалась function.
+
+    stream_function - необязательная функция для алгоритмов со списком на
+    выходе. Она проверяет параметры и возвращает генератор элементов списка,
+    вычисляемых по мере отправки потокового ответа.
+
+    file_function - необязательная функция матричного алгоритма для файлов
+    из каталога загрузок (src/spool.py): вместо матриц она получает пути к
+    файлам .npy, а путь к файлу результата - параметром result.
+
+    text_function - необязательная фабрика потокового режима для алгоритмов
+    над большим текстом, передаваемым частями вместо параметра
+    text_parameter. Она получает остальные параметры и возвращает объект с
+    методами split (отделить часть, не зависящую от следующих), feed
+    (учесть часть), finish (результат алгоритма) и признаком parallel: если
+    он истинен, части можно вычислять независимо функцией piece_function с
+    аргументами piece_arguments(часть) и учитывать по порядку методом add.
+
+    cacheable - необязательная проверка результата: если она ложна,
+    результат не попадает в кэш, например, когда он зависит от нагрузки.
+
+    time_budget - необязательное имя параметра function, которому
+    передаётся время в секундах, отведённое алгоритму настройкой
+    execute_timeout: алгоритм с собственным ограничением времени успевает
+    вернуть частичный ответ раньше, чем рабочий процесс будет завершён.
+
+    Параметры из двоичного тела запроса (wire_formats) проверяются
+    parse_values: поля-списки и матрицы чисел с плавающей точкой принимаются
+    массивами float64 без проверки каждого элемента моделью.
+    """
+
+    def __init__(self, name: str, function: Callable[..., dict[str, Any]],
+                 input_model: Type[BaseModel], output_model: Type[BaseModel],
+                 errors: tuple[ErrorMapping, ...] = (), backend: str = INLINE,
+                 batch_function: Optional[Callable[[list[dict[str, Any]]], list[Any]]] = None,
+                 stream_function: Optional[Callable[..., Iterator[Any]]] = None,
+                 file_function: Optional[Callable[..., dict[str, Any]]] = None,
+                 text_function: Optional[Callable[..., Any]] = None, text_parameter: str = 'text',
+                 cacheable: Optional[Callable[[dict[str, Any]], bool]] = None,
+                 time_budget: Optional[str] = None):
+        self.name = name
+        self.function = function
+        self.input_model = input_model
+        self.output_model = output_model
+        self.errors = errors
+        self.backend = backend
+        self.batch_function = batch_function
+        self.stream_function = stream_function
+        self.file_function = file_function
+        self.text_function = text_function
+        self.text_parameter = text_parameter
+        self.cacheable = cacheable
+        self.time_budget = time_budget
+        self.__validate_input = input_model.__pydantic_validator__.validate_json
+        self.__validate_item = input_model.__pydantic_validator__.validate_python
+        self.__validate_output = output_model.__pydantic_validator__.validate_python
+        self.__serialize_output = output_model.__pydantic_serializer__.to_json
+        self.__array_fields = {name: depth for name, field in input_model.model_fields.items()
+                               if (depth := self.__float_list_depth(field.annotation))}
+
+    def is_cacheable(self, result: dict[str, Any]) -> bool:
+        return self.cacheable is None or self.cacheable(result)
+
+    def with_time_budget(self, parameters: dict[str, Any], budget: float) -> dict[str, Any]:
+        """Параметры вызова function с отведённым временем budget (0 - без ограничения)"""
+        if self.time_budget is None or budget <= 0:
+            return parameters
+        return {**parameters, self.time_budget: budget}
+
+    def parse_parameters(self, body: bytes) -> dict[str, Any]:
+        return dict(self.__validate_input(body))
+
+    def parse_item(self, item: Any) -> dict[str, Any]:
+        return dict(self.__validate_item(item))
+
+    def parse_values(self, values: dict[str, Any]) -> dict[str, Any]:
+        """Проверка параметров, прочитанных из двоичного тела запроса. Массив
+        нужной размерности с числовыми элементами передаётся функции как есть,
+        остальные значения, в том числе списки целых чисел, проверяет модель"""
+        values, arrays = dict(values), {}
+        for name, value in values.items():
+            if not isinstance(value, np.ndarray):
+                continue
+            if value.ndim == self.__array_fields.get(name) and value.dtype.kind in 'biuf':
+                arrays[name] = value.astype(np.float64, copy=False)
+                # пустой список проходит проверку типа поля без обхода элементов
+                values[name] = []
+            else:
+                values[name] = value.tolist()
+        parameters = dict(self.__validate_item(values))
+        parameters.update(arrays)
+        return parameters
+
+    def serialize_result(self, result: dict[str, Any], media_type: Optional[str] = None) -> bytes:
+        """Ответ в формате JSON либо, если задан media_type, в двоичном формате"""
+        output = self.__validate_output(result)
+        if media_type is None:
+            return self.__serialize_output(output)
+        return encode(dict(output), media_type)
+
+    def error_detail(self, error: Exception) -> Optional[ErrorMessages]:
+        message = str(error)
+        for error_type, fragment, detail in self.errors:
+            if isinstance(error, error_type) and (fragment is None or fragment in message):
+                return detail
+        return None
+
+    def to_http_exception(self, error: Exception) -> Optional[HTTPException]:
+        detail = self.error_detail(error)
+        if detail is None:
+            return None
+        return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+    @staticmethod
+    def __float_list_depth(annotation: Any) -> int:
+        '''
+        Вложенность списков чисел с плавающей точкой в аннотации поля: 1 - список,
+        2 - матрица, 0 - поле другого типа
+        '''
+        arguments = [argument for argument in get_args(annotation) if argument is not type(None)]
+        if get_origin(annotation) is Union and len(arguments) == 1:
+            annotation = arguments[0]
+        depth = 0
+        while get_origin(annotation) is list:
+            annotation, = get_args(annotation)
+            depth += 1
+        return depth if annotation is float else 0
@@ -1,7 +1,41 @@
+from functools import lru_cache
+from math import log10, sqrt, ceil
+
+MAX_RESULT_DIGITS = 20000
+"""Наибольшее количество десятичных цифр в результате"""
+
+MAX_N = ceil((MAX_RESULT_DIGITS + log10(sqrt(5))) / log10((1 + sqrt(5)) / 2)) - 1
+"""Наибольший номер числа Фибоначчи, содержащего не более MAX_RESULT_DIGITS
+цифр (F(n) содержит floor(n*lg(φ) - lg(√5)) + 1 цифр)"""
+
+MEMO_SIZE = 1024
+"""Количество запоминаемых результатов для недавно запрошенных номеров"""
+
+NOT_NATURAL_MSG = 'Номер числа Фибоначчи должен быть натуральным числом'
+TOO_LARGE_TEMPL = 'Номер числа Фибоначчи не должен превышать {0}'
+
+
+def fibonacci_pair(n: int) -> tuple[int, int]:
+    """Возвращает (F(n), F(n + 1)) методом быстрого удвоения за O(log n)
+    умножений: F(2k) = F(k)(2F(k+1) - F(k)), F(2k+1) = F(k)^2 + F(k+1)^2"""
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if bit == '1':
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return a, b
+
+
+@lru_cache(maxsize=MEMO_SIZE)
 def fibonacci(n: int) -> int:
-    if n == 1 or n == 2:
-        return 1
-    return fibonacci(n - 1) + fibonacci(n - 2)
+    if type(n) != int or n < 1:
+        raise ValueError(NOT_NATURAL_MSG)
+    if n > MAX_N:
+        raise ValueError(TOO_LARGE_TEMPL.format(MAX_N))
+    return fibonacci_pair(n)[0]
 
 
 def main(n: int):
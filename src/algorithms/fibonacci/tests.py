@@ -1,7 +1,8 @@
 import unittest
 
 
-from src.algorithms.fibonacci.function import main
+from src.algorithms.fibonacci.function import main, fibonacci_pair, \
+    MAX_N, MAX_RESULT_DIGITS, NOT_NATURAL_MSG, TOO_LARGE_TEMPL
 
 
 class TestCase(unittest.TestCase):
@@ -11,6 +12,28 @@ class TestCase(unittest.TestCase):
         for index, number in enumerate(self.numbers):
             self.assertEqual(main(index + 1), {'result': number})
 
+    def test_pair_matches_iteration(self):
+        a, b = 0, 1
+        for n in range(300):
+            self.assertEqual(fibonacci_pair(n), (a, b))
+            a, b = b, a + b
+
+    def test_large(self):
+        self.assertEqual(main(100), {'result': 354224848179261915075})
+        largest = main(MAX_N)['result']
+        self.assertTrue(10 ** (MAX_RESULT_DIGITS - 1) <= largest
+                        < 10 ** MAX_RESULT_DIGITS)
+        self.assertGreaterEqual(fibonacci_pair(MAX_N + 1)[0],
+                                10 ** MAX_RESULT_DIGITS)
+
+    def test_not_natural(self):
+        self.assertRaisesRegex(ValueError, NOT_NATURAL_MSG, main, 0)
+        self.assertRaisesRegex(ValueError, NOT_NATURAL_MSG, main, -5)
+
+    def test_too_large(self):
+        self.assertRaisesRegex(ValueError, TOO_LARGE_TEMPL.format(MAX_N),
+                               main, MAX_N + 1)
+
 
 if __name__ == '__main__':
     unittest.main()
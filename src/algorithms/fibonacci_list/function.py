@@ -1,14 +1,73 @@
-def fibonacci(n: int) -> list[int]:
-    if n == 1 or n == 2:
-        return [1]*n
-    fibonacci_list = [1]*n
-    for i in range(2, n):
-        fibonacci_list[i] = fibonacci_list[i - 1] + fibonacci_list[i - 2]
-    return fibonacci_list
+from math import log10, sqrt
+from typing import Iterator, Optional
 
+from src.algorithms.fibonacci.function import fibonacci_pair, MAX_N
 
-def main(n: int):
-    return {'result': fibonacci(n)}
+MAX_TOTAL_DIGITS = 5_000_000
+"""Наибольшее суммарное количество десятичных цифр в возвращаемом фрагменте"""
+
+STREAM_MAX_TOTAL_DIGITS = 200_000_000
+"""Наибольшее суммарное количество десятичных цифр во фрагменте, который
+передаётся по мере вычисления и не хранится в памяти целиком"""
+
+DIGITS_PER_INDEX = log10((1 + sqrt(5)) / 2)
+"""Прирост количества цифр числа Фибоначчи при увеличении номера на 1"""
+
+MAX_FULL_N = int((sqrt(1 + 4 * DIGITS_PER_INDEX * MAX_TOTAL_DIGITS) - 1) / (2 * DIGITS_PER_INDEX))
+"""Наибольшее n, для которого последовательность без offset и limit укладывается в MAX_TOTAL_DIGITS
+(4888); для больших n фрагмент нужно ограничить параметрами offset и limit"""
+
+TOO_LARGE_N_TEMPL = 'Длина последовательности не должна превышать {0}'
+NEGATIVE_WINDOW_MSG = 'Смещение и количество чисел не могут быть отрицательными'
+TOO_LARGE_WINDOW_MSG = 'Запрошенный фрагмент последовательности слишком велик'
+
+
+def __window_bounds(n: int, offset: int, limit: Optional[int], max_total_digits: int) -> tuple[int, int]:
+    if n > MAX_N:
+        raise ValueError(TOO_LARGE_N_TEMPL.format(MAX_N))
+    if offset < 0 or (limit is not None and limit < 0):
+        raise ValueError(NEGATIVE_WINDOW_MSG)
+    first = offset + 1
+    last = n if limit is None else min(n, offset + limit)
+    # Оценка сверху: каждое число фрагмента не длиннее последнего
+    if last >= first and (last - first + 1) * (last * DIGITS_PER_INDEX + 1) > max_total_digits:
+        raise ValueError(TOO_LARGE_WINDOW_MSG)
+    return first, last
+
+
+def __generate(first: int, last: int) -> Iterator[int]:
+    if last < first:
+        return
+    a, b = fibonacci_pair(first)
+    for _ in range(last - first + 1):
+        yield a
+        a, b = b, a + b
+
+
+def fibonacci_window(n: int, offset: int = 0, limit: Optional[int] = None,
+                     max_total_digits: int = STREAM_MAX_TOTAL_DIGITS) -> Iterator[int]:
+    """Возвращает генератор чисел Фибоначчи с номерами от offset + 1 до
+    min(n, offset + limit), не вычисляя предшествующие числа: два
+    начальных числа фрагмента находятся быстрым удвоением.
+
+    Параметры проверяются сразу, до получения первого числа.
+    """
+    first, last = __window_bounds(n, offset, limit, max_total_digits)
+    return __generate(first, last)
+
+
+def fibonacci(n: int, offset: int = 0, limit: Optional[int] = None) -> list[int]:
+    return list(fibonacci_window(n, offset, limit, MAX_TOTAL_DIGITS))
+
+
+def main(n: int, offset: int = 0, limit: Optional[int] = None):
+    """Возвращает числа Фибоначчи с номерами от offset + 1 до min(n, offset + limit).
+
+    Суммарное количество цифр фрагмента ограничено MAX_TOTAL_DIGITS: без limit
+    последовательность возвращается целиком только для n <= MAX_FULL_N, для
+    больших n запрос без limit завершается ошибкой TOO_LARGE_WINDOW_MSG.
+    """
+    return {'result': fibonacci(n, offset, limit)}
 
 
 if __name__ == '__main__':
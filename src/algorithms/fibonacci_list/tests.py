@@ -1,7 +1,9 @@
 import unittest
 
 
-from src.algorithms.fibonacci_list.function import main
+from src.algorithms.fibonacci_list.function import main, fibonacci_window, \
+    NEGATIVE_WINDOW_MSG, TOO_LARGE_WINDOW_MSG, TOO_LARGE_N_TEMPL, MAX_FULL_N
+from src.algorithms.fibonacci.function import fibonacci_pair, MAX_N
 
 
 class TestCase(unittest.TestCase):
@@ -11,6 +13,42 @@ class TestCase(unittest.TestCase):
         for i in range(len(self.numbers)):
             self.assertEqual(main(i + 1), {'result': self.numbers[:i + 1]})
 
+    def test_window(self):
+        self.assertEqual(main(10, 3, 4), {'result': self.numbers[3:7]})
+        self.assertEqual(main(10, 7), {'result': self.numbers[7:]})
+        self.assertEqual(main(10, 8, 100), {'result': self.numbers[8:]})
+        self.assertEqual(main(10, 10, 5), {'result': []})
+        self.assertEqual(main(10, 2, 0), {'result': []})
+
+    def test_far_window(self):
+        result = main(MAX_N, 90000, 3)['result']
+        first, second = fibonacci_pair(90001)
+        self.assertEqual(result, [first, second, first + second])
+
+    def test_window_generator(self):
+        self.assertEqual(list(fibonacci_window(10, 3, 4)), self.numbers[3:7])
+        # Параметры проверяются до получения первого числа
+        self.assertRaisesRegex(ValueError, NEGATIVE_WINDOW_MSG,
+                               fibonacci_window, 10, -1)
+        # Потоковый фрагмент может быть больше возвращаемого списком
+        self.assertEqual(len(list(fibonacci_window(20000))), 20000)
+
+    def test_negative_window(self):
+        self.assertRaisesRegex(ValueError, NEGATIVE_WINDOW_MSG, main, 10, -1)
+        self.assertRaisesRegex(ValueError, NEGATIVE_WINDOW_MSG, main, 10, 0, -1)
+
+    def test_too_large(self):
+        self.assertRaisesRegex(ValueError, TOO_LARGE_N_TEMPL.format(MAX_N),
+                               main, MAX_N + 1)
+        self.assertRaisesRegex(ValueError, TOO_LARGE_WINDOW_MSG, main, MAX_N)
+
+    def test_full_sequence_boundary(self):
+        self.assertEqual(MAX_FULL_N, 4888)
+        self.assertEqual(len(main(MAX_FULL_N)['result']), MAX_FULL_N)
+        self.assertRaisesRegex(ValueError, TOO_LARGE_WINDOW_MSG, main, MAX_FULL_N + 1)
+        # больший n запрашивается фрагментами
+        self.assertEqual(len(main(MAX_FULL_N + 1, MAX_FULL_N, 10)['result']), 1)
+
 
 if __name__ == '__main__':
     unittest.main()
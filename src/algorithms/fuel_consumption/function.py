@@ -1,5 +1,6 @@
-from typing import Any
+from typing import Any, Union
 
+import numpy as np
 
 VOLUME = 'volume'
 COST = 'cost'
@@ -27,10 +28,47 @@ def main(distance: float, mean_consumption: float, price: float,
     __check_params_raises_ex(distance, mean_consumption, price)
     volume = distance * mean_consumption / 100
     cost = volume * price
+    return __result(volume, cost, need_round)
+
+
+def __result(volume: float, cost: float, need_round: bool) -> dict[str, float]:
     if need_round:
         return {VOLUME: float(round(volume)), COST: float(round(cost))}
     return {VOLUME: round(volume, 2), COST: round(cost, 2)}
 
 
+def main_batch(parameters: list[dict[str, Any]]) -> list[Union[dict[str, float], Exception]]:
+    """Рассчитывает набор поездок одним векторным проходом NumPy.
+
+    Для каждого набора параметров возвращается тот же результат, что и
+    у main, либо исключение, которое main возбудила бы для этого набора.
+    """
+    results: list[Union[dict[str, float], Exception]] = []
+    valid = []
+    for i, params in enumerate(parameters):
+        try:
+            __check_params_raises_ex(params['distance'], params['mean_consumption'], params['price'])
+        except (TypeError, ValueError) as e:
+            results.append(e)
+            continue
+        results.append({})
+        valid.append(i)
+    if not valid:
+        return results
+    distance = np.array([parameters[i]['distance'] for i in valid], dtype=np.float64)
+    mean_consumption = np.array([parameters[i]['mean_consumption'] for i in valid], dtype=np.float64)
+    price = np.array([parameters[i]['price'] for i in valid], dtype=np.float64)
+    # переполнение даёт inf, как и в main; ошибку возбуждает только округление
+    with np.errstate(over='ignore'):
+        volume = distance * mean_consumption / 100
+        cost = volume * price
+    for i, volume_i, cost_i in zip(valid, volume.tolist(), cost.tolist()):
+        try:
+            results[i] = __result(volume_i, cost_i, parameters[i]['need_round'])
+        except (OverflowError, ValueError) as e:
+            results[i] = e
+    return results
+
+
 if __name__ == '__main__':
     print(main(100.0, 7.5, 45.0, True))
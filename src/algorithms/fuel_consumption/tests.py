@@ -1,7 +1,8 @@
 import unittest
+import warnings
 
 
-from src.algorithms.fuel_consumption.function import main, VOLUME, COST, \
+from src.algorithms.fuel_consumption.function import main, main_batch, VOLUME, COST, \
     NON_FLOAT_PARAM_TEMPL, NEG_VALUE_PARAM_TEMPL, DISTANCE_NAME, MEAN_NAME, \
     PRICE_NAME
 
@@ -48,6 +49,36 @@ class TestCase(unittest.TestCase):
         self.assertEqual({VOLUME: 7.5, COST: 337.5},
                          main(100.0, 7.5, 45.0, False))
 
+    def test_batch_matches_main(self):
+        trips = [(0., 0., 0., True), (100.0, 7.5, 45.0, True),
+                 (100.0, 7.5, 45.0, False), (1234.5, 6.78, 52.3, False)]
+        parameters = [{'distance': d, 'mean_consumption': m, 'price': p,
+                       'need_round': r} for d, m, p, r in trips]
+        self.assertEqual([main(*trip) for trip in trips],
+                         main_batch(parameters))
+
+    def test_batch_errors(self):
+        results = main_batch([
+            {'distance': 100., 'mean_consumption': -1., 'price': 1.,
+             'need_round': False},
+            {'distance': 100., 'mean_consumption': 7.5, 'price': 45.,
+             'need_round': True}])
+        self.assertIsInstance(results[0], ValueError)
+        self.assertEqual(str(results[0]), NEG_VALUE_PARAM_TEMPL.format(MEAN_NAME))
+        self.assertEqual({VOLUME: 8., COST: 338.}, results[1])
+
+    def test_batch_overflow(self):
+        self.assertRaises(OverflowError, main, 1e308, 100., 1e308, True)
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            results = main_batch([
+                {'distance': 1e308, 'mean_consumption': 100., 'price': 1e308,
+                 'need_round': True},
+                {'distance': 100., 'mean_consumption': 7.5, 'price': 45.,
+                 'need_round': True}])
+        self.assertIsInstance(results[0], OverflowError)
+        self.assertEqual({VOLUME: 8., COST: 338.}, results[1])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,24 @@
+from src.algorithms.matrix_engine import to_array, to_list, add, \
+    open_matrix, create_matrix, add_blocks, check_same_shape
+
+
+def main(n: list[list[float]], m: list[list[float]]) -> \
+        dict[str, list[list[float]]]:
+    return {'result': to_list(add(to_array(n, 'n'), to_array(m, 'm')))}
+
+
+def main_file(n: str, m: str, result: str) -> dict[str, list[int]]:
+    """Сумма матриц из файлов .npy n и m по блокам строк с записью в файл
+    result"""
+    first, second = open_matrix(n, 'n'), open_matrix(m, 'm')
+    check_same_shape(first, second, 'm')
+    add_blocks(first, second, create_matrix(result, first.shape))
+    return {'shape': list(first.shape)}
+
+
+if __name__ == '__main__':
+    n = [[1., 2., 3.],
+         [2., 3., 4.]]
+    m = [[0., 2., 2.],
+         [2., 1., 4.]]
+    print(main(n, m))
@@ -0,0 +1,33 @@
+import unittest
+
+
+from src.algorithms.matrix_add.function import main
+
+
+class TestCase(unittest.TestCase):
+
+    def test_add(self):
+        n = [[1., 2., 3.],
+             [2., 3., 4.]]
+        m = [[0., 2., 2.],
+             [2., 1., 4.]]
+        self.assertEqual(main(n, m), {'result': [[1.0, 4.0, 5.0],
+                                                 [4.0, 4.0, 8.0]]})
+
+    def test_dlina(self):
+        self.assertRaisesRegex(ValueError, 'Длины матриц не совпадают!',
+                               main, [[0.0], [1.0]], [[0.0], [0.0], [0.0]])
+
+    def test_columns(self):
+        self.assertRaisesRegex(ValueError, 'Введено неверное количество столбцов для n',
+                               main, [[0.0, 1.0], [1.0]], [[0.0], [0.0]])
+        self.assertRaisesRegex(ValueError, 'Введено неверное количество столбцов для m',
+                               main, [[0.0, 1.0], [1.0, 2.0]], [[0.0], [0.0]])
+
+    def test_row(self):
+        self.assertRaisesRegex(ValueError, 'Не введено значение в матрице m',
+                               main, [[2.0], [1.0]], [[None], [1.0]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,11 @@
+from src.algorithms.matrix_engine import to_array, determinant
+
+
+def main(n: list[list[float]]) -> dict[str, float]:
+    return {'result': determinant(to_array(n, 'n'))}
+
+
+if __name__ == '__main__':
+    n = [[2., 1.],
+         [7., 4.]]
+    print(main(n))
@@ -0,0 +1,25 @@
+import unittest
+
+
+from src.algorithms.matrix_det.function import main
+
+
+class TestCase(unittest.TestCase):
+
+    def test_det(self):
+        self.assertAlmostEqual(main([[2., 1.], [7., 4.]])['result'], 1.0)
+        self.assertAlmostEqual(main([[1., 2., 3.], [4., 5., 6.], [7., 8., 10.]])['result'], -3.0)
+
+    def test_singular(self):
+        self.assertEqual(main([[1., 2.], [2., 4.]]), {'result': 0.0})
+
+    def test_not_square(self):
+        self.assertRaisesRegex(ValueError, 'Матрица не квадратная', main, [[1., 2.]])
+
+    def test_too_large(self):
+        n = [[1e200 if i == j else 0. for j in range(3)] for i in range(3)]
+        self.assertRaisesRegex(ValueError, 'Результат слишком велик', main, n)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,204 @@
+"""Общая часть матричных алгоритмов.
+
+Матрица из входных данных (параметр формы MATRIX) один раз преобразуется в
+непрерывный массив float64, форма и пропущенные значения проверяются
+векторно, а сами операции выполняются NumPy через BLAS и LAPACK без циклов
+Python по элементам.
+
+Для матриц из загруженных файлов (src/spool.py) операции выполняются по
+блокам: файлы открываются отображением в память (np.memmap), результат
+пишется в такой же файл .npy, а в памяти одновременно находится не больше
+нескольких блоков размером BLOCK_BYTES.
+"""
+import math
+from typing import Optional
+
+import numpy as np
+
+MATRIX_LENGTHS_MSG = 'Длины матриц не совпадают!'
+WRONG_COLUMNS_MSG = 'Введено неверное количество столбцов для'
+MISSING_VALUE_MSG = 'Не введено значение в матрице'
+EMPTY_MATRIX_MSG = 'Не введены значения матрицы'
+NOT_SQUARE_MSG = 'Матрица не квадратная'
+NOT_MULTIPLIABLE_MSG = 'Количество столбцов первой матрицы не совпадает с количеством строк второй'
+SINGULAR_MSG = 'Матрица вырождена'
+TOO_LARGE_MSG = 'Результат слишком велик'
+NOT_NUMERIC_MSG = 'Файл не содержит числовую матрицу'
+
+BLOCK_BYTES = 32 * 1024 * 1024
+"""Размер блока матрицы из файла, обрабатываемого за один шаг"""
+
+
+def to_array(matrix: list[list[Optional[float]]], name: str) -> np.ndarray:
+    """Непрерывный массив float64 из вложенных списков. Пропущенные значения
+    (None) становятся NaN и обнаруживаются одной проверкой всего массива"""
+    try:
+        array = np.array(matrix, dtype=np.float64)
+    except ValueError:
+        # строки разной длины не образуют двумерный массив
+        raise ValueError(f'{WRONG_COLUMNS_MSG} {name}')
+    if array.ndim != 2 or array.size == 0:
+        raise ValueError(EMPTY_MATRIX_MSG)
+    if np.isnan(array).any():
+        raise ValueError(f'{MISSING_VALUE_MSG} {name}')
+    return array
+
+
+def to_vector(vector: list[Optional[float]], name: str) -> np.ndarray:
+    array = np.array(vector, dtype=np.float64)
+    if array.ndim != 1 or array.size == 0:
+        raise ValueError(EMPTY_MATRIX_MSG)
+    if np.isnan(array).any():
+        raise ValueError(f'{MISSING_VALUE_MSG} {name}')
+    return array
+
+
+def check_same_shape(first: np.ndarray, second: np.ndarray, name: str) -> None:
+    if first.shape[0] != second.shape[0]:
+        raise ValueError(MATRIX_LENGTHS_MSG)
+    if first.shape[1] != second.shape[1]:
+        raise ValueError(f'{WRONG_COLUMNS_MSG} {name}')
+
+
+def check_square(matrix: np.ndarray) -> None:
+    if matrix.shape[0] != matrix.shape[1]:
+        raise ValueError(NOT_SQUARE_MSG)
+
+
+def to_list(array: np.ndarray) -> list:
+    """Результат операции в виде списков; бесконечные значения не
+    представимы в JSON"""
+    if not np.isfinite(array).all():
+        raise ValueError(TOO_LARGE_MSG)
+    return array.tolist()
+
+
+def add(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    check_same_shape(first, second, 'm')
+    return np.add(first, second, out=first)
+
+
+def subtract(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    check_same_shape(first, second, 'm')
+    return np.subtract(first, second, out=first)
+
+
+def multiply(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    if first.shape[1] != second.shape[0]:
+        raise ValueError(NOT_MULTIPLIABLE_MSG)
+    return first @ second
+
+
+def transpose(matrix: np.ndarray) -> np.ndarray:
+    # транспонированное представление копируется, чтобы tolist шёл по строкам подряд
+    return np.ascontiguousarray(matrix.T)
+
+
+def determinant(matrix: np.ndarray) -> float:
+    """Определитель по LU-разложению. Логарифм модуля не переполняется,
+    поэтому слишком большой определитель обнаруживается до вычисления"""
+    check_square(matrix)
+    sign, logarithm = np.linalg.slogdet(matrix)
+    if sign == 0:
+        return 0.
+    if logarithm > np.log(np.finfo(np.float64).max):
+        raise ValueError(TOO_LARGE_MSG)
+    return float(sign * np.exp(logarithm))
+
+
+def inverse(matrix: np.ndarray) -> np.ndarray:
+    check_square(matrix)
+    try:
+        return np.linalg.inv(matrix)
+    except np.linalg.LinAlgError:
+        raise ValueError(SINGULAR_MSG)
+
+
+def solve(matrix: np.ndarray, rhs: np.ndarray) -> np.ndarray:
+    check_square(matrix)
+    if matrix.shape[0] != rhs.shape[0]:
+        raise ValueError(MATRIX_LENGTHS_MSG)
+    try:
+        return np.linalg.solve(matrix, rhs)
+    except np.linalg.LinAlgError:
+        raise ValueError(SINGULAR_MSG)
+
+
+def open_matrix(path: str, name: str) -> np.ndarray:
+    """Матрица из файла .npy, отображённого в память только для чтения"""
+    try:
+        matrix = np.load(path, mmap_mode='r', allow_pickle=False)
+    except ValueError:
+        raise ValueError(f'{NOT_NUMERIC_MSG} {name}')
+    if matrix.ndim != 2 or matrix.dtype.kind not in 'biuf':
+        raise ValueError(f'{NOT_NUMERIC_MSG} {name}')
+    if matrix.size == 0:
+        raise ValueError(EMPTY_MATRIX_MSG)
+    return matrix
+
+
+def create_matrix(path: str, shape: tuple[int, int]) -> np.ndarray:
+    """Файл .npy для результата, отображённый в память для записи"""
+    return np.lib.format.open_memmap(path, mode='w+', dtype=np.float64, shape=shape)
+
+
+def add_blocks(first: np.ndarray, second: np.ndarray, out: np.ndarray, block_bytes: int = BLOCK_BYTES) -> None:
+    check_same_shape(first, second, 'm')
+    __elementwise_blocks(np.add, first, second, out, block_bytes)
+
+
+def subtract_blocks(first: np.ndarray, second: np.ndarray, out: np.ndarray, block_bytes: int = BLOCK_BYTES) -> None:
+    check_same_shape(first, second, 'm')
+    __elementwise_blocks(np.subtract, first, second, out, block_bytes)
+
+
+def multiply_blocks(first: np.ndarray, second: np.ndarray, out: np.ndarray, block_bytes: int = BLOCK_BYTES) -> None:
+    """Произведение по квадратным блокам: блок результата накапливается из
+    произведений блоков строки первой матрицы и столбца второй"""
+    if first.shape[1] != second.shape[0]:
+        raise ValueError(NOT_MULTIPLIABLE_MSG)
+    size = __tile_size(block_bytes)
+    for i in range(0, first.shape[0], size):
+        for j in range(0, second.shape[1], size):
+            accumulator = np.zeros(out[i:i + size, j:j + size].shape)
+            for k in range(0, first.shape[1], size):
+                accumulator += __read_block(first[i:i + size, k:k + size], 'n') @ \
+                    __read_block(second[k:k + size, j:j + size], 'm')
+            out[i:i + size, j:j + size] = accumulator
+    __flush(out)
+
+
+def transpose_blocks(matrix: np.ndarray, out: np.ndarray, block_bytes: int = BLOCK_BYTES) -> None:
+    # квадратные блоки, чтобы и чтение, и запись шли по строкам длиной в блок
+    size = __tile_size(block_bytes)
+    for i in range(0, matrix.shape[0], size):
+        for j in range(0, matrix.shape[1], size):
+            out[j:j + size, i:i + size] = __read_block(matrix[i:i + size, j:j + size], 'n').T
+    __flush(out)
+
+
+def __elementwise_blocks(operation: np.ufunc, first: np.ndarray, second: np.ndarray, out: np.ndarray,
+                         block_bytes: int) -> None:
+    rows = max(1, block_bytes // (out.itemsize * out.shape[1]))
+    for start in range(0, out.shape[0], rows):
+        operation(__read_block(first[start:start + rows], 'n'), __read_block(second[start:start + rows], 'm'),
+                  out=out[start:start + rows])
+    __flush(out)
+
+
+def __read_block(block: np.ndarray, name: str) -> np.ndarray:
+    # блок читается с диска один раз и проверяется на пропущенные значения
+    block = np.array(block, dtype=np.float64)
+    if np.isnan(block).any():
+        raise ValueError(f'{MISSING_VALUE_MSG} {name}')
+    return block
+
+
+def __flush(out: np.ndarray) -> None:
+    # результат в файле записывается на диск до ответа со ссылкой на него
+    if isinstance(out, np.memmap):
+        out.flush()
+
+
+def __tile_size(block_bytes: int) -> int:
+    return max(1, math.isqrt(block_bytes // np.dtype(np.float64).itemsize))
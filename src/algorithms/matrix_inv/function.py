@@ -0,0 +1,11 @@
+from src.algorithms.matrix_engine import to_array, to_list, inverse
+
+
+def main(n: list[list[float]]) -> dict[str, list[list[float]]]:
+    return {'result': to_list(inverse(to_array(n, 'n')))}
+
+
+if __name__ == '__main__':
+    n = [[2., 1.],
+         [7., 4.]]
+    print(main(n))
@@ -0,0 +1,21 @@
+import unittest
+
+import numpy as np
+
+from src.algorithms.matrix_inv.function import main
+
+
+class TestCase(unittest.TestCase):
+
+    def test_inv(self):
+        self.assertTrue(np.allclose(main([[2., 1.], [7., 4.]])['result'], [[4., -1.], [-7., 2.]]))
+
+    def test_singular(self):
+        self.assertRaisesRegex(ValueError, 'Матрица вырождена', main, [[1., 2.], [2., 4.]])
+
+    def test_not_square(self):
+        self.assertRaisesRegex(ValueError, 'Матрица не квадратная', main, [[1., 2.]])
+
+
+if __name__ == '__main__':
+    unittest.main()
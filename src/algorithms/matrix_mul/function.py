@@ -0,0 +1,27 @@
+from src.algorithms.matrix_engine import to_array, to_list, multiply, \
+    open_matrix, create_matrix, multiply_blocks, NOT_MULTIPLIABLE_MSG
+
+
+def main(n: list[list[float]], m: list[list[float]]) -> \
+        dict[str, list[list[float]]]:
+    return {'result': to_list(multiply(to_array(n, 'n'), to_array(m, 'm')))}
+
+
+def main_file(n: str, m: str, result: str) -> dict[str, list[int]]:
+    """Произведение матриц из файлов .npy n и m по квадратным блокам с
+    записью в файл result"""
+    first, second = open_matrix(n, 'n'), open_matrix(m, 'm')
+    if first.shape[1] != second.shape[0]:
+        raise ValueError(NOT_MULTIPLIABLE_MSG)
+    shape = (first.shape[0], second.shape[1])
+    multiply_blocks(first, second, create_matrix(result, shape))
+    return {'shape': list(shape)}
+
+
+if __name__ == '__main__':
+    n = [[1., 2., 3.],
+         [2., 3., 4.]]
+    m = [[0., 2.],
+         [2., 1.],
+         [1., 0.]]
+    print(main(n, m))
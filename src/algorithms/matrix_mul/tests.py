@@ -0,0 +1,50 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.algorithms.matrix_engine import multiply_blocks
+from src.algorithms.matrix_mul.function import main, main_file
+
+
+class TestCase(unittest.TestCase):
+
+    def test_mul(self):
+        n = [[1., 2., 3.],
+             [2., 3., 4.]]
+        m = [[0., 2.],
+             [2., 1.],
+             [1., 0.]]
+        self.assertEqual(main(n, m), {'result': [[7.0, 4.0],
+                                                 [10.0, 7.0]]})
+
+    def test_shapes(self):
+        self.assertRaisesRegex(ValueError, 'Количество столбцов первой матрицы',
+                               main, [[1., 2.]], [[1., 2.]])
+
+    def test_large(self):
+        random = np.random.default_rng(0)
+        n, m = random.random((300, 200)), random.random((200, 100))
+        self.assertTrue(np.allclose(n @ m, main(n.tolist(), m.tolist())['result']))
+
+    def test_blocks(self):
+        random = np.random.default_rng(1)
+        n, m = random.random((37, 23)), random.random((23, 11))
+        out = np.empty((37, 11))
+        # блоки 5x5 не делят размеры матриц нацело
+        multiply_blocks(n, m, out, block_bytes=200)
+        self.assertTrue(np.allclose(n @ m, out))
+
+    def test_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            n, m, result = (os.path.join(directory, name + '.npy') for name in ('n', 'm', 'result'))
+            np.save(n, np.array([[1., 2., 3.], [2., 3., 4.]]))
+            np.save(m, np.array([[0, 2], [2, 1], [1, 0]], dtype=np.int32))
+            self.assertEqual({'shape': [2, 2]}, main_file(n, m, result))
+            self.assertEqual([[7., 4.], [10., 7.]], np.load(result).tolist())
+            self.assertRaisesRegex(ValueError, 'Количество столбцов первой матрицы', main_file, n, n, result)
+
+
+if __name__ == '__main__':
+    unittest.main()
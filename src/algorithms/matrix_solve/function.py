@@ -0,0 +1,13 @@
+from src.algorithms.matrix_engine import to_array, to_vector, to_list, solve
+
+
+def main(n: list[list[float]], b: list[float]) -> dict[str, list[float]]:
+    """Решение системы линейных уравнений n x = b"""
+    return {'result': to_list(solve(to_array(n, 'n'), to_vector(b, 'b')))}
+
+
+if __name__ == '__main__':
+    n = [[2., 1.],
+         [7., 4.]]
+    b = [3., 11.]
+    print(main(n, b))
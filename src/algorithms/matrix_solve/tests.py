@@ -0,0 +1,24 @@
+import unittest
+
+import numpy as np
+
+from src.algorithms.matrix_solve.function import main
+
+
+class TestCase(unittest.TestCase):
+
+    def test_solve(self):
+        self.assertTrue(np.allclose(main([[2., 1.], [7., 4.]], [3., 11.])['result'], [1., 1.]))
+
+    def test_lengths(self):
+        self.assertRaisesRegex(ValueError, 'Длины матриц не совпадают!', main, [[2., 1.], [7., 4.]], [3.])
+
+    def test_singular(self):
+        self.assertRaisesRegex(ValueError, 'Матрица вырождена', main, [[1., 2.], [2., 4.]], [1., 2.])
+
+    def test_row(self):
+        self.assertRaisesRegex(ValueError, 'Не введено значение в матрице b', main, [[2., 1.], [7., 4.]], [3., None])
+
+
+if __name__ == '__main__':
+    unittest.main()
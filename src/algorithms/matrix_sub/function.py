@@ -1,31 +1,19 @@
-import copy
-
-
-def __sub(n: list[list[float]], m: list[list[float]]) -> list[list[float]]:
-    res: list[list[float]] = copy.deepcopy(n)
-    for i in range(len(res)):
-        for j in range(len(res[0])):
-            res[i][j] = res[i][j] - m[i][j]
-    return res
-
-
-def __check_matrix(matrix: list[list[float]], name: str, row_len: int) -> None:
-    for row in matrix:
-        if row_len != len(row):
-            raise ValueError(f'Введено неверное количество столбцов для {name}')
-        for item in row:
-            if item is None:
-                raise ValueError(f'Не введено значение в матрице {name}')
+from src.algorithms.matrix_engine import to_array, to_list, subtract, \
+    open_matrix, create_matrix, subtract_blocks, check_same_shape
 
 
 def main(n: list[list[float]], m: list[list[float]]) -> \
         dict[str, list[list[float]]]:
-    if len(n) != len(m):
-        raise ValueError('Длины матриц не совпадают!')
-    dl_row = len(n[0])
-    __check_matrix(n, 'n', dl_row)
-    __check_matrix(m, 'm', dl_row)
-    return {'result': __sub(n, m)}
+    return {'result': to_list(subtract(to_array(n, 'n'), to_array(m, 'm')))}
+
+
+def main_file(n: str, m: str, result: str) -> dict[str, list[int]]:
+    """Разность матриц из файлов .npy n и m, вычисляемая по блокам строк.
+    Результат записывается в файл result, возвращается его размер"""
+    first, second = open_matrix(n, 'n'), open_matrix(m, 'm')
+    check_same_shape(first, second, 'm')
+    subtract_blocks(first, second, create_matrix(result, first.shape))
+    return {'shape': list(first.shape)}
 
 
 if __name__ == '__main__':
@@ -33,4 +21,4 @@ if __name__ == '__main__':
          [2., 3., 4.]]
     m = [[0., 2., 2.],
          [2., 1., 4.]]
-    print(__sub(n, m))
+    print(main(n, m))
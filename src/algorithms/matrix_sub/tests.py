@@ -1,7 +1,11 @@
+import os
+import tempfile
 import unittest
 
+import numpy as np
 
-from src.algorithms.matrix_sub.function import main
+from src.algorithms.matrix_engine import subtract_blocks
+from src.algorithms.matrix_sub.function import main, main_file
 
 
 class TestCase(unittest.TestCase):
@@ -40,6 +44,26 @@ class TestCase(unittest.TestCase):
         self.assertEqual(main(n, m), {'result': [[0.0, 0.0, 0.0],
                                                  [0.0, 0.0, 0.0]]})
 
+    def test_blocks(self):
+        n = np.arange(10 * 3, dtype=float).reshape(10, 3)
+        out = np.empty((10, 3))
+        # по одной строке на блок
+        subtract_blocks(n, np.ones((10, 3)), out, block_bytes=24)
+        self.assertTrue(np.array_equal(n - 1, out))
+        n[7, 1] = np.nan
+        self.assertRaisesRegex(ValueError, 'Не введено значение в матрице n',
+                               subtract_blocks, n, np.ones((10, 3)), out, 24)
+
+    def test_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            n, m, result = (os.path.join(directory, name + '.npy') for name in ('n', 'm', 'result'))
+            np.save(n, np.array([[1., 2., 3.], [2., 3., 4.]]))
+            np.save(m, np.array([[0., 2., 2.], [2., 1., 4.]], dtype=np.float32))
+            self.assertEqual({'shape': [2, 3]}, main_file(n, m, result))
+            self.assertEqual([[1., 0., 1.], [0., 2., 0.]], np.load(result).tolist())
+            np.save(m, np.zeros((3, 3)))
+            self.assertRaisesRegex(ValueError, 'Длины матриц не совпадают!', main_file, n, m, result)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,21 @@
+from src.algorithms.matrix_engine import to_array, to_list, transpose, \
+    open_matrix, create_matrix, transpose_blocks
+
+
+def main(n: list[list[float]]) -> dict[str, list[list[float]]]:
+    return {'result': to_list(transpose(to_array(n, 'n')))}
+
+
+def main_file(n: str, result: str) -> dict[str, list[int]]:
+    """Транспонирование матрицы из файла .npy n по блокам, результат
+    записывается в файл result"""
+    matrix = open_matrix(n, 'n')
+    shape = (matrix.shape[1], matrix.shape[0])
+    transpose_blocks(matrix, create_matrix(result, shape))
+    return {'shape': list(shape)}
+
+
+if __name__ == '__main__':
+    n = [[1., 2., 3.],
+         [2., 3., 4.]]
+    print(main(n))
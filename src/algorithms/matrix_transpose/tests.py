@@ -0,0 +1,43 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.algorithms.matrix_engine import transpose_blocks
+from src.algorithms.matrix_transpose.function import main, main_file
+
+
+class TestCase(unittest.TestCase):
+
+    def test_transpose(self):
+        n = [[1., 2., 3.],
+             [2., 3., 4.]]
+        self.assertEqual(main(n), {'result': [[1.0, 2.0],
+                                              [2.0, 3.0],
+                                              [3.0, 4.0]]})
+
+    def test_empty(self):
+        self.assertRaisesRegex(ValueError, 'Не введены значения матрицы', main, [])
+
+    def test_row(self):
+        self.assertRaisesRegex(ValueError, 'Не введено значение в матрице n', main, [[None, 1.0]])
+
+    def test_blocks(self):
+        n = np.arange(7 * 13, dtype=float).reshape(7, 13)
+        out = np.empty((13, 7))
+        transpose_blocks(n, out, block_bytes=72)
+        self.assertTrue(np.array_equal(n.T, out))
+
+    def test_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            n, result = os.path.join(directory, 'n.npy'), os.path.join(directory, 'result.npy')
+            np.save(n, np.array([[1., 2., 3.], [2., 3., 4.]]))
+            self.assertEqual({'shape': [3, 2]}, main_file(n, result))
+            self.assertEqual([[1., 2.], [2., 3.], [3., 4.]], np.load(result).tolist())
+            np.save(n, np.array(['a', 'b']))
+            self.assertRaisesRegex(ValueError, 'Файл не содержит числовую матрицу n', main_file, n, result)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,37 +1,165 @@
-from typing import Any
+from math import isqrt
+from typing import Any, Optional
+
+import numpy as np
+
+from src.algorithms.perfect_numbers.primality import is_probable_prime
 
 
 HAS_PERFECT = 'has_perfect'
 PERFECT_NUMBERS = 'perfect_numbers'
+ABUNDANT_COUNT = 'abundant_count'
+DEFICIENT_COUNT = 'deficient_count'
+
+EMPTY_LIST_MSG = 'Список чисел пуст'
+RANGE_INCOMPLETE_MSG = 'Должны быть заданы обе границы диапазона'
+RANGE_INVALID_MSG = 'Границы диапазона должны удовлетворять условию 0 <= lo <= hi'
+RANGE_TOO_LARGE_MSG = 'Диапазон слишком велик'
+NUMBER_TOO_LARGE_MSG = 'Список чисел содержит слишком большое значение'
+
+MAX_NUMBER_BITS = 4096
+"""Наибольшая длина проверяемого числа в битах. Все такие числа меньше
+ODD_PERFECT_LOWER_BOUND, а тест Миллера-Рабина для чётных кандидатов
+занимает доли секунды"""
+
+MAX_RANGE_SIZE = 10_000_000
+"""Наибольшее количество чисел в диапазоне"""
+
+MAX_RANGE_HI = 10 ** 11
+"""Наибольшая верхняя граница диапазона"""
+
+SIEVE_SEGMENT_SIZE = 1 << 18
+"""Количество чисел, суммы делителей которых вычисляются за один проход решета"""
+
+SIEVE_SMALL_DIVISORS = 256
+"""Делители меньше этого значения обрабатываются срезами массива с шагом d,
+остальные - одной группировкой всех кратных через bincount"""
+
+MERSENNE_EXPONENTS_64 = (2, 3, 5, 7, 13, 17, 19, 31)
+"""Показатели p простых чисел Мерсенна 2^p - 1, для которых 2^(p-1)(2^p - 1) < 2^64"""
+
+UINT64_LIMIT = 2 ** 64
+
+KNOWN_PERFECT_NUMBERS = frozenset(2 ** (p - 1) * (2 ** p - 1) for p in MERSENNE_EXPONENTS_64)
+"""Все совершенные числа, меньшие 2^64. Чётные совершенные числа по теореме
+Евклида-Эйлера имеют вид 2^(p-1)(2^p - 1) с простым 2^p - 1, а нечётных
+совершенных чисел, меньших 10^1500, не существует"""
+
+ODD_PERFECT_LOWER_BOUND = 10 ** 1500
+"""Нижняя граница для нечётных совершенных чисел (Ochem, Rao, 2012)"""
+
+
+def divisor_sums(start: int, end: int) -> np.ndarray:
+    """Суммы собственных делителей чисел start <= n < end (start >= 1).
+
+    Сегмент решета: каждый делитель d <= √(end - 1) добавляется к кратным
+    ему числам m >= d² вместе с парным делителем m // d.
+    """
+    length = end - start
+    sums = np.zeros(length, dtype=np.int64)
+    root = isqrt(end - 1)
+    for d in range(1, min(root, SIEVE_SMALL_DIVISORS - 1) + 1):
+        first = max(d * d, -(-start // d) * d)
+        if first >= end:
+            continue
+        multiples = sums[first - start::d]
+        multiples += d
+        multiples += np.arange(first // d, first // d + len(multiples), dtype=np.int64)
+        if first == d * d:
+            # Для квадрата d² парный делитель совпадает с d
+            sums[first - start] -= d
+    if root >= SIEVE_SMALL_DIVISORS:
+        d = np.arange(SIEVE_SMALL_DIVISORS, root + 1, dtype=np.int64)
+        first = np.maximum(d * d, (start + d - 1) // d * d)
+        counts = np.where(first < end, (end - 1 - first) // d + 1, 0)
+        divisors = np.repeat(d, counts)
+        steps = np.arange(len(divisors), dtype=np.int64) - np.repeat(np.cumsum(counts) - counts, counts)
+        multiples = np.repeat(first, counts) + steps * divisors
+        pairs = multiples // divisors
+        weights = divisors + np.where(pairs != divisors, pairs, 0)
+        # Суммы меньше 2^53 точно представимы в float64
+        sums += np.rint(np.bincount(multiples - start, weights=weights, minlength=length)).astype(np.int64)
+    return sums - np.arange(start, end, dtype=np.int64)
+
+
+def __check_range_raises_ex(lo: Optional[int], hi: Optional[int]) -> None:
+    if lo is None or hi is None:
+        raise ValueError(RANGE_INCOMPLETE_MSG)
+    if lo < 0 or lo > hi:
+        raise ValueError(RANGE_INVALID_MSG)
+    if hi > MAX_RANGE_HI or hi - lo + 1 > MAX_RANGE_SIZE:
+        raise ValueError(RANGE_TOO_LARGE_MSG)
+
+
+def classify_range(lo: int, hi: int) -> tuple[list[int], int, int]:
+    """Совершенные числа отрезка [lo, hi], а также количество избыточных и
+    недостаточных чисел в нём. Ноль не относится ни к одной из групп"""
+    __check_range_raises_ex(lo, hi)
+    perfect_numbers, abundant, deficient = [], 0, 0
+    for start in range(max(lo, 1), hi + 1, SIEVE_SEGMENT_SIZE):
+        end = min(start + SIEVE_SEGMENT_SIZE, hi + 1)
+        difference = divisor_sums(start, end) - np.arange(start, end, dtype=np.int64)
+        perfect_numbers.extend((start + np.flatnonzero(difference == 0)).tolist())
+        abundant += int(np.count_nonzero(difference > 0))
+        deficient += int(np.count_nonzero(difference < 0))
+    return perfect_numbers, abundant, deficient
 
 
 def __is_perfect(number: int) -> bool:
-    if number in [0, 1]:
-        return False
-    factors = []
-    for i in range(1, number - 1):
-        if number % i == 0:
-            factors.append(i)
-    return sum(factors) == number
+    if number < UINT64_LIMIT:
+        return number in KNOWN_PERFECT_NUMBERS
+    if number % 2 == 0:
+        # n = 2^k * m с нечётным m совершенно, только если m = 2^(k+1) - 1 и m простое
+        k = (number & -number).bit_length() - 1
+        odd_part = number >> k
+        return odd_part == 2 ** (k + 1) - 1 and is_probable_prime(odd_part)
+    # MAX_NUMBER_BITS не пропускает нечётные числа от ODD_PERFECT_LOWER_BOUND
+    return False
 
 
 def __check_numbers_raises_ex(numbers: list[int]) -> None:
     if type(numbers) != list:
         raise TypeError('Параметр не является списком')
     if len(numbers) == 0:
-        raise ValueError('Список чисел пуст')
+        raise ValueError(EMPTY_LIST_MSG)
     for val in numbers:
         if type(val) != int:
             raise ValueError('Список чисел содержит нечисловое значение')
         if val < 0:
             raise ValueError('Список чисел содержит отрицательное значение')
+        if val.bit_length() > MAX_NUMBER_BITS:
+            raise ValueError(NUMBER_TOO_LARGE_MSG)
+
 
+def main(numbers: Optional[list[int]] = None, lo: Optional[int] = None, hi: Optional[int] = None,
+         classify: bool = False) -> dict[str, Any]:
+    """Проверяет список чисел и/или отрезок [lo, hi]. Совершенные числа
+    списка идут в ответе перед совершенными числами отрезка; с classify
+    для отрезка дополнительно возвращается число избыточных и
+    недостаточных чисел.
 
-def main(numbers: list[int]) -> dict[str, Any]:
-    __check_numbers_raises_ex(numbers)
-    perfect_numbers = list(filter(__is_perfect, numbers))
-    return {HAS_PERFECT: len(perfect_numbers) > 0,
-            PERFECT_NUMBERS: perfect_numbers}
+    Делители чисел списка не перебираются: число меньше 2^64 ищется в
+    таблице KNOWN_PERFECT_NUMBERS, а большее чётное число 2^k·m проверяется
+    по теореме Евклида-Эйлера - m = 2^(k+1) - 1 и m простое. Нечётные числа
+    длиной до MAX_NUMBER_BITS меньше ODD_PERFECT_LOWER_BOUND и совершенными
+    не являются. Суммы делителей вычисляет только решето отрезка"""
+    if lo is None and hi is None:
+        __check_numbers_raises_ex(numbers)
+        perfect_numbers = list(filter(__is_perfect, numbers))
+        return {HAS_PERFECT: len(perfect_numbers) > 0,
+                PERFECT_NUMBERS: perfect_numbers}
+    perfect_numbers = []
+    if numbers:
+        __check_numbers_raises_ex(numbers)
+        perfect_numbers = list(filter(__is_perfect, numbers))
+    range_perfect, abundant, deficient = classify_range(lo, hi)
+    perfect_numbers.extend(range_perfect)
+    result = {HAS_PERFECT: len(perfect_numbers) > 0,
+              PERFECT_NUMBERS: perfect_numbers}
+    if classify:
+        result[ABUNDANT_COUNT] = abundant
+        result[DEFICIENT_COUNT] = deficient
+    return result
 
 
 if __name__ == '__main__':
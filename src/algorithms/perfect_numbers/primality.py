@@ -0,0 +1,38 @@
+"""Проверка простоты больших целых чисел тестом Миллера-Рабина.
+
+Используется для чётных кандидатов в совершенные числа: по теореме
+Евклида-Эйлера число 2^k·m с нечётным m совершенно, только если
+m = 2^(k+1) - 1 и m простое, поэтому раскладывать число на множители
+не требуется.
+"""
+from math import isqrt
+
+SMALL_PRIMES = tuple(p for p in range(2, 1000) if all(p % q for q in range(2, isqrt(p) + 1)))
+"""Простые числа, на которые число сначала делится перебором"""
+
+MILLER_RABIN_BASES = SMALL_PRIMES[:13]
+"""Основания теста Миллера-Рабина. Для чисел меньше 3.3 * 10^24 набор
+оснований 2..41 даёт детерминированный ответ, для больших чисел вероятность
+ошибки не превышает 4^-13"""
+
+
+def is_probable_prime(number: int) -> bool:
+    if number < 2:
+        return False
+    for p in SMALL_PRIMES:
+        if number % p == 0:
+            return number == p
+    d, s = number - 1, 0
+    while d % 2 == 0:
+        d, s = d // 2, s + 1
+    for a in MILLER_RABIN_BASES:
+        x = pow(a, d, number)
+        if x == 1 or x == number - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % number
+            if x == number - 1:
+                break
+        else:
+            return False
+    return True
@@ -1,8 +1,20 @@
 import unittest
 
 
+from math import isqrt
+
 from src.algorithms.perfect_numbers.function import main, HAS_PERFECT,\
-    PERFECT_NUMBERS
+    PERFECT_NUMBERS, ABUNDANT_COUNT, DEFICIENT_COUNT, KNOWN_PERFECT_NUMBERS,\
+    MAX_RANGE_SIZE, MAX_RANGE_HI, MAX_NUMBER_BITS, divisor_sums
+from src.algorithms.perfect_numbers.primality import is_probable_prime
+
+
+def divisor_sum(number):
+    # сумма собственных делителей перебором до √n
+    if number < 2:
+        return 0
+    pairs = [(i, number // i) for i in range(2, isqrt(number) + 1) if number % i == 0]
+    return 1 + sum(i if i == pair else i + pair for i, pair in pairs)
 
 
 class TestCase(unittest.TestCase):
@@ -49,6 +61,80 @@ class TestCase(unittest.TestCase):
                           PERFECT_NUMBERS: [6, 28, 496, 8128]},
                          main([6, 0, 10, 28, 100, 496, 532, 8128]))
 
+    def test_known_match_divisor_sum(self):
+        for number in range(20000):
+            self.assertEqual(number in KNOWN_PERFECT_NUMBERS,
+                             number > 1 and divisor_sum(number) == number)
+
+    def test_large_64_bit(self):
+        numbers = [2305843008139952128, 2305843008139952127,
+                   137438691328, 2 ** 64 - 1, 33550336, 999999937]
+        self.assertEqual({HAS_PERFECT: True,
+                          PERFECT_NUMBERS: [2305843008139952128,
+                                            137438691328, 33550336]},
+                         main(numbers))
+
+    def test_divisor_sums_segments(self):
+        for start, end in [(1, 3000), (1, 2), (65000, 70000)]:
+            self.assertEqual([divisor_sum(n) for n in range(start, end)],
+                             divisor_sums(start, end).tolist())
+
+    def test_range(self):
+        self.assertEqual({HAS_PERFECT: True,
+                          PERFECT_NUMBERS: [6, 28, 496, 8128]},
+                         main(lo=0, hi=10000))
+
+    def test_range_without_perfect(self):
+        self.assertEqual({HAS_PERFECT: False, PERFECT_NUMBERS: []},
+                         main(lo=29, hi=495))
+
+    def test_range_classify(self):
+        sums = [divisor_sum(n) for n in range(1, 1001)]
+        self.assertEqual({HAS_PERFECT: True, PERFECT_NUMBERS: [6, 28, 496],
+                          ABUNDANT_COUNT: sum(s > n for n, s in enumerate(sums, 1)),
+                          DEFICIENT_COUNT: sum(s < n for n, s in enumerate(sums, 1))},
+                         main(lo=0, hi=1000, classify=True))
+
+    def test_range_with_numbers(self):
+        self.assertEqual({HAS_PERFECT: True, PERFECT_NUMBERS: [8128, 28]},
+                         main([8128, 10], lo=20, hi=30))
+
+    def test_range_incomplete(self):
+        self.assertRaisesRegex(ValueError, 'Должны быть заданы обе границы',
+                               main, lo=1)
+
+    def test_range_invalid(self):
+        self.assertRaisesRegex(ValueError, 'Границы диапазона', main, lo=10, hi=9)
+        self.assertRaisesRegex(ValueError, 'Границы диапазона', main, lo=-1, hi=9)
+
+    def test_range_too_large(self):
+        self.assertRaisesRegex(ValueError, 'Диапазон слишком велик',
+                               main, lo=0, hi=MAX_RANGE_SIZE)
+        self.assertRaisesRegex(ValueError, 'Диапазон слишком велик',
+                               main, lo=MAX_RANGE_HI, hi=MAX_RANGE_HI + 1)
+
+    def test_is_probable_prime(self):
+        primes = [n for n in range(2000)
+                  if n > 1 and all(n % i for i in range(2, n))]
+        self.assertEqual(primes, [n for n in range(2000) if is_probable_prime(n)])
+        self.assertTrue(is_probable_prime(2 ** 127 - 1))
+        # Сильное псевдопростое число по основаниям 2..37
+        self.assertFalse(is_probable_prime(318665857834031151167461))
+
+    def test_huge(self):
+        perfect = [2 ** 88 * (2 ** 89 - 1), 2 ** 126 * (2 ** 127 - 1)]
+        numbers = perfect + [2 ** 88 * (2 ** 89 - 3), 2 ** 126 * (2 ** 127 - 1) + 2,
+                             3 ** 2000, 10 ** 30 + 57]
+        self.assertEqual({HAS_PERFECT: True, PERFECT_NUMBERS: perfect},
+                         main(numbers))
+
+    def test_number_too_large(self):
+        self.assertRaisesRegex(ValueError, 'слишком большое значение',
+                               main, [6, 1 << MAX_NUMBER_BITS])
+        perfect = 2 ** 1278 * (2 ** 1279 - 1)
+        self.assertEqual({HAS_PERFECT: False, PERFECT_NUMBERS: []},
+                         main([perfect + 2, (1 << MAX_NUMBER_BITS) - 1]))
+        self.assertEqual({HAS_PERFECT: True, PERFECT_NUMBERS: [perfect]}, main([perfect]))
 
 if __name__ == '__main__':
     unittest.main()
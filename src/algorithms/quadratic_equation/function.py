@@ -1,33 +1,88 @@
 from math import sqrt
+from typing import Any, Union
+
+import numpy as np
+
+NO_ROOTS_MSG = 'Действительных корней нет, т. к. D < 0'
+ONE_ROOT_TEMPL = 'Корень только один: x = {0}'
+TWO_ROOTS_TEMPL = 'x1 = {0}, x2 = {1}'
+NON_NUMBER_COEFFICIENTS_MSG = 'Коэффициенты должны быть числами'
+ZERO_A_COEFFICIENT_MSG = 'Коэффициент при х^2 в квадратном уравнении не может быть равен 0!'
+OVERFLOW_ERRNO = 34
+OVERFLOW_MSG = 'Numerical result out of range'
+
+
+def __one_root(x: float, b: float, c: float) -> str:
+    if b == 0 and c == 0:
+        x = abs(x)
+    return ONE_ROOT_TEMPL.format(x)
+
+
+def __two_roots(x1: float, x2: float) -> str:
+    return TWO_ROOTS_TEMPL.format(round(x1, 8), round(x2, 8))
 
 
 def quadratic_equation(a: float, b: float, c: float) -> str:
     if not (isinstance(a, (int, float)) and
             isinstance(b, (int, float)) and isinstance(c, (int, float))):
-        raise TypeError('Коэффициенты должны быть числами')
+        raise TypeError(NON_NUMBER_COEFFICIENTS_MSG)
     elif a == 0:
-        raise ValueError('Коэффициент при х^2 в квадратном уравнении '
-                         'не может быть равен 0!')
+        raise ValueError(ZERO_A_COEFFICIENT_MSG)
     else:
         discriminant = b ** 2 - 4 * a * c
         if discriminant < 0:
-            return 'Действительных корней нет, т. к. D < 0'
+            return NO_ROOTS_MSG
         elif discriminant == 0:
-            x = -b / (2 * a)
-            if b == 0 and c == 0:
-                x = abs(x)
-            return 'Корень только один: x = ' + str(x)
+            return __one_root(-b / (2 * a), b, c)
         else:
             x1 = (-b + sqrt(discriminant)) / (2 * a)
             x2 = (-b - sqrt(discriminant)) / (2 * a)
-            return 'x1 = ' + (str(round(x1, 8))) \
-                   + ',' + ' x2 = ' + str((round(x2, 8)))
+            return __two_roots(x1, x2)
 
 
 def main(a: float, b: float, c: float):
     return {'roots': quadratic_equation(a, b, c)}
 
 
+def main_batch(parameters: list[dict[str, Any]]) -> list[Union[dict[str, str], Exception]]:
+    """Решает набор уравнений одним векторным проходом NumPy.
+
+    Для каждого набора коэффициентов возвращается тот же результат, что и
+    у main, либо исключение, которое main возбудила бы для этого набора.
+    """
+    results: list[Union[dict[str, str], Exception]] = [TypeError(NON_NUMBER_COEFFICIENTS_MSG)] * len(parameters)
+    valid = [i for i, params in enumerate(parameters)
+             if all(isinstance(params[name], (int, float)) for name in ('a', 'b', 'c'))]
+    if not valid:
+        return results
+    a = np.array([parameters[i]['a'] for i in valid], dtype=np.float64)
+    b = np.array([parameters[i]['b'] for i in valid], dtype=np.float64)
+    c = np.array([parameters[i]['c'] for i in valid], dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        # в main b ** 2 над float возбуждает OverflowError, а остальные операции дают inf
+        squares = b ** 2
+        discriminant = squares - 4 * a * c
+        sqrt_discriminant = np.sqrt(np.where(discriminant > 0, discriminant, 0.))
+        x0 = -b / (2 * a)
+        x1 = (-b + sqrt_discriminant) / (2 * a)
+        x2 = (-b - sqrt_discriminant) / (2 * a)
+    overflow = np.isinf(squares) & np.isfinite(b)
+    rows = zip(valid, a.tolist(), b.tolist(), c.tolist(), discriminant.tolist(),
+               x0.tolist(), x1.tolist(), x2.tolist(), overflow.tolist())
+    for i, a_i, b_i, c_i, discriminant_i, x0_i, x1_i, x2_i, overflow_i in rows:
+        if a_i == 0:
+            results[i] = ValueError(ZERO_A_COEFFICIENT_MSG)
+        elif overflow_i:
+            results[i] = OverflowError(OVERFLOW_ERRNO, OVERFLOW_MSG)
+        elif discriminant_i < 0:
+            results[i] = {'roots': NO_ROOTS_MSG}
+        elif discriminant_i == 0:
+            results[i] = {'roots': __one_root(x0_i, b_i, c_i)}
+        else:
+            results[i] = {'roots': __two_roots(x1_i, x2_i)}
+    return results
+
+
 if __name__ == '__main__':
     a = 1.0
     b = 0.0
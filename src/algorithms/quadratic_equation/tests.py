@@ -1,7 +1,9 @@
 import unittest
+import warnings
 
 
-from src.algorithms.quadratic_equation.function import quadratic_equation
+from src.algorithms.quadratic_equation.function import quadratic_equation, \
+    main, main_batch
 
 
 class TestCase(unittest.TestCase):
@@ -35,6 +37,35 @@ class TestCase(unittest.TestCase):
         self.assertEqual(quadratic_equation(1/3, 5/7, -3),
                          'x1 = 2.11415759, x2 = -4.25701473')
 
+    def test_batch_matches_main(self):
+        coefficients = [(1/3, 0, -3), (3.2, 6.5, 0), (1, 2, 3), (1, 10, 25),
+                        (1/3, 5/7, -3), (1, 0, 0), (-2.5, 1.75, 9.125)]
+        parameters = [{'a': a, 'b': b, 'c': c} for a, b, c in coefficients]
+        self.assertEqual([main(a, b, c) for a, b, c in coefficients],
+                         main_batch(parameters))
+
+    def test_batch_errors(self):
+        results = main_batch([{'a': 0, 'b': 1, 'c': 1},
+                              {'a': 'one', 'b': 1, 'c': 1},
+                              {'a': 1, 'b': 10, 'c': 25}])
+        self.assertIsInstance(results[0], ValueError)
+        self.assertIsInstance(results[1], TypeError)
+        self.assertEqual({'roots': 'Корень только один: x = -5.0'}, results[2])
+
+    def test_batch_overflow_matches_main(self):
+        coefficients = [(1, 1e200, 1), (1e-300, 1e10, 0), (1e300, 1e150, -1e300), (1, 1e154, 1e300), (1, 2, 1)]
+        expected = []
+        for a, b, c in coefficients:
+            try:
+                expected.append(main(a, b, c))
+            except OverflowError as e:
+                expected.append((type(e), str(e)))
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            results = main_batch([{'a': a, 'b': b, 'c': c} for a, b, c in coefficients])
+        self.assertEqual(expected, [(type(result), str(result)) if isinstance(result, Exception) else result
+                                    for result in results])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,200 @@
+"""Сравнение векторизованного симплекс-метода с прежней реализацией на циклах,
+правил выбора ведущего столбца между собой, модифицированного симплекс-метода
+на разреженных задачах с табличным и решения с предварительным упрощением
+задачи (presolve) и без него.
+
+Запуск: python -m src.algorithms.simplex_method.benchmark [размеры ...]
+Размер задаётся как MxN - число ограничений и переменных задачи
+max c·x при Ax <= b, x >= 0 со случайными положительными A, b и c.
+"""
+import sys
+import time
+
+import numpy as np
+
+from src.algorithms.simplex_method.function import SimplexModel, PIVOT_RULES, DANTZIG
+from src.algorithms.simplex_method.presolve import Presolve
+from src.algorithms.simplex_method.revised import RevisedSimplexModel, SparseMatrix
+
+DEFAULT_SIZES = ('25x50', '50x100', '100x200', '200x400')
+
+SPARSE_SIZES = ('200x1000', '500x2500')
+"""Размеры разреженных задач, решаемых только модифицированным методом"""
+
+SPARSE_ROW_ENTRIES = 3
+"""Среднее количество ненулевых элементов в столбце разреженной задачи"""
+
+
+class LoopSimplexModel(SimplexModel):
+    """Прежняя реализация: поэлементные циклы Python по таблице"""
+
+    def pivot_operation(self, t, h):
+        tableau = self.tableau
+        m, n = tableau.shape
+        pivot = tableau[t][h]
+        for i in range(n):
+            tableau[t][i] /= pivot
+        for i in range(m):
+            if i != t and tableau[i][h] != 0:
+                save = tableau[i][h]
+                for j in range(n):
+                    tableau[i][j] -= save * tableau[t][j]
+
+    def primal_simplex_method(self):
+        tableau, beta = self.tableau, self.basic_var
+        m, n = tableau.shape
+        while True:
+            costs = [tableau[0][c] for c in range(1, n)]
+            if all(c >= 0 for c in costs):
+                break
+            h = next(i for i, c in enumerate(tableau[0]) if i != 0 and c < 0)
+            if all(tableau[i, h] < 0 for i in range(m)):
+                self.unbounded = True
+                return
+            min_ratio, t = 100000, 1
+            for i in range(1, m):
+                if tableau[i][h] > 0 and tableau[i][0] / tableau[i][h] < min_ratio:
+                    min_ratio, t = tableau[i][0] / tableau[i][h], i
+            self.pivot_operation(t, h)
+            beta[t - 1] = h
+        self.optimal = True
+        self.solution = [0] * (n - 1)
+        for i, b in enumerate(beta):
+            self.solution[b - 1] = tableau[i + 1][0]
+        self.z = -tableau[0][0]
+
+
+def random_tableau(rows: int, columns: int, seed: int = 0) -> tuple[np.ndarray, np.ndarray]:
+    random = np.random.default_rng(seed)
+    a = random.uniform(0.1, 1.0, (rows, columns))
+    b = random.uniform(1.0, 10.0, rows)
+    c = random.uniform(0.1, 1.0, columns)
+    tableau = np.zeros((rows + 1, columns + rows + 1))
+    tableau[0, 1:columns + 1] = -c
+    tableau[1:, 0] = b
+    tableau[1:, 1:columns + 1] = a
+    tableau[1:, columns + 1:] = np.eye(rows)
+    return tableau, np.arange(columns + 1, columns + rows + 1)
+
+
+def random_sparse_problem(rows: int, columns: int, seed: int = 0) -> dict[str, np.ndarray]:
+    """Задача min c·x при [A I] x = b, x >= 0 с разреженной A, каждый столбец
+    которой содержит хотя бы один элемент. Начальный базис - дополнительные переменные"""
+    random = np.random.default_rng(seed)
+    mask = random.random((rows, columns)) < SPARSE_ROW_ENTRIES / rows
+    mask[random.integers(0, rows, columns), np.arange(columns)] = True
+    a_rows, a_cols = np.nonzero(mask)
+    return {'c': np.concatenate([-random.uniform(0.1, 1.0, columns), np.zeros(rows)]),
+            'b': random.uniform(1.0, 10.0, rows),
+            'a_rows': np.concatenate([a_rows, np.arange(rows)]),
+            'a_cols': np.concatenate([a_cols, columns + np.arange(rows)]),
+            'a_values': np.concatenate([random.uniform(0.1, 1.0, len(a_rows)), np.ones(rows)]),
+            'basic_var': columns + np.arange(rows)}
+
+
+def redundant_problem(rows: int, columns: int, seed: int = 0) -> dict[str, np.ndarray]:
+    """Случайная разреженная задача, дополненная тем, что убирает presolve:
+    копиями строк с множителями, строками x_j = 0 и масштабами строк и
+    столбцов от 10^-3 до 10^3. Начального базиса нет"""
+    problem = random_sparse_problem(rows, columns, seed)
+    random = np.random.default_rng(seed)
+    n = len(problem['c'])
+    a = np.zeros((rows, n))
+    a[problem['a_rows'], problem['a_cols']] = problem['a_values']
+    copies = random.choice(rows, rows // 4, replace=False)
+    factors = random.uniform(0.5, 2.0, len(copies))
+    fixed = random.choice(columns, columns // 10, replace=False)
+    a = np.vstack([a, a[copies] * factors[:, None], np.eye(n)[fixed]])
+    b = np.concatenate([problem['b'], problem['b'][copies] * factors, np.zeros(len(fixed))])
+    row_scale = 10.0 ** random.integers(-3, 4, len(b))
+    column_scale = 10.0 ** random.integers(-3, 4, n)
+    a = row_scale[:, None] * a * column_scale
+    a_rows, a_cols = np.nonzero(a)
+    return {'c': problem['c'] * column_scale, 'b': b * row_scale,
+            'a_rows': a_rows, 'a_cols': a_cols, 'a_values': a[a_rows, a_cols]}
+
+
+def to_tableau(problem: dict[str, np.ndarray]) -> tuple[np.ndarray, np.ndarray]:
+    rows, columns = len(problem['b']), len(problem['c'])
+    tableau = np.zeros((rows + 1, columns + 1))
+    tableau[0, 1:] = problem['c']
+    tableau[1:, 0] = problem['b']
+    tableau[1 + problem['a_rows'], 1 + problem['a_cols']] = problem['a_values']
+    return tableau, problem['basic_var'] + 1
+
+
+def measure_revised(problem: dict[str, np.ndarray], **options) -> tuple[float, RevisedSimplexModel]:
+    start = time.perf_counter()
+    matrix = SparseMatrix.from_triplets(problem['a_rows'], problem['a_cols'], problem['a_values'],
+                                        (len(problem['b']), len(problem['c'])))
+    model = RevisedSimplexModel(problem['c'], matrix, problem['b'], problem['basic_var'], **options)
+    model.primal_simplex_method()
+    return time.perf_counter() - start, model
+
+
+def measure_presolve(problem: dict[str, np.ndarray], presolve: bool) -> tuple[float, RevisedSimplexModel]:
+    start = time.perf_counter()
+    c, b = problem['c'], problem['b']
+    matrix = SparseMatrix.from_triplets(problem['a_rows'], problem['a_cols'], problem['a_values'], (len(b), len(c)))
+    if presolve:
+        reduced = Presolve(c, matrix, b)
+        c, matrix, b = reduced.c, reduced.matrix, reduced.b
+    model = RevisedSimplexModel(c, matrix, b, pivot_rule=DANTZIG)
+    model.solve()
+    return time.perf_counter() - start, model
+
+
+def measure(model_class, tableau: np.ndarray, basic_var: np.ndarray, **options) -> tuple[float, SimplexModel]:
+    model = model_class(tableau.copy(), basic_var.copy(), **options)
+    start = time.perf_counter()
+    model.primal_simplex_method()
+    return time.perf_counter() - start, model
+
+
+def main(sizes: list[str]) -> None:
+    print(f'{"размер":>10} {"циклы, с":>10} {"numpy, с":>10} {"ускорение":>10}')
+    for size in sizes:
+        rows, columns = map(int, size.split('x'))
+        tableau, basic_var = random_tableau(rows, columns)
+        loop_time, loop_model = measure(LoopSimplexModel, tableau, basic_var)
+        numpy_time, numpy_model = measure(SimplexModel, tableau, basic_var)
+        assert np.allclose(loop_model.solution, numpy_model.solution)
+        print(f'{size:>10} {loop_time:>10.3f} {numpy_time:>10.4f} {loop_time / numpy_time:>9.0f}x')
+    print()
+    print(f'{"размер":>10}' + ''.join(f' {rule + ", с":>18} {"итераций":>9}' for rule in PIVOT_RULES))
+    for size in sizes:
+        rows, columns = map(int, size.split('x'))
+        tableau, basic_var = random_tableau(rows, columns)
+        line = f'{size:>10}'
+        for rule in PIVOT_RULES:
+            elapsed, model = measure(SimplexModel, tableau, basic_var, pivot_rule=rule)
+            line += f' {elapsed:>18.4f} {model.iterations:>9}'
+        print(line)
+    print()
+    print(f'{"размер":>10} {"таблица, с":>12} {"разреж., с":>12} {"итераций":>9}')
+    for size in sizes + list(SPARSE_SIZES):
+        rows, columns = map(int, size.split('x'))
+        problem = random_sparse_problem(rows, columns)
+        revised_time, revised_model = measure_revised(problem, pivot_rule=DANTZIG)
+        if size in sizes:
+            tableau, basic_var = to_tableau(problem)
+            tableau_time, tableau_model = measure(SimplexModel, tableau, basic_var, pivot_rule=DANTZIG)
+            assert np.isclose(tableau_model.z, revised_model.z)
+            tableau_column = f'{tableau_time:>12.4f}'
+        else:
+            tableau_column = f'{"-":>12}'
+        print(f'{size:>10} {tableau_column} {revised_time:>12.4f} {revised_model.iterations:>9}')
+    print()
+    print(f'{"размер":>10} {"без presolve, с":>16} {"итераций":>9} {"с presolve, с":>16} {"итераций":>9}')
+    for size in sizes:
+        rows, columns = map(int, size.split('x'))
+        problem = redundant_problem(rows, columns)
+        plain_time, plain_model = measure_presolve(problem, False)
+        presolve_time, presolve_model = measure_presolve(problem, True)
+        assert np.isclose(plain_model.z, presolve_model.z)
+        print(f'{size:>10} {plain_time:>16.4f} {plain_model.iterations:>9} '
+              f'{presolve_time:>16.4f} {presolve_model.iterations:>9}')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:] or list(DEFAULT_SIZES))
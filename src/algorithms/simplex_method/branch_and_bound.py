@@ -0,0 +1,273 @@
+"""Branch and bound for integer and mixed-integer linear programs
+
+    min c·x  subject to  A x = b, x >= 0, x_j integer for j in integer_var
+
+The problem is presolved once. A node of the search tree is the LP
+relaxation of the reduced problem with the branching bounds x_j <= floor(v)
+or x_j >= ceil(v) of its ancestors added as rows sign·x_j + s = sign·bound
+with a new slack s; the rows are appended to the columns of the reduced
+matrix, so a node neither repeats the presolve nor sorts the whole matrix
+again. A child starts from the optimal basis of its parent with the new
+slack basic: the basis stays dual feasible and only the new row is
+violated, so the dual simplex method restores feasibility in a few pivots.
+
+Open nodes are kept in a heap ordered by the LP value of their parent and
+the best ones are evaluated first (best-bound search). Until an integer
+solution is found the search dives: the child on the side the branching
+variable rounds to is evaluated next, so that a first incumbent prunes the
+tree early. With several workers a batch of the best open nodes is
+evaluated in parallel in a process pool shared by all the searches of the
+process; its size is taken from the executor configuration and the pool is
+shut down when the process exits. The search stops when no open node can improve the incumbent,
+after MAX_NODES nodes or when the time budget runs out; the relative gap
+between the incumbent and the best open bound tells how far from optimal
+the answer may be.
+"""
+import heapq
+import math
+import multiprocessing
+import multiprocessing.util
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+import numpy as np
+
+from src.algorithms.simplex_method.limits import Budget, BUDGET_EXCEEDED_MSG
+from src.algorithms.simplex_method.pivot_rules import DANTZIG
+from src.algorithms.simplex_method.presolve import Presolve
+from src.executor import NODE_POOL_SIZE_ENV
+from src.algorithms.simplex_method.revised import RevisedSimplexModel, SparseMatrix, INCORRECT_INPUT_MSG, \
+    NO_SOLUTION_MSG
+
+MAX_NODES = 20000
+"""The largest number of evaluated nodes of one search"""
+
+INTEGRALITY_TOLERANCE = 1e-6
+"""Values closer to an integer are treated as integer"""
+
+GAP_TOLERANCE = 1e-9
+"""Nodes whose bound is within this relative distance of the incumbent are pruned"""
+
+_node_pool: Optional[ProcessPoolExecutor] = None
+
+
+def node_pool_size():
+    '''
+    The number of processes evaluating nodes in parallel: node_pool_size of the executor configuration,
+    the number of CPUs outside the application
+    '''
+    return max(int(os.environ.get(NODE_POOL_SIZE_ENV, 0)) or os.cpu_count() or 1, 1)
+
+
+def node_pool():
+    '''
+    The pool of node_pool_size() processes shared by the searches of this process, started on first use
+    '''
+    global _node_pool
+    if _node_pool is None:
+        # spawn: the searching process may run other threads, which fork would copy in an arbitrary state
+        _node_pool = ProcessPoolExecutor(node_pool_size(), mp_context=multiprocessing.get_context('spawn'))
+    return _node_pool
+
+
+def reset_node_pool(wait=False):
+    '''
+    Drops a broken pool, the next search starts a new one; with wait the processes are joined
+    '''
+    global _node_pool
+    if _node_pool is not None:
+        _node_pool.shutdown(wait=wait, cancel_futures=True)
+        _node_pool = None
+
+
+# The finalizers run both at interpreter exit and when a worker process of the executor returns.
+# The pool stops before the finalizers of the multiprocessing queues (priority 10) close its call queue
+multiprocessing.util.Finalize(None, reset_node_pool, kwargs={'wait': True}, exitpriority=100)
+
+
+def branch_matrix(matrix, columns, values):
+    '''
+    The matrix with k rows appended: row m + t has the entry values[t] in column columns[t]
+    and 1 in the new column n + t
+    '''
+    (m, n), k = matrix.shape, len(columns)
+    order = np.argsort(columns, kind='stable')
+    columns, values = columns[order], values[order]
+    # the entries of a column keep their order, the branching entries follow them
+    counts = np.diff(matrix.indptr)
+    indptr = np.zeros(n + k + 1, dtype=np.int64)
+    np.cumsum(np.concatenate([counts + np.bincount(columns, minlength=n), np.ones(k, dtype=np.int64)]),
+              out=indptr[1:])
+    positions = np.arange(matrix.indptr[-1]) - matrix.indptr[matrix.columns] + indptr[matrix.columns]
+    branch_positions = indptr[columns] + counts[columns] + np.arange(k) - np.searchsorted(columns, columns)
+    indices = np.empty(indptr[-1], dtype=np.int64)
+    data = np.empty(indptr[-1])
+    indices[positions], data[positions] = matrix.indices, matrix.data
+    indices[branch_positions], data[branch_positions] = m + order, values
+    indices[indptr[n:-1]], data[indptr[n:-1]] = m + np.arange(k), 1.
+    return SparseMatrix(indptr, indices, data, (m + k, n + k))
+
+
+def evaluate_node(c, matrix, b, branches, basic_var, pivot_rule, budget):
+    '''
+    Solves the LP relaxation of a node, returns None if it is infeasible, otherwise the values
+    of the variables without the branching slacks, the objective, the basis and the number of pivots
+    '''
+    n, k = matrix.shape[1], len(branches)
+    branches = np.array(branches, dtype=float).reshape(k, 3)
+    extended = branch_matrix(matrix, branches[:, 0].astype(np.int64), branches[:, 1])
+    model = RevisedSimplexModel(np.concatenate([c, np.zeros(k)]), extended, np.concatenate([b, branches[:, 2]]),
+                                basic_var, pivot_rule=pivot_rule, budget=budget)
+    model.solve()
+    if model.infeasible:
+        return None
+    solution, z = model.get_solution()
+    return np.array(solution[:n]), z, model.basic_var, model.iterations
+
+
+class BranchAndBound:
+    """Solve min c·x, A x = b, x >= 0 with some variables integer.
+    Parameters:
+        - c: costs of the variables
+        - matrix: the constraint matrix A as a SparseMatrix
+        - b: the right hand side
+        - integer_var: indexes (from 0) of the variables that have to be integer
+        - basic_var: indexes (from 0) of the initial basic variables of the root relaxation, or None
+        - pivot_rule: the rule choosing the entering column
+        - budget: the iteration budget of every relaxation and the time budget of the search
+        - workers: the number of nodes evaluated in parallel by the shared process pool
+
+    Attributes:
+        - solution: the best integer solution found
+        - z: its objective, inf if none is found
+        - bound: the lowest LP bound of the open nodes
+        - gap: the relative gap between z and bound, 0 if the search is complete
+        - nodes: the number of evaluated nodes
+        - iterations: the number of pivots of all the relaxations"""
+
+    def __init__(self, c, matrix, b, integer_var, basic_var=None, pivot_rule=DANTZIG, budget=None, workers=1):
+        integer_var = np.unique(np.asarray(integer_var, dtype=np.int64))
+        if (len(integer_var) and (integer_var.min() < 0 or integer_var.max() >= matrix.shape[1])) or workers < 1:
+            raise ValueError(INCORRECT_INPUT_MSG)
+        self.c = np.asarray(c, dtype=float)
+        self.matrix = matrix
+        self.b = np.asarray(b, dtype=float)
+        self.integer_var = integer_var
+        self.pivot_rule = pivot_rule
+        self.budget = budget or Budget()
+        self.workers = workers
+        self.solution = []
+        self.z = math.inf
+        self.bound = -math.inf
+        self.gap = math.inf
+        self.nodes = 0
+        self.iterations = 0
+        self.__presolve = Presolve(self.c, matrix, self.b, basic_var)
+        # positions of the variables in the reduced problem, -1 for the fixed ones
+        self.__reduced = np.full(matrix.shape[1], -1)
+        self.__reduced[self.__presolve.columns] = np.arange(len(self.__presolve.columns))
+        # open nodes: (bound, number, branches, basis of the parent)
+        self.__open = [(-math.inf, 0, (), self.__presolve.basic_var)]
+        self.__count = 1
+        # the next node of the dive, not in the heap
+        self.__dive = None
+
+    def solve(self):
+        '''
+        Searches the tree until it is exhausted or the budget runs out
+        '''
+        while (self.__open or self.__dive) and self.nodes < MAX_NODES and time.monotonic() < self.budget.deadline:
+            if self.__dive is not None:
+                batch, self.__dive = [self.__dive], None
+            else:
+                batch = []
+                while self.__open and len(batch) < self.workers:
+                    node = heapq.heappop(self.__open)
+                    if self.__prunable(node[0]):
+                        # the heap is ordered by bound, no other open node can be better
+                        self.__open.clear()
+                        break
+                    batch.append(node)
+            if not self.__evaluate(batch):
+                break
+        if self.__dive is not None:
+            heapq.heappush(self.__open, self.__dive)
+            self.__dive = None
+        self.bound = min([node[0] for node in self.__open], default=self.z)
+        self.gap = (self.z - self.bound) / max(abs(self.z), 1) if self.__open else 0.
+        if self.z == math.inf:
+            raise ValueError(BUDGET_EXCEEDED_MSG if self.__open else NO_SOLUTION_MSG)
+
+    def get_solution(self):
+        return (self.solution, self.z,)
+
+    def __evaluate(self, batch):
+        '''
+        Evaluates a batch of nodes and branches on them, returns False if the budget ran out,
+        the nodes not evaluated stay open
+        '''
+        presolve = self.__presolve
+        arguments = [(presolve.c, presolve.matrix, presolve.b, node[2], node[3], self.pivot_rule, self.budget)
+                     for node in batch]
+        futures = None
+        if len(batch) > 1:
+            futures = [node_pool().submit(evaluate_node, *node_arguments) for node_arguments in arguments]
+        for position, node in enumerate(batch):
+            try:
+                try:
+                    result = futures[position].result() if futures else evaluate_node(*arguments[position])
+                except BrokenProcessPool:
+                    reset_node_pool()
+                    futures = None
+                    result = evaluate_node(*arguments[position])
+            except ValueError as error:
+                if str(error) != BUDGET_EXCEEDED_MSG:
+                    raise
+                for unevaluated in batch[position:]:
+                    heapq.heappush(self.__open, unevaluated)
+                return False
+            self.nodes += 1
+            if result is not None:
+                self.__branch(node, *result)
+        return True
+
+    def __branch(self, node, reduced_x, reduced_z, basis, iterations):
+        self.iterations += iterations
+        x = self.__presolve.solution(reduced_x)
+        z = float(self.c @ x)
+        if self.__prunable(z):
+            return
+        values = x[self.integer_var]
+        distance = np.abs(values - np.round(values))
+        j = int(np.argmax(distance))
+        if distance[j] <= INTEGRALITY_TOLERANCE:
+            x[self.integer_var] = np.round(values)
+            self.solution, self.z = x.tolist(), float(self.c @ x)
+            return
+        variable = int(self.integer_var[j])
+        column = self.__reduced[variable]
+        if column < 0:
+            # the variable is fixed by the presolve at a fractional value in every node
+            return
+        n, branches = self.__presolve.matrix.shape[1], node[2]
+        k = len(branches)
+        # the parent basis in the index space of a child: artificial variables of
+        # redundant rows shift by the new slack, which becomes basic in the new row
+        basis = np.concatenate([np.where(basis >= n + k, basis + 1, basis), [n + k]])
+        scale = self.__presolve.column_scale[column]
+        children = [(z, self.__count + side, branches + ((column, sign * scale, sign * bound),), basis)
+                    for side, (sign, bound) in enumerate(((1., math.floor(values[j])), (-1., math.ceil(values[j]))))]
+        self.__count += 2
+        if self.z == math.inf and self.__dive is None:
+            # dive into the side the value rounds to, the other child waits in the heap
+            rounded_up = int(values[j] - math.floor(values[j]) >= 0.5)
+            self.__dive = children[rounded_up]
+            children = [children[not rounded_up]]
+        for child in children:
+            heapq.heappush(self.__open, child)
+
+    def __prunable(self, bound):
+        return self.z < math.inf and bound >= self.z - GAP_TOLERANCE * max(abs(self.z), 1)
@@ -1,29 +1,42 @@
-from typing import Union
+from typing import Optional, Union
 
 import numpy as np
 
+from src.algorithms.simplex_method.branch_and_bound import BranchAndBound, node_pool_size
+from src.algorithms.simplex_method.limits import Budget, CyclingGuard
+from src.algorithms.simplex_method.presolve import Presolve
+from src.algorithms.simplex_method.pivot_rules import DANTZIG, STEEPEST_EDGE, BLAND, PIVOT_RULES, \
+    UNKNOWN_PIVOT_RULE_MSG
+from src.algorithms.simplex_method.revised import RevisedSimplexModel, SparseMatrix, INCORRECT_INPUT_MSG, \
+    OTHER_PROBLEM_MSG, UNBOUNDED_MSG, NO_SOLUTION_MSG
+
 
 class SimplexModel:
     """Implement the linear programming problem in tableau form.
     Parameters:
         - tableau: a numpy array representing the tableau on which perform operations
         - basic_var: a list of initial basic variables
-        - integer: a boolean value indicating if the solution has to be integer
+        - pivot_rule: the rule choosing the entering column (dantzig, steepest_edge or bland)
+        - budget: the iteration and time budget, a default Budget if not given
 
     Attributes:
         - tableau: the current tableau
         - basic_var: a numpy array containing indexes of the current basic variables
-        - integer: a boolean value indicating if the solution has to be integer
         - solution: an array representing the final solution if exists
         - z: the optimal value if exists
         - optimal: boolean value if the tableau is in optimal form
         - unbounded: boolean value
-        - infeasible: boolean value"""
+        - infeasible: boolean value
+        - iterations: the number of pivot operations performed"""
 
-    def __init__(self, tableau, basic_var, integer=False):
+    def __init__(self, tableau, basic_var, pivot_rule=BLAND, budget=None):
+        if pivot_rule not in PIVOT_RULES:
+            raise ValueError(UNKNOWN_PIVOT_RULE_MSG)
         self.tableau = tableau
         self.basic_var = basic_var
-        self.integer = integer
+        self.pivot_rule = pivot_rule
+        self.budget = budget or Budget()
+        self.iterations = 0
         self.solution = []
         self.z = 0
         self.optimal = False
@@ -31,12 +44,11 @@ class SimplexModel:
         self.infeasible = False
 
     def get_solution(self):
-        if self.solution != None:
-            return (self.solution, self.z,)
-        elif self.unbounded:
-            raise ValueError('Эта таблица бесконечна')
+        if self.unbounded:
+            raise ValueError(UNBOUNDED_MSG)
         elif self.infeasible:
-            raise ValueError('Решения нет')
+            raise ValueError(NO_SOLUTION_MSG)
+        return (self.solution, self.z,)
 
     # parameters: tableau, index t of the row, index h of the column
     def pivot_operation(self, t, h):
@@ -44,20 +56,12 @@ class SimplexModel:
         Performs the pivot operations of the cell represented by the input values for row t and column h
         '''
         tableau = self.tableau
-        # shape of the tableau
-        m = tableau.shape[0]
-        n = tableau.shape[1]
-        pivot = tableau[t][h]
         # divide the pivot row by the pivot element
-        for i in range(n):
-            tableau[t][i] /= pivot
-        # update all the other rows
-        save = pivot
-        for i in range(m):
-            if i != t and tableau[i][h] != 0:
-                save = tableau[i][h]
-                for j in range(n):
-                    tableau[i][j] -= save * tableau[t][j]
+        tableau[t] /= tableau[t, h]
+        # update all the other rows with a single rank-one update
+        factors = tableau[:, h].copy()
+        factors[t] = 0
+        tableau -= np.multiply.outer(factors, tableau[t])
 
     def primal_simplex_method(self):
         '''
@@ -65,9 +69,8 @@ class SimplexModel:
         '''
         tableau = self.tableau
         beta = self.basic_var
+        guard = CyclingGuard()
 
-        # number of rows in the tableau
-        m = tableau.shape[0]
         # number of columns in the tableau
         n = tableau.shape[1]
 
@@ -76,39 +79,40 @@ class SimplexModel:
         optimal = False
 
         while optimal == False and unbounded == False:
-            # get the vector of costs
-            costs = [tableau[0][c] for c in range(1, n)]
-            # verify if all the costs are >= 0, thus the tableau is in optimal form
-            if all(c >= 0 for c in costs):
+            # the vector of costs is a view of the first row
+            negative = np.flatnonzero(tableau[0, 1:] < 0)
+            # if all the costs are >= 0 the tableau is in optimal form
+            if negative.size == 0:
                 optimal = True
                 break
+            # index of the non basic variable entering the basis
+            h = self.__entering_column(negative)
+            column = tableau[1:, h]
+            # no a[i, h] > 0 means the variable grows without bound
+            positive = column > 0
+            if not positive.any():
+                unbounded = True
+                break
+            # choose the variable that will leave the basis: the smallest ratio
+            # among the rows with a[i, h] > 0
+            ratios = np.full(positive.shape, np.inf)
+            np.divide(tableau[1:, 0], column, out=ratios, where=positive)
+            rows = np.flatnonzero(ratios == ratios.min())
+            if self.pivot_rule == BLAND:
+                t = rows[np.argmin(beta[rows])] + 1
             else:
-                # index of the non basic variable
-                h = 0
-                # Find the first cost < 0 and choose a non basic variable
-                for i, c in enumerate(tableau[0]):
-                    if i != 0 and c < 0:
-                        h = i
-                        # print('Variable of index {} will enter the basis'.format(h))
-                        break
-                # check if all the a[i, h] are < 0 so the problem is unbounded
-                if all(tableau[i, h] < 0 for i in range(m)):
-                    unbounded = True
-                    break
-                else:
-                    # choose the variable that will leave the basis
-                    min = 100000
-                    t = 1
-                    for i in range(1, m):
-                        if tableau[i][h] > 0 and tableau[i][0] / tableau[i][h] < min:
-                            min = tableau[i][0] / tableau[i][h]
-                            t = i
-
-                    # pivot operation
-                    self.pivot_operation(t, h)
-
-                    # update the vector beta, containing the indices of the basis variables
-                    beta[t - 1] = h
+                t = rows[0] + 1
+
+            # pivot operation
+            self.budget.check(self.iterations)
+            self.pivot_operation(t, h)
+            self.iterations += 1
+
+            # update the vector beta, containing the indices of the basis variables
+            beta[t - 1] = h
+            # a pivot with a zero ratio leaves the objective unchanged and may cycle
+            if guard.cycling(beta, ratios[t - 1] == 0):
+                self.pivot_rule = BLAND
 
         if optimal:
             # solution
@@ -121,14 +125,122 @@ class SimplexModel:
         elif unbounded:
             self.unbounded = True
 
-
-def main(tableau: list[list[float]], basic_var: list[float]) -> dict[str, Union[list[float], float]]:
-    tableau = np.array(tableau)
-    basic_var = np.array(basic_var)
-    model = SimplexModel(tableau, basic_var)
+    def __entering_column(self, negative):
+        '''
+        Chooses the entering column among the columns with a negative reduced cost
+        '''
+        costs = self.tableau[0, negative + 1]
+        if self.pivot_rule == DANTZIG:
+            return negative[np.argmin(costs)] + 1
+        if self.pivot_rule == STEEPEST_EDGE:
+            # the edge of a column has the direction (1, -a[1:, h]) in the space of variables
+            columns = self.tableau[1:, negative + 1]
+            norms = np.sqrt(1 + np.einsum('ij,ij->j', columns, columns))
+            return negative[np.argmin(costs / norms)] + 1
+        return negative[0] + 1
+
+
+def main(tableau: Optional[list[list[float]]] = None, basic_var: Optional[list[int]] = None,
+         pivot_rule: Optional[str] = None,
+         c: Optional[list[float]] = None, b: Optional[list[float]] = None, a_rows: Optional[list[int]] = None,
+         a_cols: Optional[list[int]] = None, a_values: Optional[list[float]] = None,
+         problem_id: Optional[str] = None, max_iterations: Optional[int] = None, time_limit: Optional[float] = None,
+         integer_var: Optional[list[int]] = None, workers: int = 1, time_budget: Optional[float] = None
+         ) -> dict[str, Union[list[float], list[int], float, int, str, None]]:
+    """Задача задаётся либо симплекс-таблицей tableau, либо в разреженном виде:
+    min c·x при A x = b, x >= 0, где ненулевые элементы A перечислены тройками
+    (a_rows, a_cols, a_values) с нумерацией строк и столбцов от 0. Разреженная
+    задача решается модифицированным симплекс-методом. basic_var - номера
+    (от 1) начальных базисных переменных. Без basic_var, а также если базис
+    недопустим, допустимый базис ищется первой фазой двухфазного метода.
+    Число итераций и время решения ограничены max_iterations и time_limit,
+    но не больше MAX_ITERATIONS и time_budget - времени, которое сервер
+    отводит алгоритму по execute_timeout (без него - TIME_LIMIT).
+
+    Без pivot_rule табличный метод выбирает столбец по правилу Бленда, а
+    модифицированный - по правилу Данцига: правило Бленда исключает
+    зацикливание, но на больших задачах требует во много раз больше итераций.
+
+    Перед итерациями задача упрощается и масштабируется (presolve.py), ответ
+    переводится обратно к исходным переменным и ограничениям.
+
+    Переменные с номерами (от 1) из integer_var должны быть целыми: задача
+    решается методом ветвей и границ, узлы которого при workers > 1
+    вычисляются параллельно общим пулом процессов (не больше node_pool_size
+    из настроек выполнения). По истечении времени возвращается лучшее
+    найденное решение и относительный разрыв gap до нижней границы. Базис,
+    теневые цены и приведённые стоимости для целочисленной задачи не
+    возвращаются.
+
+    Ответ содержит итоговый базис basis и идентификатор матрицы ограничений
+    problem_id. Повторное решение с basic_var = basis и тем же problem_id
+    начинается с этого базиса: после изменения c - прямым, после изменения
+    b - двойственным симплекс-методом. Теневые цены shadow_prices и
+    приведённые стоимости reduced_costs относятся к итоговому базису."""
+    if pivot_rule is not None and pivot_rule not in PIVOT_RULES:
+        raise ValueError(UNKNOWN_PIVOT_RULE_MSG)
+    sparse = (c, b, a_rows, a_cols, a_values)
+    budget = Budget(max_iterations, time_limit, time_budget)
+    offset = 0
+    if tableau is not None:
+        if any(value is not None for value in sparse):
+            raise ValueError(INCORRECT_INPUT_MSG)
+        tableau = np.array(tableau, dtype=float)
+        matrix = SparseMatrix.from_dense(tableau[1:, 1:])
+        c, b, offset = tableau[0, 1:], tableau[1:, 0], tableau[0, 0]
+    else:
+        if any(value is None for value in sparse):
+            raise ValueError(INCORRECT_INPUT_MSG)
+        matrix = SparseMatrix.from_triplets(a_rows, a_cols, a_values, (len(b), len(c)))
+    if problem_id is not None and problem_id != matrix.handle():
+        raise ValueError(OTHER_PROBLEM_MSG)
+    if basic_var is not None:
+        basic_var = np.array(basic_var, dtype=np.int64) - 1
+    if integer_var is not None:
+        model = BranchAndBound(c, matrix, b, np.array(integer_var, dtype=np.int64) - 1, basic_var,
+                               pivot_rule=pivot_rule or DANTZIG, budget=budget, workers=min(workers, node_pool_size()))
+        model.solve()
+        optimal_solution, optimal_value = model.get_solution()
+        return {'optimal_solution': optimal_solution, 'optimal_value': optimal_value - offset,
+                'iterations': model.iterations, 'problem_id': matrix.handle(), 'gap': model.gap, 'nodes': model.nodes}
+    presolve = Presolve(c, matrix, b, basic_var)
+    if (tableau is not None and problem_id is None and presolve.basic_var is not None and
+            np.all(presolve.b >= 0)):
+        solution, shadow_prices, basis, iterations = __solve_tableau(presolve, pivot_rule or BLAND, budget)
+    else:
+        # повторное решение и поиск допустимого базиса идут через модифицированный
+        # метод, которому не нужна таблица, приведённая к начальному базису
+        start = None if tableau is not None and problem_id is None else presolve.basic_var
+        model = RevisedSimplexModel(presolve.c, presolve.matrix, presolve.b, start,
+                                    pivot_rule=pivot_rule or DANTZIG, budget=budget)
+        model.solve()
+        solution, _ = model.get_solution()
+        shadow_prices, basis, iterations = model.shadow_prices, model.basic_var, model.iterations
+    x, y, basis, reduced_costs = presolve.postsolve(solution, shadow_prices, basis)
+    return {'optimal_solution': x.tolist(), 'optimal_value': float(np.asarray(c, dtype=float) @ x) - offset,
+            'iterations': iterations, 'basis': (basis + 1).tolist(), 'problem_id': matrix.handle(),
+            'shadow_prices': y.tolist(), 'reduced_costs': reduced_costs.tolist()}
+
+
+def is_complete(result: dict) -> bool:
+    """Ответ не зависит от нагрузки: поиск ветвей и границ не прерван по
+    времени с ненулевым разрывом gap"""
+    return not result.get('gap')
+
+
+def __solve_tableau(presolve, pivot_rule, budget):
+    m, n = presolve.matrix.shape
+    tableau = np.zeros((m + 1, n + 1))
+    tableau[0, 1:] = presolve.c
+    tableau[1:, 0] = presolve.b
+    tableau[1:, 1:] = presolve.matrix.dense_columns(np.arange(n))
+    model = SimplexModel(tableau.copy(), presolve.basic_var + 1, pivot_rule=pivot_rule, budget=budget)
     model.primal_simplex_method()
-    optimal_solution, optimal_value = model.get_solution()
-    return {'optimal_solution': optimal_solution, 'optimal_value': optimal_value}
+    optimal_solution, _ = model.get_solution()
+    # строка стоимостей итоговой таблицы d = c - y A, откуда y находится
+    # по исходной таблице без обращения базиса
+    shadow_prices = np.linalg.lstsq(tableau[1:, 1:].T, tableau[0, 1:] - model.tableau[0, 1:], rcond=None)[0]
+    return optimal_solution, shadow_prices, model.basic_var - 1, model.iterations
 
 
 if __name__ == '__main__':
@@ -0,0 +1,55 @@
+"""Limits that make every simplex solve finish in bounded time"""
+import time
+
+MAX_ITERATIONS = 100000
+"""The largest number of pivots of one solve"""
+
+TIME_LIMIT = 8.0
+"""The longest duration of one solve in seconds without a time budget. The server
+passes a budget derived from execute_timeout, so that the solver reports the exceeded
+budget before its worker is killed whatever the configured timeout"""
+
+DEGENERATE_STREAK_LIMIT = 50
+"""Consecutive degenerate pivots after which the solver switches to Bland's rule"""
+
+BUDGET_EXCEEDED_MSG = 'Превышено допустимое количество итераций или время решения'
+
+
+class Budget:
+    """Iteration and time budget of one solve.
+    Parameters:
+        - max_iterations: the largest number of pivots, at most MAX_ITERATIONS
+        - time_limit: the longest duration in seconds, at most time_budget
+        - time_budget: the time allowed by the caller, TIME_LIMIT if not given"""
+
+    def __init__(self, max_iterations=None, time_limit=None, time_budget=None):
+        time_budget = time_budget or TIME_LIMIT
+        self.max_iterations = min(max_iterations or MAX_ITERATIONS, MAX_ITERATIONS)
+        self.deadline = time.monotonic() + min(time_limit or time_budget, time_budget)
+
+    def check(self, iterations):
+        if iterations >= self.max_iterations or time.monotonic() > self.deadline:
+            raise ValueError(BUDGET_EXCEEDED_MSG)
+
+
+class CyclingGuard:
+    """Detects cycling of the simplex method.
+
+    Only degenerate pivots, which do not change the objective, can cycle. A
+    basis repeated within a streak of degenerate pivots, or a streak longer
+    than DEGENERATE_STREAK_LIMIT, means the current rule should be replaced
+    by Bland's rule, which never cycles."""
+
+    def __init__(self):
+        self.__seen = set()
+
+    def cycling(self, basic_var, degenerate):
+        if not degenerate:
+            self.__seen.clear()
+            return False
+        basis = frozenset(basic_var.tolist())
+        if basis in self.__seen or len(self.__seen) >= DEGENERATE_STREAK_LIMIT:
+            self.__seen.clear()
+            return True
+        self.__seen.add(basis)
+        return False
@@ -0,0 +1,15 @@
+"""Rules choosing the column that enters the basis"""
+
+DANTZIG = 'dantzig'
+"""The entering column has the most negative reduced cost"""
+
+STEEPEST_EDGE = 'steepest_edge'
+"""The entering column has the most negative reduced cost per unit length of its edge"""
+
+BLAND = 'bland'
+"""The entering column is the first one with a negative reduced cost and ties in the
+ratio test go to the smallest basic variable, which rules out cycling"""
+
+PIVOT_RULES = (DANTZIG, STEEPEST_EDGE, BLAND)
+
+UNKNOWN_PIVOT_RULE_MSG = 'Неизвестное правило выбора ведущего столбца'
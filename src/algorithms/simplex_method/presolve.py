@@ -0,0 +1,250 @@
+"""Presolve of linear programs in standard form
+
+    min c·x  subject to  A x = b, x >= 0
+
+before the simplex iterations, and postsolve of the answer.
+
+Presolve repeats cheap reductions until none applies:
+    - an empty row is dropped, or proves the problem infeasible if b_i != 0;
+    - an empty column with c_j >= 0 is fixed at x_j = 0;
+    - a singleton row a_ij x_j = b_i fixes x_j = b_i / a_ij and is substituted
+      into the other rows;
+    - a forcing row, whose coefficients have one sign and b_i = 0, fixes all
+      its variables at zero;
+    - a row proportional to another one is dropped, or proves the problem
+      infeasible if the right hand sides disagree.
+The remaining matrix is scaled by geometric means of its rows and columns
+rounded to powers of two, so the scaling itself adds no rounding error.
+Singleton columns, slacks in particular, are scaled to unit entries, so an
+identity basis of the original problem stays an identity basis.
+
+Postsolve undoes the scaling, restores the fixed variables, and recovers
+the dual values of the removed rows in reverse order of the reductions so
+that the reduced costs of the removed columns keep their optimal signs.
+"""
+import numpy as np
+
+from src.algorithms.simplex_method.revised import SparseMatrix, TOLERANCE, INCORRECT_INPUT_MSG, \
+    NO_SOLUTION_MSG
+
+SCALING_PASSES = 4
+"""Number of alternating row and column passes of the geometric scaling"""
+
+DUPLICATE_DIGITS = 12
+"""Significant digits compared when looking for proportional rows"""
+
+EMPTY, SINGLETON, FORCING, DUPLICATE = range(4)
+"""Kinds of removed rows"""
+
+
+class Presolve:
+    """Reduces and scales a linear program, maps the answer back.
+    Parameters:
+        - c: costs of the variables
+        - matrix: the constraint matrix A as a SparseMatrix
+        - b: the right hand side
+        - basic_var: indexes (from 0) of the initial basic variables, one per row except the
+          redundant rows, or None; artificial variables numbered from the number of columns are ignored
+
+    Attributes:
+        - c, matrix, b: the reduced and scaled problem
+        - basic_var: the initial basis of the reduced problem, None if it has no
+          counterpart there
+        - rows, columns: indexes of the original rows and columns kept in the reduced problem
+        - column_scale: scales of the kept columns, their original values are column_scale · x'"""
+
+    def __init__(self, c, matrix, b, basic_var=None):
+        m, n = matrix.shape
+        self.__c = np.asarray(c, dtype=float)
+        self.__b = np.asarray(b, dtype=float)
+        if len(self.__c) != n or len(self.__b) != m:
+            raise ValueError(INCORRECT_INPUT_MSG)
+        if basic_var is not None:
+            basic_var = np.asarray(basic_var, dtype=np.int64)
+            if (len(basic_var) > m or len(set(basic_var.tolist())) != len(basic_var) or
+                    (len(basic_var) and (basic_var.min() < 0 or basic_var.max() >= n + m))):
+                raise ValueError(INCORRECT_INPUT_MSG)
+        self.__matrix = matrix
+        self.__tolerance = TOLERANCE * (1 + np.abs(self.__b).max(initial=0))
+        self.__row_alive = np.ones(m, dtype=bool)
+        self.__column_alive = np.ones(n, dtype=bool)
+        self.__values = np.zeros(n)
+        # removed rows in the order of removal: (kind, row, columns fixed by the row)
+        self.__steps = []
+        rhs = self.__b.copy()
+        while self.__reduce(rhs):
+            pass
+        self.rows = np.flatnonzero(self.__row_alive)
+        self.columns = np.flatnonzero(self.__column_alive)
+        self.__scale(rhs)
+        self.basic_var = None
+        if basic_var is not None:
+            kept = basic_var[basic_var < n]
+            kept = kept[self.__column_alive[kept]]
+            if len(kept) == len(self.rows):
+                self.basic_var = np.searchsorted(self.columns, kept)
+
+    def solution(self, solution):
+        '''
+        Maps a solution of the reduced problem to the original variables
+        '''
+        x = self.__values.copy()
+        x[self.columns] = self.column_scale * np.asarray(solution, dtype=float)
+        return x
+
+    def postsolve(self, solution, shadow_prices, basic_var):
+        '''
+        Maps the solution, the dual values and the basis of the reduced problem
+        to the original one, returns them with the reduced costs. The basis lists the basic
+        columns in the order of their rows, the redundant rows have none
+        '''
+        matrix = self.__matrix
+        m, n = matrix.shape
+        x = self.solution(solution)
+        y = np.zeros(m)
+        y[self.rows] = self.__row_scale * np.asarray(shadow_prices, dtype=float)
+        basis = np.empty(m, dtype=np.int64)
+        # artificial variables of redundant rows are numbered after the columns in both problems
+        basis[self.rows] = np.concatenate([self.columns, n + self.rows])[np.asarray(basic_var, dtype=np.int64)]
+        for kind, i, columns in reversed(self.__steps):
+            if kind in (EMPTY, DUPLICATE):
+                basis[i] = n + i
+                continue
+            a = np.array([self.__entry(i, j) for j in columns])
+            d = self.__c[columns] - np.array([self.__column_dot(j, y) for j in columns])
+            if kind == SINGLETON:
+                # the fixed variable may be basic, its reduced cost is made zero
+                y[i] = d[0] / a[0]
+            else:
+                # the variables of a forcing row stay at zero, their reduced costs nonnegative
+                y[i] = np.min(d / a) if a[0] > 0 else np.max(d / a)
+            basis[i] = columns[0]
+        reduced_costs = self.__c - matrix.rmatvec(y)
+        basis = basis[basis < n]
+        reduced_costs[basis] = 0
+        return x, y, basis, reduced_costs
+
+    def __reduce(self, rhs):
+        '''
+        Applies one pass of the reductions, returns whether anything was removed
+        '''
+        matrix, tolerance = self.__matrix, self.__tolerance
+        rows, columns, data = matrix.indices, matrix.columns, matrix.data
+        alive = self.__row_alive[rows] & self.__column_alive[columns]
+        rows, columns, data = rows[alive], columns[alive], data[alive]
+        row_count = np.bincount(rows, minlength=matrix.shape[0])
+        column_count = np.bincount(columns, minlength=matrix.shape[1])
+        changed = False
+
+        for i in np.flatnonzero(self.__row_alive & (row_count == 0)):
+            if abs(rhs[i]) > tolerance:
+                raise ValueError(NO_SOLUTION_MSG)
+            self.__remove_row(EMPTY, i, [])
+            changed = True
+
+        empty = np.flatnonzero(self.__column_alive & (column_count == 0) & (self.__c >= 0))
+        self.__column_alive[empty] = False
+        changed |= len(empty) > 0
+
+        fixed = set()
+        for e in np.flatnonzero(row_count[rows] == 1):
+            i, j = rows[e], columns[e]
+            if j in fixed:
+                # the row becomes empty after the substitution and is checked next pass
+                continue
+            value = rhs[i] / data[e]
+            if value < -tolerance / abs(data[e]):
+                raise ValueError(NO_SOLUTION_MSG)
+            self.__fix(j, max(value, 0.), rhs)
+            self.__remove_row(SINGLETON, i, [j])
+            fixed.add(j)
+            changed = True
+        if changed:
+            return True
+
+        order = np.argsort(rows, kind='stable')
+        rows, columns, data = rows[order], columns[order], data[order]
+        bounds = np.searchsorted(rows, np.arange(matrix.shape[0] + 1))
+        seen = {}
+        for i in np.flatnonzero(self.__row_alive):
+            row_columns, row_data = columns[bounds[i]:bounds[i + 1]], data[bounds[i]:bounds[i + 1]]
+            if np.all(row_data > 0) or np.all(row_data < 0):
+                if rhs[i] * row_data[0] < -tolerance:
+                    raise ValueError(NO_SOLUTION_MSG)
+                if abs(rhs[i]) <= tolerance:
+                    for j in row_columns:
+                        self.__fix(j, 0., rhs)
+                    self.__remove_row(FORCING, i, row_columns.tolist())
+                    return True
+            # proportional rows have equal keys after dividing by the first coefficient
+            ratio = row_data / row_data[0]
+            key = (row_columns.tobytes(), np.round(ratio, DUPLICATE_DIGITS).tobytes())
+            if key in seen:
+                k, first = seen[key]
+                if abs(rhs[i] / row_data[0] - rhs[k] / first) > tolerance / abs(row_data[0]):
+                    raise ValueError(NO_SOLUTION_MSG)
+                self.__remove_row(DUPLICATE, i, [])
+                changed = True
+            else:
+                seen[key] = (i, row_data[0])
+        return changed
+
+    def __remove_row(self, kind, i, columns):
+        self.__row_alive[i] = False
+        self.__steps.append((kind, i, columns))
+
+    def __fix(self, j, value, rhs):
+        matrix = self.__matrix
+        start, end = matrix.indptr[j], matrix.indptr[j + 1]
+        rhs[matrix.indices[start:end]] -= matrix.data[start:end] * value
+        self.__values[j] = value
+        self.__column_alive[j] = False
+
+    def __entry(self, i, j):
+        matrix = self.__matrix
+        start, end = matrix.indptr[j], matrix.indptr[j + 1]
+        return matrix.data[start:end][matrix.indices[start:end] == i][0]
+
+    def __column_dot(self, j, y):
+        matrix = self.__matrix
+        start, end = matrix.indptr[j], matrix.indptr[j + 1]
+        return matrix.data[start:end] @ y[matrix.indices[start:end]]
+
+    def __scale(self, rhs):
+        '''
+        Scales the reduced problem: A' = R A C, b' = R b, c' = C c, so x = C x' and y = R y'
+        '''
+        matrix = self.__matrix
+        rows, columns, data = matrix.indices, matrix.columns, matrix.data
+        alive = self.__row_alive[rows] & self.__column_alive[columns]
+        row_index = np.searchsorted(self.rows, rows[alive])
+        column_index = np.searchsorted(self.columns, columns[alive])
+        data = data[alive]
+        log_data = np.log2(np.abs(data))
+        log_rows, log_columns = np.zeros(len(self.rows)), np.zeros(len(self.columns))
+        for _ in range(SCALING_PASSES):
+            log_rows = -self.__middle(log_data + log_columns[column_index], row_index, len(self.rows))
+            log_columns = -self.__middle(log_data + log_rows[row_index], column_index, len(self.columns))
+        self.__row_scale = np.exp2(np.round(log_rows))
+        self.column_scale = np.exp2(np.round(log_columns))
+        singletons = np.bincount(column_index, minlength=len(self.columns)) == 1
+        entries = singletons[column_index]
+        self.column_scale[column_index[entries]] = 1 / np.abs(self.__row_scale[row_index[entries]] * data[entries])
+        self.c = self.column_scale * self.__c[self.columns]
+        self.b = self.__row_scale * rhs[self.rows]
+        self.matrix = SparseMatrix.from_triplets(
+            row_index, column_index, self.__row_scale[row_index] * data * self.column_scale[column_index],
+            (len(self.rows), len(self.columns)))
+
+    @staticmethod
+    def __middle(values, groups, size):
+        '''
+        Midpoints of the smallest and the largest value in each group, zero for empty groups
+        '''
+        low, high = np.full(size, np.inf), np.full(size, -np.inf)
+        np.minimum.at(low, groups, values)
+        np.maximum.at(high, groups, values)
+        middle = np.zeros(size)
+        filled = np.isfinite(low)
+        middle[filled] = (low[filled] + high[filled]) / 2
+        return middle
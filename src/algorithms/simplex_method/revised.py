@@ -0,0 +1,608 @@
+"""Revised simplex method for sparse linear programs in standard form
+
+    min c·x  subject to  A x = b, x >= 0
+
+The constraint matrix is stored column-wise (CSC), so pricing and pivot
+columns cost O(nnz(A)) and O(nnz(a_j)) instead of O(m·n). The basis is
+factorized at refactorization and then updated in product form: each pivot
+appends one eta column and the basis is refactorized every REFACTOR_INTERVAL
+pivots to keep the file short and the error small.
+
+The factorization is a block triangular LU of the basis. Columns with a
+single nonzero among the remaining rows (slacks in particular) and then rows
+with a single nonzero among the remaining columns are eliminated in rounds,
+each round solved as one vector operation; only the remaining bump is
+inverted as a dense matrix. The cost of a refactorization and of a solve
+depends on the size of the bump rather than on the number of rows, and for
+sparse problems the bump is a small part of the basis.
+
+The ratio test is Harris' two pass test with a pivot tolerance relative to
+the pivot column: among the rows whose ratio is within a small feasibility
+tolerance of the smallest one it takes the largest pivot element. A pivot
+that is still small relative to its column starts a new factorization at
+once. A basis that turns out numerically singular at refactorization has
+its dependent columns replaced by the artificial variables of the rows they
+leave uncovered, and phase one restarts if the repaired basis is infeasible.
+"""
+import hashlib
+
+import numpy as np
+
+from src.algorithms.simplex_method.limits import Budget, CyclingGuard
+from src.algorithms.simplex_method.pivot_rules import DANTZIG, STEEPEST_EDGE, BLAND, PIVOT_RULES, \
+    UNKNOWN_PIVOT_RULE_MSG
+
+REFACTOR_INTERVAL = 64
+"""Number of eta columns after which the basis inverse is recomputed"""
+
+TOLERANCE = 1e-9
+"""Reduced costs and pivot elements closer to zero are treated as zero"""
+
+PIVOT_TOLERANCE = 1e-7
+"""Pivot elements smaller than this fraction of the largest entry of the pivot column are rejected"""
+
+SMALL_PIVOT = 1e-4
+"""A pivot element smaller than this fraction of the largest entry of the pivot column
+triggers refactorization right after the pivot"""
+
+MAX_CONDITION = 1e12
+"""Kernels of the basis with a larger estimate of the condition number are treated as singular"""
+
+MAX_TRIANGULAR_ROUNDS = 64
+"""The largest number of rounds of column and of row singleton elimination, the rest of a long
+triangular chain is left to the dense bump so that a solve makes few vector operations"""
+
+INCORRECT_INPUT_MSG = 'Некорректные входные данные'
+OTHER_PROBLEM_MSG = 'Базис получен для другой задачи'
+UNBOUNDED_MSG = 'Эта таблица бесконечна'
+NO_SOLUTION_MSG = 'Решения нет'
+
+
+class SparseMatrix:
+    """A matrix in compressed sparse column form.
+
+    Parameters:
+        - indptr: entries of column j are data[indptr[j]:indptr[j + 1]]
+        - indices: row indices of the entries
+        - data: values of the entries
+        - shape: (rows, columns)"""
+
+    def __init__(self, indptr, indices, data, shape):
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.shape = shape
+        # column index of every entry, used to reduce A^T y column-wise
+        self.columns = np.repeat(np.arange(shape[1]), np.diff(indptr))
+
+    @classmethod
+    def from_triplets(cls, rows, columns, values, shape):
+        rows = np.asarray(rows, dtype=np.int64)
+        columns = np.asarray(columns, dtype=np.int64)
+        values = np.asarray(values, dtype=float)
+        if not (len(rows) == len(columns) == len(values)):
+            raise ValueError(INCORRECT_INPUT_MSG)
+        if len(rows) and (rows.min() < 0 or rows.max() >= shape[0] or columns.min() < 0 or columns.max() >= shape[1]):
+            raise ValueError(INCORRECT_INPUT_MSG)
+        # entries with the same position are summed
+        keys, inverse = np.unique(columns * shape[0] + rows, return_inverse=True)
+        data = np.bincount(inverse, weights=values, minlength=len(keys))
+        keep = data != 0
+        keys, data = keys[keep], data[keep]
+        indptr = np.zeros(shape[1] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(keys // shape[0], minlength=shape[1]), out=indptr[1:])
+        return cls(indptr, keys % shape[0], data, shape)
+
+    @classmethod
+    def from_dense(cls, matrix):
+        matrix = np.asarray(matrix, dtype=float)
+        columns, rows = np.nonzero(matrix.T)
+        return cls.from_triplets(rows, columns, matrix[rows, columns], matrix.shape)
+
+    def nonzeros(self, columns):
+        """Number of entries in each of the given columns"""
+        return self.indptr[columns + 1] - self.indptr[columns]
+
+    def column(self, j):
+        """Dense copy of column j"""
+        result = np.zeros(self.shape[0])
+        start, end = self.indptr[j], self.indptr[j + 1]
+        result[self.indices[start:end]] = self.data[start:end]
+        return result
+
+    def rmatvec(self, y):
+        """A^T y"""
+        return np.bincount(self.columns, weights=self.data * y[self.indices], minlength=self.shape[1])
+
+    def handle(self):
+        """Identifier of the matrix: equal matrices have equal handles whatever
+        the order in which their entries were given"""
+        digest = hashlib.sha256(np.asarray(self.shape, dtype=np.int64).tobytes())
+        for array in (self.indptr, self.indices, self.data):
+            digest.update(np.ascontiguousarray(array).tobytes())
+        return digest.hexdigest()[:32]
+
+    def dense_columns(self, columns):
+        """Dense matrix made of the given columns"""
+        result = np.zeros((self.shape[0], len(columns)))
+        for k, j in enumerate(columns):
+            start, end = self.indptr[j], self.indptr[j + 1]
+            result[self.indices[start:end], k] = self.data[start:end]
+        return result
+
+
+class RevisedSimplexModel:
+    """Solve min c·x, A x = b, x >= 0.
+
+    A primal feasible basis is improved by the primal simplex method. A basis
+    that is only dual feasible, such as the optimal basis of the same problem
+    with another b, is first made primal feasible by the dual simplex method.
+    Without a basis, or with a basis that is neither, the solver starts with
+    phase one: rows with b_i < 0 are negated and an artificial variable is
+    added to every row, the sum of the artificial variables is minimized,
+    and a positive minimum proves the problem infeasible. The phase one basis
+    is crashed from the unit columns of the problem (slacks in particular),
+    artificial variables are basic only in the rows left uncovered.
+
+    Parameters:
+        - c: costs of the variables
+        - matrix: the constraint matrix A as a SparseMatrix
+        - b: the right hand side
+        - basic_var: indexes (from 0) of the initial basic variables, one per row, or None;
+          n + i stands for the artificial variable of a redundant row i, which stays at zero level
+        - pivot_rule: the rule choosing the entering column, dantzig by default;
+          steepest_edge is approximated with Devex reference weights
+        - budget: the iteration and time budget, a default Budget if not given
+
+    Attributes:
+        - basic_var: a numpy array containing indexes of the current basic variables
+        - x_basic: values of the basic variables
+        - solution: the values of all the variables if the problem is solved
+        - z: the optimal value if exists
+        - optimal, unbounded, infeasible: boolean values
+        - iterations: the number of pivot operations performed
+        - shadow_prices: the dual values y = c_B B^-1 of the optimal basis
+        - reduced_costs: the reduced costs c - y A of the optimal basis"""
+
+    def __init__(self, c, matrix, b, basic_var=None, pivot_rule=DANTZIG, budget=None):
+        if pivot_rule not in PIVOT_RULES:
+            raise ValueError(UNKNOWN_PIVOT_RULE_MSG)
+        m, n = matrix.shape
+        self.c = np.asarray(c, dtype=float)
+        self.matrix = matrix
+        self.b = np.asarray(b, dtype=float)
+        if len(self.c) != n or len(self.b) != m:
+            raise ValueError(INCORRECT_INPUT_MSG)
+        self.pivot_rule = pivot_rule
+        self.budget = budget or Budget()
+        self.solution = []
+        self.z = 0
+        self.optimal = False
+        self.unbounded = False
+        self.infeasible = False
+        self.iterations = 0
+        self.shadow_prices = []
+        self.reduced_costs = []
+        self.__columns = n
+        self.__signs = np.ones(m)
+        self.__blocked = np.arange(0)
+        self.__guard = CyclingGuard()
+        self.__weights = np.ones(n)
+        self.__restarted = False
+        self.__phase_one = basic_var is None
+        if self.__phase_one:
+            self.__start_phase_one()
+            return
+        self.basic_var = np.array(basic_var, dtype=np.int64)
+        if (len(self.basic_var) != m or len(set(self.basic_var.tolist())) != m or
+                (m and (self.basic_var.min() < 0 or self.basic_var.max() >= n + m))):
+            raise ValueError(INCORRECT_INPUT_MSG)
+        if m and self.basic_var.max() >= n:
+            # the basis of a problem with redundant rows left by phase one: as in phase two,
+            # the artificial variables never enter the basis again
+            self.__add_artificials()
+            self.c = np.concatenate([self.__costs, np.zeros(m)])
+            self.__blocked = np.arange(n, n + m)
+            self.__weights = np.ones(n + m)
+        self.refactor()
+
+    def solve(self):
+        '''
+        Chooses the primal or the dual simplex method or phase one depending on the initial basis
+        '''
+        if not self.__phase_one:
+            if self.__primal_feasible():
+                self.primal_simplex_method()
+            else:
+                d, _ = self.reduced_costs_and_prices()
+                if np.any(d < -TOLERANCE):
+                    self.__restart_phase_one()
+                else:
+                    self.dual_simplex_method()
+                    if not self.infeasible and not self.__restarted:
+                        self.primal_simplex_method()
+            # a singular basis sends the solver to phase one
+            if not self.__phase_one:
+                return
+        while True:
+            self.__restarted = False
+            self.primal_simplex_method()
+            if self.__restarted:
+                continue
+            if self.z > TOLERANCE * (1 + np.abs(self.b).max(initial=0)):
+                self.optimal = False
+                self.infeasible = True
+                return
+            self.__drive_out_artificials()
+            if self.__restarted:
+                continue
+            # phase two: the original costs, artificial variables never enter again
+            self.c = np.concatenate([self.__costs, np.zeros(self.matrix.shape[0])])
+            self.__blocked = np.arange(self.__columns, self.matrix.shape[1])
+            self.__weights = np.ones(self.matrix.shape[1])
+            self.optimal = False
+            self.primal_simplex_method()
+            if not self.__restarted:
+                return
+
+    def refactor(self):
+        '''
+        Factorizes the basis and recomputes the values of the basic variables
+        '''
+        matrix, m = self.matrix, self.matrix.shape[0]
+        # entries of the basis: row, position of the basic variable, value
+        counts = matrix.nonzeros(self.basic_var)
+        positions = np.repeat(np.arange(m), counts)
+        entries = (np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) +
+                   np.repeat(matrix.indptr[self.basic_var], counts))
+        rows, values = matrix.indices[entries], matrix.data[entries]
+        row_active, position_active = np.ones(m, dtype=bool), np.ones(m, dtype=bool)
+        # column singletons are solved last by ftran, row singletons of the rest first
+        lower = self.__singleton_rounds(positions, rows, values, position_active, row_active)
+        upper = self.__singleton_rounds(rows, positions, values, row_active, position_active)
+        kernel_rows, kernel_columns = np.flatnonzero(row_active), np.flatnonzero(position_active)
+        kernel = np.zeros((len(kernel_rows), len(kernel_columns)))
+        inside = row_active[rows] & position_active[positions]
+        kernel[np.searchsorted(kernel_rows, rows[inside]),
+               np.searchsorted(kernel_columns, positions[inside])] = values[inside]
+        kernel_inverse = self.__invert(kernel)
+        if kernel_inverse is None:
+            self.__repair(kernel, kernel_columns, kernel_rows)
+            return
+        # steps of ftran in order: (rows, positions, pivots or the inverse of the bump,
+        # entries of the rows outside the positions, entries of the positions outside the rows)
+        steps = [(step_rows, step_positions, pivots) for step_rows, step_positions, pivots in upper]
+        if len(kernel_rows):
+            steps.append((kernel_rows, kernel_columns, kernel_inverse))
+        steps += [(step_rows, step_positions, pivots) for step_positions, step_rows, pivots in reversed(lower)]
+        self.__steps = [(step_rows, step_positions, pivots,
+                         self.__coupling(rows, positions, values, step_rows, step_positions, m),
+                         self.__coupling(positions, rows, values, step_positions, step_rows, m))
+                        for step_rows, step_positions, pivots in steps]
+        self.__etas = []
+        self.x_basic = self.ftran(self.b)
+
+    @staticmethod
+    def __singleton_rounds(major, minor, values, major_active, minor_active):
+        '''
+        Eliminates the active major indexes with a single entry among the active minor ones,
+        returns the rounds (major indexes, minor indexes, pivots) and deactivates both
+        '''
+        rounds = []
+        counts = np.bincount(major[minor_active[minor]], minlength=len(major_active))
+        while len(rounds) < MAX_TRIANGULAR_ROUNDS:
+            single = np.flatnonzero(major_active[major] & minor_active[minor] & (counts[major] == 1))
+            if not single.size:
+                break
+            # a minor index is the pivot of one major index, the others wait for the next round
+            _, first = np.unique(minor[single], return_index=True)
+            single = single[first]
+            rounds.append((major[single], minor[single], values[single]))
+            major_active[major[single]] = False
+            minor_active[minor[single]] = False
+            removed = np.zeros(len(minor_active), dtype=bool)
+            removed[minor[single]] = True
+            counts -= np.bincount(major[removed[minor]], minlength=len(major_active))
+        return rounds
+
+    @staticmethod
+    def __coupling(major, minor, values, step_major, step_minor, size):
+        '''
+        Entries (local index of the major one, minor index, value) of the step's major indexes
+        outside its minor ones
+        '''
+        local = np.full(size, -1)
+        local[step_major] = np.arange(len(step_major))
+        outside = np.ones(size, dtype=bool)
+        outside[step_minor] = False
+        selected = (local[major] >= 0) & outside[minor]
+        return local[major[selected]], minor[selected], values[selected]
+
+    def ftran(self, a):
+        '''
+        Solves B v = a
+        '''
+        v = np.empty(self.matrix.shape[0])
+        for rows, positions, pivots, (local, others, values), _ in self.__steps:
+            rhs = a[rows] - np.bincount(local, weights=values * v[others], minlength=len(rows))
+            v[positions] = pivots @ rhs if pivots.ndim == 2 else rhs / pivots
+        for r, alpha in self.__etas:
+            v_r = v[r] / alpha[r]
+            v -= alpha * v_r
+            v[r] = v_r
+        return v
+
+    def btran(self, u):
+        '''
+        Solves y B = u
+        '''
+        u = np.array(u, dtype=float)
+        for r, alpha in reversed(self.__etas):
+            u[r] = (u[r] - (u @ alpha - u[r] * alpha[r])) / alpha[r]
+        y = np.empty(self.matrix.shape[0])
+        for rows, positions, pivots, _, (local, others, values) in reversed(self.__steps):
+            rhs = u[positions] - np.bincount(local, weights=values * y[others], minlength=len(positions))
+            y[rows] = rhs @ pivots if pivots.ndim == 2 else rhs / pivots
+        return y
+
+    def reduced_costs_and_prices(self):
+        y = self.btran(self.c[self.basic_var])
+        d = self.c - self.matrix.rmatvec(y)
+        d[self.basic_var] = 0
+        d[self.__blocked] = 0
+        return d, y
+
+    def primal_simplex_method(self):
+        '''
+        Solve the model with the primal revised simplex method.
+        '''
+        while not self.__restarted:
+            d, y = self.reduced_costs_and_prices()
+            negative = np.flatnonzero(d < -TOLERANCE)
+            if negative.size == 0:
+                self.__finish(d, y)
+                return
+            q = self.__entering_column(d, negative)
+            alpha = self.ftran(self.matrix.column(q))
+            r = self.__leaving_row(alpha)
+            if r is None:
+                self.unbounded = True
+                return
+            self.__guarded_pivot(r, q, alpha)
+
+    def dual_simplex_method(self):
+        '''
+        Restores primal feasibility of a dual feasible basis keeping it dual feasible
+        '''
+        m = self.matrix.shape[0]
+        while not self.__restarted:
+            r = int(np.argmin(self.x_basic))
+            if self.__primal_feasible():
+                return
+            # row r of B^-1 A
+            e_r = np.zeros(m)
+            e_r[r] = 1
+            row = self.matrix.rmatvec(self.btran(e_r))
+            row[self.basic_var] = 0
+            row[self.__blocked] = 0
+            candidates = np.flatnonzero(row < -TOLERANCE)
+            if candidates.size == 0:
+                # the row x_r = sum(row_j x_j) + x_basic[r] < 0 has no nonnegative solution
+                self.infeasible = True
+                return
+            d, _ = self.reduced_costs_and_prices()
+            ratios = np.maximum(d[candidates], 0) / -row[candidates]
+            q = candidates[np.argmin(ratios)]
+            self.__guarded_pivot(r, q, self.ftran(self.matrix.column(q)))
+
+    def pivot(self, r, q, alpha):
+        '''
+        Replaces the basic variable of row r with variable q whose column in terms of
+        the current basis is alpha
+        '''
+        if self.pivot_rule == STEEPEST_EDGE:
+            self.__update_weights(r, q, alpha)
+        theta = self.x_basic[r] / alpha[r]
+        self.x_basic -= theta * alpha
+        self.x_basic[r] = theta
+        self.basic_var[r] = q
+        self.__etas.append((r, alpha))
+        self.iterations += 1
+        # the error of an eta column grows as its pivot element shrinks
+        if len(self.__etas) >= REFACTOR_INTERVAL or abs(alpha[r]) < SMALL_PIVOT * np.abs(alpha).max():
+            self.refactor()
+        return theta
+
+    def get_solution(self):
+        if self.unbounded:
+            raise ValueError(UNBOUNDED_MSG)
+        elif self.infeasible:
+            raise ValueError(NO_SOLUTION_MSG)
+        return (self.solution, self.z,)
+
+    def __guarded_pivot(self, r, q, alpha):
+        self.budget.check(self.iterations)
+        theta = self.pivot(r, q, alpha)
+        if self.__guard.cycling(self.basic_var, theta == 0):
+            self.pivot_rule = BLAND
+
+    def __add_artificials(self):
+        '''
+        Negates the rows with b_i < 0 and appends an artificial variable to every row
+        '''
+        m, n = self.matrix.shape[0], self.__columns
+        self.__signs = np.where(self.b < 0, -1.0, 1.0)
+        matrix = self.matrix
+        self.matrix = SparseMatrix.from_triplets(
+            np.concatenate([matrix.indices, np.arange(m)]),
+            np.concatenate([matrix.columns, n + np.arange(m)]),
+            np.concatenate([matrix.data * self.__signs[matrix.indices], np.ones(m)]),
+            (m, n + m))
+        self.b = self.b * self.__signs
+        self.__costs = self.c
+
+    def __start_phase_one(self):
+        m, n = self.matrix.shape[0], self.__columns
+        self.__add_artificials()
+        self.c = np.concatenate([np.zeros(n), np.ones(m)])
+        self.basic_var = self.__crash_basis()
+        self.__weights = np.ones(n + m)
+        self.__phase_one = True
+        self.refactor()
+
+    def __restart_phase_one(self):
+        '''
+        Returns to phase one from the crash basis
+        '''
+        self.__restarted = True
+        m, n = self.matrix.shape[0], self.__columns
+        if self.matrix.shape[1] == n:
+            # there are no artificial variables yet
+            self.__start_phase_one()
+            return
+        self.c = np.concatenate([np.zeros(n), np.ones(m)])
+        self.__blocked = np.arange(0)
+        self.__weights = np.ones(n + m)
+        self.basic_var = self.__crash_basis()
+        self.optimal = False
+        self.__phase_one = True
+        self.refactor()
+
+    def __repair(self, kernel, kernel_columns, kernel_rows):
+        '''
+        Replaces the basic columns that are (nearly) linear combinations of the others
+        with the artificial variables of the rows the others leave uncovered
+        '''
+        if self.matrix.shape[1] == self.__columns:
+            self.__restart_phase_one()
+            return
+        u, s, vt = np.linalg.svd(kernel)
+        small = max(int(np.sum(s <= s[0] / MAX_CONDITION)), 1)
+        # the null vectors tell which columns depend on the others and which rows they miss
+        columns = kernel_columns[self.__independent_rows(vt[-small:].T)]
+        rows = kernel_rows[self.__independent_rows(u[:, -small:])]
+        self.basic_var[columns] = self.__columns + rows
+        self.refactor()
+        if self.__restarted:
+            return
+        # in phase two the artificial variables have to stay at zero
+        artificial = self.basic_var >= self.__columns
+        if (not self.__primal_feasible() or
+                (self.__blocked.size and np.any(self.x_basic[artificial] > self.__feasibility_tolerance()))):
+            self.__restart_phase_one()
+
+    @staticmethod
+    def __independent_rows(vectors):
+        '''
+        Rows of a k x d matrix of rank d that form a nonsingular d x d submatrix, chosen greedily
+        by the largest remaining norm
+        '''
+        vectors = np.array(vectors)
+        rows = []
+        for _ in range(vectors.shape[1]):
+            r = int(np.argmax(np.einsum('ij,ij->i', vectors, vectors)))
+            rows.append(r)
+            direction = vectors[r] / np.linalg.norm(vectors[r])
+            vectors -= np.outer(vectors @ direction, direction)
+        return np.array(rows, dtype=np.int64)
+
+    @staticmethod
+    def __invert(kernel):
+        '''
+        Inverse of the kernel or None if it is numerically singular
+        '''
+        try:
+            inverse = np.linalg.inv(kernel)
+        except np.linalg.LinAlgError:
+            return None
+        if not kernel.size:
+            return inverse
+        # max|B| max|B^-1| of the equilibrated kernel R B C estimates its condition number,
+        # so that a badly scaled but well posed basis is not taken for a singular one
+        row_scale = 1 / np.abs(kernel).max(axis=1)
+        column_scale = 1 / np.abs(kernel * row_scale[:, None]).max(axis=0)
+        if not np.abs(inverse / np.outer(column_scale, row_scale)).max() < MAX_CONDITION:
+            return None
+        return inverse
+
+    def __crash_basis(self):
+        '''
+        Artificial basis in which a column with a single positive entry replaces the
+        artificial variable of its row: such a column is feasible at b_i / a_ij >= 0
+        '''
+        m, n, matrix = self.matrix.shape[0], self.__columns, self.matrix
+        columns = np.flatnonzero(matrix.nonzeros(np.arange(n)) == 1)
+        columns = columns[matrix.data[matrix.indptr[columns]] > 0]
+        rows, first = np.unique(matrix.indices[matrix.indptr[columns]], return_index=True)
+        basic_var = n + np.arange(m)
+        basic_var[rows] = columns[first]
+        return basic_var
+
+    def __drive_out_artificials(self):
+        '''
+        Replaces artificial variables left in the basis at zero level by original ones.
+        An artificial variable stays in the basis only if its row is redundant.
+        '''
+        for r in np.flatnonzero(self.basic_var >= self.__columns):
+            if self.__restarted:
+                return
+            e_r = np.zeros(self.matrix.shape[0])
+            e_r[r] = 1
+            row = self.matrix.rmatvec(self.btran(e_r))
+            row[self.__columns:] = 0
+            row[self.basic_var] = 0
+            q = int(np.argmax(np.abs(row)))
+            if abs(row[q]) > TOLERANCE:
+                self.pivot(r, q, self.ftran(self.matrix.column(q)))
+
+    def __primal_feasible(self):
+        return not np.any(self.x_basic < -self.__feasibility_tolerance())
+
+    def __feasibility_tolerance(self):
+        return TOLERANCE * (1 + np.abs(self.b).max(initial=0))
+
+    def __finish(self, d, y):
+        x = np.zeros(self.matrix.shape[1])
+        x[self.basic_var] = np.maximum(self.x_basic, 0)
+        self.optimal = True
+        self.solution = x[:self.__columns].tolist()
+        self.z = float(self.c @ x)
+        self.shadow_prices = (y * self.__signs).tolist()
+        self.reduced_costs = d[:self.__columns].tolist()
+
+    def __entering_column(self, d, negative):
+        if self.pivot_rule == DANTZIG:
+            return negative[np.argmin(d[negative])]
+        if self.pivot_rule == STEEPEST_EDGE:
+            return negative[np.argmin(d[negative] / np.sqrt(self.__weights[negative]))]
+        return negative[0]
+
+    def __leaving_row(self, alpha):
+        positive = alpha > TOLERANCE
+        if not positive.any():
+            return None
+        stable = alpha > PIVOT_TOLERANCE * np.abs(alpha).max()
+        if stable.any():
+            positive = stable
+        x = np.maximum(self.x_basic, 0)
+        ratios = np.full(alpha.shape, np.inf)
+        np.divide(x, alpha, out=ratios, where=positive)
+        if self.pivot_rule == BLAND:
+            rows = np.flatnonzero(ratios <= ratios.min() + TOLERANCE)
+            return rows[np.argmin(self.basic_var[rows])]
+        # Harris: every row whose ratio does not exceed the smallest ratio with the
+        # bounds relaxed by the feasibility tolerance may leave, the largest pivot is the most stable
+        relaxed = np.full(alpha.shape, np.inf)
+        np.divide(x + self.__feasibility_tolerance(), alpha, out=relaxed, where=positive)
+        rows = np.flatnonzero(ratios <= relaxed.min())
+        return rows[np.argmax(alpha[rows])]
+
+    def __update_weights(self, r, q, alpha):
+        # Devex: the pivot row of B^-1 A rescales the reference weights
+        e_r = np.zeros(len(alpha))
+        e_r[r] = 1
+        row = self.matrix.rmatvec(self.btran(e_r))
+        ratio = row / alpha[r]
+        weight_q = max(self.__weights[q], 1)
+        self.__weights = np.maximum(self.__weights, ratio * ratio * weight_q)
+        self.__weights[self.basic_var[r]] = max(weight_q / (alpha[r] * alpha[r]), 1)
@@ -1,6 +1,10 @@
 import unittest
+import warnings
+from unittest import mock
 
-from src.algorithms.simplex_method.function import main
+import numpy as np
+
+from src.algorithms.simplex_method.function import main, PIVOT_RULES, DANTZIG, STEEPEST_EDGE
 
 
 class TestCase(unittest.TestCase):
@@ -10,5 +14,437 @@ class TestCase(unittest.TestCase):
                    [24., 6., 4., 1., 0.],
                    [6., 3., -2., 0., 1.]]
         basic_var = [1, 2]
-        self.assertEqual({'optimal_solution': [0.0, 6.0, 0.0, 18.0], 'optimal_value': -6.0},
-                         main(tableau, basic_var))
+        result = main(tableau, basic_var)
+        self.assertEqual({'optimal_solution': [0.0, 6.0, 0.0, 18.0], 'optimal_value': -6.0, 'iterations': 3},
+                         {key: result[key] for key in ('optimal_solution', 'optimal_value', 'iterations')})
+        self.assertEqual([2, 4], result['basis'])
+        self.assertTrue(np.allclose([-0.25, 0.], result['shadow_prices']))
+        self.assertTrue(np.allclose([0.5, 0., 0.25, 0.], result['reduced_costs']))
+
+    def test_matches_loop_implementation(self):
+        from src.algorithms.simplex_method.benchmark import LoopSimplexModel, measure, random_tableau
+        from src.algorithms.simplex_method.function import SimplexModel
+        for seed in range(5):
+            tableau, basic_var = random_tableau(12, 20, seed)
+            _, expected = measure(LoopSimplexModel, tableau, basic_var)
+            _, actual = measure(SimplexModel, tableau, basic_var)
+            self.assertEqual(list(expected.basic_var), list(actual.basic_var))
+            self.assertTrue(np.allclose(expected.solution, actual.solution))
+            self.assertAlmostEqual(expected.z, actual.z)
+
+    def test_pivot_rules(self):
+        from src.algorithms.simplex_method.benchmark import random_tableau
+        for seed in range(5):
+            tableau, basic_var = random_tableau(15, 25, seed)
+            results = [main(tableau.tolist(), basic_var.tolist(), rule) for rule in PIVOT_RULES]
+            for result in results[1:]:
+                self.assertAlmostEqual(results[0]['optimal_value'], result['optimal_value'])
+                self.assertGreater(result['iterations'], 0)
+
+    def test_dantzig(self):
+        tableau = [[0., -1., -3., 0., 0.],
+                   [4., 1., 1., 1., 0.],
+                   [6., 1., 2., 0., 1.]]
+        result = main(tableau, [3, 4], DANTZIG)
+        self.assertEqual([0.0, 3.0, 1.0, 0.0], result['optimal_solution'])
+        self.assertEqual(-9.0, result['optimal_value'])
+        self.assertEqual(1, result['iterations'])
+        self.assertEqual(3, main(tableau, [3, 4])['iterations'])
+        self.assertEqual(1, main(tableau, [3, 4], STEEPEST_EDGE)['iterations'])
+
+    def test_large_ratio(self):
+        tableau = [[0., -1., 0., 0.],
+                   [300000., 1., 1., 0.],
+                   [200000., 1., 0., 1.]]
+        result = main(tableau, [2, 3])
+        self.assertEqual([200000.0, 100000.0, 0.0], result['optimal_solution'])
+
+    def test_unbounded(self):
+        tableau = [[0., -1., 1., 0.],
+                   [4., -1., 1., 1.]]
+        self.assertRaisesRegex(ValueError, 'Эта таблица бесконечна', main, tableau, [3])
+
+    def test_unknown_pivot_rule(self):
+        self.assertRaisesRegex(ValueError, 'Неизвестное правило', main, [[0., 1.]], [1], 'random')
+
+    def test_sparse_matches_tableau(self):
+        from src.algorithms.simplex_method.benchmark import random_sparse_problem, to_tableau
+        for seed in range(3):
+            problem = random_sparse_problem(20, 40, seed)
+            tableau, basic_var = to_tableau(problem)
+            for rule in PIVOT_RULES:
+                expected = main(tableau.tolist(), basic_var.tolist(), rule)
+                actual = main(basic_var=basic_var.tolist(), pivot_rule=rule,
+                              **{key: value.tolist() for key, value in problem.items() if key != 'basic_var'})
+                self.assertAlmostEqual(expected['optimal_value'], actual['optimal_value'])
+                self.assertEqual(60, len(actual['optimal_solution']))
+
+    def test_sparse(self):
+        # max x1 + x2 при x1 + 2 x2 <= 4, 3 x1 + x2 <= 6 с дополнительными x3, x4
+        result = main(basic_var=[3, 4], c=[-1., -1., 0., 0.], b=[4., 6.],
+                      a_rows=[0, 0, 0, 1, 1, 1], a_cols=[0, 1, 2, 0, 1, 3], a_values=[1., 2., 1., 3., 1., 1.])
+        self.assertTrue(np.allclose([1.6, 1.2, 0., 0.], result['optimal_solution']))
+        self.assertAlmostEqual(-2.8, result['optimal_value'])
+
+    def test_sparse_refactor(self):
+        from src.algorithms.simplex_method.benchmark import random_sparse_problem, measure_revised
+        from src.algorithms.simplex_method.revised import REFACTOR_INTERVAL
+        problem = random_sparse_problem(100, 300)
+        _, model = measure_revised(problem, pivot_rule=DANTZIG)
+        self.assertGreater(model.iterations, REFACTOR_INTERVAL)
+        matrix = np.zeros((100, 400))
+        matrix[problem['a_rows'], problem['a_cols']] = problem['a_values']
+        self.assertTrue(np.allclose(problem['b'], matrix @ model.solution))
+
+    def test_sparse_unbounded(self):
+        self.assertRaisesRegex(ValueError, 'Эта таблица бесконечна', main, basic_var=[2], c=[-1., 0.], b=[4.],
+                               a_rows=[0, 0], a_cols=[0, 1], a_values=[-1., 1.])
+
+    def test_sparse_infeasible(self):
+        self.assertRaisesRegex(ValueError, 'Решения нет', main, basic_var=[2], c=[-1., 0.], b=[-4.],
+                               a_rows=[0, 0], a_cols=[0, 1], a_values=[1., 1.])
+        self.assertRaisesRegex(ValueError, 'Решения нет', main, c=[1., 1.], b=[4., 5.],
+                               a_rows=[0, 0, 1, 1], a_cols=[0, 1, 0, 1], a_values=[1., 1., 1., 1.])
+
+    def test_sparse_incorrect_input(self):
+        self.assertRaisesRegex(ValueError, 'Некорректные входные данные', main, basic_var=[1], c=[-1.], b=[1.],
+                               a_rows=[0], a_cols=[1], a_values=[1.])
+        self.assertRaisesRegex(ValueError, 'Некорректные входные данные', main, [[0., 1.]], [1], c=[1.])
+
+    def test_warm_start_after_b_change(self):
+        from src.algorithms.simplex_method.benchmark import random_sparse_problem
+        problem = {key: value.tolist() for key, value in random_sparse_problem(60, 120, 1).items()}
+        basic_var = [i + 1 for i in problem.pop('basic_var')]
+        first = main(basic_var=basic_var, **problem)
+        problem['b'] = [value * (0.5 + (i % 3) / 2) for i, value in enumerate(problem['b'])]
+        cold = main(basic_var=basic_var, **problem)
+        warm = main(basic_var=first['basis'], problem_id=first['problem_id'], **problem)
+        self.assertAlmostEqual(cold['optimal_value'], warm['optimal_value'])
+        self.assertLess(warm['iterations'], cold['iterations'])
+
+    def test_warm_start_after_c_change(self):
+        tableau = [[0., -1., -3., 0., 0.],
+                   [4., 1., 1., 1., 0.],
+                   [6., 1., 2., 0., 1.]]
+        first = main(tableau, [3, 4])
+        tableau[0] = [0., -2., -3., 0., 0.]
+        warm = main(tableau, first['basis'], problem_id=first['problem_id'])
+        self.assertTrue(np.allclose([2., 2., 0., 0.], warm['optimal_solution']))
+        self.assertAlmostEqual(-10., warm['optimal_value'])
+        self.assertEqual(1, warm['iterations'])
+
+    def test_shadow_prices(self):
+        problem = dict(c=[-1., -1., 0., 0.], b=[4., 6.], a_rows=[0, 0, 0, 1, 1, 1],
+                       a_cols=[0, 1, 2, 0, 1, 3], a_values=[1., 2., 1., 3., 1., 1.])
+        result = main(basic_var=[3, 4], **problem)
+        self.assertEqual([1, 2], sorted(result['basis']))
+        self.assertTrue(np.allclose([-0.4, -0.2], result['shadow_prices']))
+        self.assertTrue(np.allclose([0., 0., 0.4, 0.2], result['reduced_costs']))
+        problem['b'] = [4.1, 6.]
+        changed = main(basic_var=result['basis'], problem_id=result['problem_id'], **problem)
+        self.assertAlmostEqual(result['optimal_value'] + 0.1 * result['shadow_prices'][0], changed['optimal_value'])
+        self.assertEqual(0, changed['iterations'])
+
+    def test_other_problem(self):
+        result = main([[0., -1., 0.], [4., 1., 1.]], [2])
+        self.assertRaisesRegex(ValueError, 'Базис получен для другой задачи', main,
+                               [[0., -1., 0.], [4., 2., 1.]], result['basis'], problem_id=result['problem_id'])
+
+    def test_two_phase(self):
+        # x1 + x2 = 4, x1 - x2 = 1 без начального базиса
+        result = main(c=[1., 2.], b=[4., 1.], a_rows=[0, 0, 1, 1], a_cols=[0, 1, 0, 1], a_values=[1., 1., 1., -1.])
+        self.assertTrue(np.allclose([2.5, 1.5], result['optimal_solution']))
+        self.assertAlmostEqual(5.5, result['optimal_value'])
+        self.assertEqual([1, 2], sorted(result['basis']))
+
+    def test_two_phase_negative_b_and_redundant_row(self):
+        # max x1 при -x1 - x2 = -4, 2 x1 + 2 x2 = 8, x1 + x3 = 3
+        result = main(c=[-1., 0., 0.], b=[-4., 8., 3.], a_rows=[0, 0, 1, 1, 2, 2], a_cols=[0, 1, 0, 1, 0, 2],
+                      a_values=[-1., -1., 2., 2., 1., 1.])
+        self.assertTrue(np.allclose([3., 1., 0.], result['optimal_solution']))
+        self.assertAlmostEqual(-3., result['optimal_value'])
+
+    def test_two_phase_tableau(self):
+        tableau = [[0., -1., -1., 0., 0.],
+                   [24., 6., 4., 1., 0.],
+                   [6., 3., -2., 0., 1.]]
+        result = main(tableau)
+        self.assertAlmostEqual(-6., result['optimal_value'])
+        tableau[2] = [-6., -3., 2., 0., -1.]
+        self.assertAlmostEqual(-6., main(tableau, [3, 4])['optimal_value'])
+
+    def test_crash_basis(self):
+        from src.algorithms.simplex_method.benchmark import random_sparse_problem
+        from src.algorithms.simplex_method.revised import RevisedSimplexModel, SparseMatrix
+        problem = random_sparse_problem(100, 300)
+        matrix = SparseMatrix.from_triplets(problem['a_rows'], problem['a_cols'], problem['a_values'], (100, 400))
+        # одноэлементные столбцы, в том числе дополнительные переменные, заменяют все искусственные
+        model = RevisedSimplexModel(problem['c'], matrix, problem['b'])
+        self.assertTrue(np.all(model.basic_var < 400))
+        matrix = SparseMatrix.from_triplets([0, 0, 1, 1], [0, 1, 0, 1], [1., 1., 1., -1.], (2, 2))
+        self.assertEqual([2, 3], RevisedSimplexModel([1., 2.], matrix, [4., 1.]).basic_var.tolist())
+
+    def test_default_pivot_rule(self):
+        from src.algorithms.simplex_method.benchmark import random_sparse_problem, to_tableau
+        problem = random_sparse_problem(50, 100)
+        tableau, basic_var = to_tableau(problem)
+        sparse = {key: value.tolist() for key, value in problem.items() if key != 'basic_var'}
+        self.assertEqual(main(pivot_rule=DANTZIG, **sparse)['iterations'], main(**sparse)['iterations'])
+        self.assertEqual(main(tableau.tolist(), basic_var.tolist(), 'bland')['iterations'],
+                         main(tableau.tolist(), basic_var.tolist())['iterations'])
+
+    def test_singular_basis(self):
+        from src.algorithms.simplex_method.revised import RevisedSimplexModel, SparseMatrix
+        # первые два столбца пропорциональны
+        sparse = dict(c=[-1., -1., 0., 0.], a_rows=[0, 0, 0, 1, 1, 1], a_cols=[0, 1, 2, 0, 1, 3],
+                      a_values=[1., 2., 1., 1., 2., 1.])
+        result = main(basic_var=[1, 2], b=[4., 6.], **sparse)
+        self.assertTrue(np.allclose([4., 0., 0., 2.], result['optimal_solution']))
+        self.assertAlmostEqual(-4., result['optimal_value'])
+        # зависимый столбец заменяется искусственной переменной, допустимый базис сохраняется
+        matrix = SparseMatrix.from_triplets(sparse['a_rows'], sparse['a_cols'], sparse['a_values'], (2, 4))
+        model = RevisedSimplexModel(sparse['c'], matrix, [4., 4.])
+        model.basic_var[:] = [0, 1]
+        model.refactor()
+        self.assertEqual(1, np.sum(model.basic_var >= 4))
+        self.assertTrue(np.allclose([4., 4.], matrix.dense_columns(np.arange(4))[:, model.basic_var[model.basic_var < 4]]
+                                    @ model.x_basic[model.basic_var < 4]))
+        model.solve()
+        self.assertAlmostEqual(-4., model.get_solution()[1])
+
+    def test_block_triangular_factorization(self):
+        from src.algorithms.simplex_method.benchmark import random_sparse_problem
+        from src.algorithms.simplex_method.revised import RevisedSimplexModel, SparseMatrix
+        problem = random_sparse_problem(200, 600)
+        matrix = SparseMatrix.from_triplets(problem['a_rows'], problem['a_cols'], problem['a_values'], (200, 800))
+        model = RevisedSimplexModel(problem['c'], matrix, problem['b'])
+        model.solve()
+        # итоговый базис содержит и одноэлементные столбцы, и плотно обращаемый блок
+        model.refactor()
+        basis = matrix.dense_columns(model.basic_var)
+        a = np.random.default_rng(0).normal(size=200)
+        self.assertTrue(np.allclose(np.linalg.solve(basis, a), model.ftran(a)))
+        self.assertTrue(np.allclose(np.linalg.solve(basis.T, a), model.btran(a)))
+
+    def test_large_sparse_steepest_edge(self):
+        from src.algorithms.simplex_method.benchmark import random_sparse_problem
+        problem = random_sparse_problem(1000, 3000)
+        sparse = {key: value.tolist() for key, value in problem.items() if key != 'basic_var'}
+        result = main(pivot_rule=STEEPEST_EDGE, **sparse)
+        x = np.array(result['optimal_solution'])
+        matrix = np.zeros((1000, 4000))
+        matrix[problem['a_rows'], problem['a_cols']] = problem['a_values']
+        self.assertTrue(np.allclose(problem['b'], matrix @ x))
+        self.assertTrue(np.all(x >= 0))
+        # оптимальность: двойственная допустимость и равенство значений прямой и двойственной задач
+        self.assertTrue(np.all(np.array(result['reduced_costs']) > -1e-7))
+        self.assertAlmostEqual(result['optimal_value'], problem['b'] @ result['shadow_prices'], places=6)
+
+    def test_cycling(self):
+        # пример Била: правило Данцига с выбором первой строки зацикливается
+        tableau = [[0., 0., 0., 0., -0.75, 20., -0.5, 6.],
+                   [0., 1., 0., 0., 0.25, -8., -1., 9.],
+                   [0., 0., 1., 0., 0.5, -12., -0.5, 3.],
+                   [1., 0., 0., 1., 0., 0., 1., 0.]]
+        for rule in PIVOT_RULES:
+            result = main(tableau, [1, 2, 3], rule)
+            self.assertAlmostEqual(-1.25, result['optimal_value'])
+            self.assertTrue(np.allclose([0.75, 0., 0., 1., 0., 1., 0.], result['optimal_solution']))
+
+    def test_iteration_limit(self):
+        from src.algorithms.simplex_method.benchmark import random_sparse_problem
+        problem = {key: value.tolist() for key, value in random_sparse_problem(30, 60).items()}
+        problem['basic_var'] = [var + 1 for var in problem['basic_var']]
+        self.assertRaisesRegex(ValueError, 'Превышено допустимое количество итераций', main,
+                               max_iterations=3, **problem)
+        tableau, basic_var = random_tableau_for_limit()
+        self.assertRaisesRegex(ValueError, 'Превышено допустимое количество итераций', main,
+                               tableau, basic_var, max_iterations=3)
+
+    def test_time_limit(self):
+        from src.algorithms.simplex_method.benchmark import random_sparse_problem
+        problem = {key: value.tolist() for key, value in random_sparse_problem(30, 60).items()}
+        problem['basic_var'] = [var + 1 for var in problem['basic_var']]
+        self.assertRaisesRegex(ValueError, 'Превышено допустимое количество итераций', main,
+                               time_limit=1e-9, **problem)
+
+    def test_presolve(self):
+        from src.algorithms.simplex_method.presolve import Presolve
+        from src.algorithms.simplex_method.revised import SparseMatrix
+        # повторная строка, строка x3 = 1, вынуждающая строка x2 + x4 = 0,
+        # пустая строка и пустой столбец x5
+        a = np.array([[1., 1., 1., 0., 0., 1.],
+                      [2., 2., 2., 0., 0., 2.],
+                      [0., 0., 1., 0., 0., 0.],
+                      [0., 1., 0., 1., 0., 0.],
+                      [0., 0., 0., 0., 0., 0.]])
+        c, b = [-1., -2., 0., 1., 1., -3.], [4., 8., 1., 0., 0.]
+        presolve = Presolve(c, SparseMatrix.from_dense(a), b)
+        self.assertEqual([0], presolve.rows.tolist())
+        self.assertEqual([0, 5], presolve.columns.tolist())
+        a_rows, a_cols = np.nonzero(a)
+        problem = dict(c=c, b=b, a_rows=a_rows.tolist(), a_cols=a_cols.tolist(), a_values=a[a_rows, a_cols].tolist())
+        result = main(**problem)
+        self.assertTrue(np.allclose([0., 0., 1., 0., 0., 3.], result['optimal_solution']))
+        self.assertAlmostEqual(-9., result['optimal_value'])
+        self.assertTrue(np.allclose(np.array(c) - a.T @ result['shadow_prices'], result['reduced_costs']))
+        self.assertTrue(np.all(np.array(result['reduced_costs']) >= -1e-9))
+        warm = main(basic_var=result['basis'], problem_id=result['problem_id'], **problem)
+        self.assertEqual(0, warm['iterations'])
+
+    def test_presolve_empty_column_scaling(self):
+        from src.algorithms.simplex_method.presolve import Presolve
+        from src.algorithms.simplex_method.revised import SparseMatrix
+        # пустой столбец x3 с отрицательной стоимостью остаётся в задаче
+        a = np.array([[1., 1., 0.], [1., 2., 0.]])
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            presolve = Presolve([-1., -1., -1.], SparseMatrix.from_dense(a), [1., 1.])
+        self.assertEqual([0, 1, 2], presolve.columns.tolist())
+
+    def test_presolve_infeasible(self):
+        # x1 = -1
+        self.assertRaisesRegex(ValueError, 'Решения нет', main, c=[1., 1.], b=[2., -1.],
+                               a_rows=[0, 0, 1], a_cols=[0, 1, 0], a_values=[1., 1., 1.])
+        # x1 + x2 = 2 и 2 x1 + 2 x2 = 5
+        self.assertRaisesRegex(ValueError, 'Решения нет', main, c=[1., 1.], b=[2., 5.],
+                               a_rows=[0, 0, 1, 1], a_cols=[0, 1, 0, 1], a_values=[1., 1., 2., 2.])
+
+    def test_presolve_scaled(self):
+        from src.algorithms.simplex_method.benchmark import redundant_problem, measure_presolve
+        for seed in range(3):
+            problem = redundant_problem(20, 40, seed)
+            _, plain = measure_presolve(problem, False)
+            _, reduced = measure_presolve(problem, True)
+            self.assertLess(reduced.matrix.shape[0], len(problem['b']))
+            result = main(**{key: value.tolist() for key, value in problem.items()})
+            self.assertAlmostEqual(1, result['optimal_value'] / plain.z)
+            a = np.zeros((len(problem['b']), len(problem['c'])))
+            a[problem['a_rows'], problem['a_cols']] = problem['a_values']
+            self.assertTrue(np.allclose(problem['b'], a @ result['optimal_solution']))
+            self.assertTrue(np.all(np.array(result['reduced_costs']) >= -1e-6 * np.abs(problem['c'])))
+
+    def test_integer_knapsack(self):
+        import itertools
+        values, weights, capacity = [10., 13., 7., 8., 9., 4.], [5., 7., 4., 5., 6., 3.], 14.
+        n = len(values)
+        # w·x + s = capacity, x_i + t_i = 1
+        a_rows = [0] * (n + 1) + [1 + i for i in range(n) for _ in range(2)]
+        a_cols = list(range(n + 1)) + [column for i in range(n) for column in (i, n + 1 + i)]
+        a_values = weights + [1.] + [1.] * 2 * n
+        problem = dict(c=[-value for value in values] + [0.] * (n + 1), b=[capacity] + [1.] * n,
+                       a_rows=a_rows, a_cols=a_cols, a_values=a_values)
+        best = max(sum(v * x for v, x in zip(values, choice)) for choice in itertools.product((0, 1), repeat=n)
+                   if sum(w * x for w, x in zip(weights, choice)) <= capacity)
+        result = main(integer_var=list(range(1, n + 1)), **problem)
+        self.assertAlmostEqual(-best, result['optimal_value'])
+        self.assertTrue(all(x in (0., 1.) for x in result['optimal_solution'][:n]))
+        self.assertEqual(0., result['gap'])
+        self.assertGreater(result['nodes'], 1)
+        self.assertIsNone(result.get('basis'))
+        self.assertLess(main(**problem)['optimal_value'], result['optimal_value'])
+
+    def test_mixed_integer(self):
+        # max 3 x1 + 4 x2 при 2 x1 + 3 x2 <= 7.5, x1 <= 2.2, целом x2
+        tableau = [[0., -3., -4., 0., 0.],
+                   [7.5, 2., 3., 1., 0.],
+                   [2.2, 1., 0., 0., 1.]]
+        result = main(tableau, [3, 4], integer_var=[2])
+        self.assertTrue(np.allclose([2.2, 1., 0.1, 0.], result['optimal_solution']))
+        self.assertAlmostEqual(-10.6, result['optimal_value'])
+        result = main(tableau, [3, 4], integer_var=[1, 2])
+        self.assertAlmostEqual(-10., result['optimal_value'])
+
+    def test_integer_diving(self):
+        # сильно коррелированный рюкзак: лучшая граница без погружения не находит целого решения за 20 узлов
+        random = np.random.default_rng(0)
+        n = 40
+        weights = random.integers(10, 100, n).astype(float)
+        values, capacity = weights + 10, weights.sum() // 2
+        a_rows = [0] * (n + 1) + [1 + i for i in range(n) for _ in range(2)]
+        a_cols = list(range(n + 1)) + [column for i in range(n) for column in (i, n + 1 + i)]
+        a_values = weights.tolist() + [1.] + [1.] * 2 * n
+        with mock.patch('src.algorithms.simplex_method.branch_and_bound.MAX_NODES', 20):
+            result = main(c=(-values).tolist() + [0.] * (n + 1), b=[capacity] + [1.] * n, a_rows=a_rows,
+                          a_cols=a_cols, a_values=a_values, integer_var=list(range(1, n + 1)))
+        x = np.array(result['optimal_solution'][:n])
+        self.assertTrue(np.all((x == 0.) | (x == 1.)))
+        self.assertLessEqual(weights @ x, capacity)
+        self.assertAlmostEqual(-values @ x, result['optimal_value'])
+        self.assertLess(result['gap'], 0.05)
+
+    def test_integer_redundant_row(self):
+        # третья строка - сумма первых двух, первая фаза оставляет в базисе искусственную переменную
+        a = np.array([[1., 2., 1., 0.], [3., 1., 0., 1.], [4., 3., 1., 1.]])
+        a_rows, a_cols = np.nonzero(a)
+        problem = dict(c=[-1., -1., 0., 0.], b=[3.5, 5.5, 9.], a_rows=a_rows.tolist(), a_cols=a_cols.tolist(),
+                       a_values=a[a_rows, a_cols].tolist())
+        relaxation = main(**problem)
+        self.assertEqual([2, 1], relaxation['basis'])
+        warm = main(basic_var=relaxation['basis'], problem_id=relaxation['problem_id'], **problem)
+        self.assertAlmostEqual(relaxation['optimal_value'], warm['optimal_value'])
+        result = main(integer_var=[1, 2], **problem)
+        self.assertTrue(np.allclose([1., 1.], result['optimal_solution'][:2]))
+        self.assertAlmostEqual(-2., result['optimal_value'])
+        self.assertEqual(0., result['gap'])
+
+    def test_branch_matrix(self):
+        from src.algorithms.simplex_method.branch_and_bound import branch_matrix
+        from src.algorithms.simplex_method.revised import SparseMatrix
+        a = np.array([[1., 0., 2., 0.],
+                      [0., 3., 0., 4.]])
+        columns, values = np.array([2, 0, 2]), np.array([1., -1., -2.])
+        extended = branch_matrix(SparseMatrix.from_dense(a), columns, values)
+        expected = np.zeros((5, 7))
+        expected[:2, :4] = a
+        expected[2 + np.arange(3), columns] = values
+        expected[2 + np.arange(3), 4 + np.arange(3)] = 1.
+        self.assertTrue(np.array_equal(expected, extended.dense_columns(np.arange(7))))
+        self.assertEqual(SparseMatrix.from_dense(expected).columns.tolist(), extended.columns.tolist())
+
+    def test_time_budget(self):
+        import time
+        from src.algorithms_manager import ALGORITHMS
+        from src.algorithms.simplex_method.limits import Budget, TIME_LIMIT
+        self.assertLessEqual(Budget(time_limit=2 * TIME_LIMIT).deadline, time.monotonic() + TIME_LIMIT)
+        self.assertGreater(Budget(time_limit=2 * TIME_LIMIT, time_budget=3 * TIME_LIMIT).deadline,
+                           time.monotonic() + TIME_LIMIT)
+        self.assertLessEqual(Budget(time_budget=1.).deadline, time.monotonic() + 1.)
+        spec = ALGORITHMS['simplex_method']
+        self.assertEqual({'c': [1.], 'time_budget': 24.}, spec.with_time_budget({'c': [1.]}, 24.))
+        self.assertEqual({'c': [1.]}, spec.with_time_budget({'c': [1.]}, 0))
+
+    def test_integer_infeasible(self):
+        # 2 x1 + 2 x2 = 3 не имеет целых решений
+        self.assertRaisesRegex(ValueError, 'Решения нет', main, c=[1., 1.], b=[3.], a_rows=[0, 0], a_cols=[0, 1],
+                               a_values=[2., 2.], integer_var=[1, 2])
+        self.assertRaisesRegex(ValueError, 'Некорректные входные данные', main, c=[1., 1.], b=[3.],
+                               a_rows=[0, 0], a_cols=[0, 1], a_values=[2., 2.], integer_var=[3])
+
+    def test_interrupted_result_is_not_cached(self):
+        from src.algorithms_manager import ALGORITHMS
+        spec = ALGORITHMS['simplex_method']
+        self.assertTrue(spec.is_cacheable({'optimal_value': -6.}))
+        self.assertTrue(spec.is_cacheable({'optimal_value': -6., 'gap': 0.}))
+        self.assertFalse(spec.is_cacheable({'optimal_value': -6., 'gap': 0.25}))
+
+    def test_integer_parallel(self):
+        from src.algorithms.simplex_method.branch_and_bound import BranchAndBound
+        from src.algorithms.simplex_method.revised import SparseMatrix
+        a = np.array([[3., 5., 4., 2., 1., 0.],
+                      [2., 1., 3., 4., 0., 1.]])
+        c, b = np.array([-5., -6., -7., -4., 0., 0.]), np.array([10.5, 9.5])
+        results = []
+        for workers in (1, 2):
+            model = BranchAndBound(c, SparseMatrix.from_dense(a), b, [0, 1, 2, 3], workers=workers)
+            model.solve()
+            results.append(model.z)
+            self.assertEqual(0., model.gap)
+        self.assertAlmostEqual(results[0], results[1])
+        self.assertAlmostEqual(-17., results[0])
+
+
+def random_tableau_for_limit():
+    from src.algorithms.simplex_method.benchmark import random_tableau
+    tableau, basic_var = random_tableau(30, 60)
+    return tableau.tolist(), basic_var.tolist()
@@ -1,30 +1,26 @@
-def findcountstring(text: str, findtext: str) -> int:
+from src.algorithms.substring_in_a_string.matcher import Matcher, StreamCounter, count_piece, AUTO
+
+
+def findcountstring(text: str, findtext: str, mode: str = AUTO) -> int:
     if type(text) != str or type(findtext) != str:
         raise ValueError("Значения не строковые")
+    return Matcher(findtext, mode).count(text)
 
-    count = 0
-
-    if len(findtext) == 1:
-        return text.lower().count(findtext)
-    find_text_split = findtext.lower().split(" ")
-    text_split = text.lower().split(" ")
 
-    num = 0
+def main(text, findtext, mode=AUTO):
+    """Количество вхождений findtext в text без учёта регистра. Режим mode:
+    word - целые слова подряд, substring - последовательность символов,
+    auto - word для строки из нескольких слов, иначе substring"""
+    return {"num_count": findcountstring(text, findtext, mode)}
 
-    for i in range(len(text_split)):
-        num = 0
-        for j in range(len(find_text_split)):
-            if find_text_split[j] in text_split[i]:
-                num += 1
-                i += 1
-        if num == len(find_text_split):
-            count += 1
 
-    return count
+class TextStream(StreamCounter):
+    """Потоковый режим: текст передаётся частями, а не параметром text"""
 
+    piece_function = staticmethod(count_piece)
 
-def main(text, findtext):
-    return {"num_count": findcountstring(text, findtext)}
+    def finish(self) -> dict[str, int]:
+        return {"num_count": self.total()}
 
 
 if __name__ == '__main__':
@@ -0,0 +1,205 @@
+"""Подсчёт вхождений строки поиска в текст.
+
+Текст и строка поиска приводятся к нижнему регистру. Поиск ведётся в одном
+из режимов:
+    - substring - строка поиска ищется как последовательность символов,
+      в том числе внутри слов;
+    - word - строка поиска и текст разбиваются на слова (TOKEN_PATTERN),
+      вхождение - это те же слова подряд, знаки препинания и пробелы между
+      словами не учитываются;
+    - auto - word для строки из нескольких слов, иначе substring.
+Вхождения не перекрываются, как у str.count.
+
+Для режима word каждое слово обрамляется пробелами с обеих сторон, так что
+в нормализованном тексте последовательность слов встречается только с
+границы слова до границы слова. Тогда оба режима сводятся к одному поиску
+подстроки count_matches. Начиная с Python 3.10 это str.count, который для
+длинных строк поиска использует алгоритм Two-Way и линеен по длине текста.
+В более ранних версиях str.count в худшем случае требует O(n·m) операций,
+поэтому строки поиска длиннее SHORT_PATTERN_LENGTH ищутся там алгоритмом
+Кнута-Морриса-Пратта (kmp_scan) - за линейное время, но в цикле Python.
+
+Текст, поступающий частями, считает StreamCounter. Незаконченное слово в
+конце части переносится в следующую, поэтому нормализованные части
+складываются в нормализованный текст. Вхождения внутри части считаются
+независимо (count_piece, в том числе в пуле процессов), а вхождения на
+границе частей - по сохранённым концам нормализованных частей длиной
+len(pattern) - 1. Так можно считать, только если вхождения не могут
+перекрываться, то есть у строки поиска нет собственной грани (префикс-
+функция Кнута-Морриса-Пратта); иначе части проходятся по порядку с учётом
+конца последнего вхождения. В памяти находятся только текущая часть и
+концы длиной в строку поиска.
+"""
+import re
+import sys
+
+WORD = 'word'
+SUBSTRING = 'substring'
+AUTO = 'auto'
+MODES = (WORD, SUBSTRING, AUTO)
+"""Режимы поиска"""
+
+TOKEN_PATTERN = re.compile(r'\w+')
+"""Слово: последовательность букв, цифр и знаков подчёркивания"""
+
+LAST_NON_WORD_PATTERN = re.compile(r'.*\W', re.DOTALL)
+"""Текст до последнего символа вне слова включительно: незаконченное слово в
+конце части начинается с end() совпадения. Поиск \w*\Z здесь не подходит:
+он пробует каждую позицию длинного слова и квадратичен по его длине"""
+
+LINEAR_STR_SEARCH = sys.version_info >= (3, 10)
+"""Поиск подстроки str.count и str.find линеен по длине текста"""
+
+SHORT_PATTERN_LENGTH = 32
+"""Строки поиска не длиннее этой ищутся str.count в любой версии Python:
+худший случай O(n·m) для них отличается от линейного небольшим множителем"""
+
+EMPTY_FINDTEXT_MSG = 'Строка для поиска пуста'
+UNKNOWN_MODE_MSG = 'Неизвестный режим поиска'
+
+
+class Matcher:
+    """Строка поиска, нормализованная для выбранного режима"""
+
+    def __init__(self, findtext: str, mode: str = AUTO):
+        if mode not in MODES:
+            raise ValueError(UNKNOWN_MODE_MSG)
+        findtext = findtext.lower()
+        tokens = TOKEN_PATTERN.findall(findtext)
+        if mode == AUTO:
+            mode = WORD if len(tokens) > 1 else SUBSTRING
+        if not (tokens if mode == WORD else findtext):
+            raise ValueError(EMPTY_FINDTEXT_MSG)
+        self.mode = mode
+        self.pattern = self.__join(tokens) if mode == WORD else findtext
+
+    def normalize(self, text: str) -> str:
+        text = text.lower()
+        return self.__join(TOKEN_PATTERN.findall(text)) if self.mode == WORD else text
+
+    def count(self, text: str) -> int:
+        return count_matches(self.normalize(text), self.pattern)
+
+    @staticmethod
+    def __join(tokens: list[str]) -> str:
+        # ' a  b  c ': граница слова - пробел, у каждого слова свои пробелы
+        return ' ' + '  '.join(tokens) + ' ' if tokens else ''
+
+
+class StreamCounter:
+    """Подсчёт вхождений в тексте, поступающем частями: части отделяются
+    split, считаются count_piece с аргументами piece_arguments и добавляются
+    по порядку add (либо всё вместе - feed), итог возвращает total. Если
+    parallel ложно, части передаются только feed"""
+
+    def __init__(self, findtext: str, mode: str = AUTO):
+        self.matcher = Matcher(findtext, mode)
+        self.findtext = findtext
+        self.mode = self.matcher.mode
+        self.count = 0
+        pattern = self.matcher.pattern
+        self.__edge_length = len(pattern) - 1
+        # общий пробел двух соседних слов не даёт вхождениям в режиме word перекрыться
+        self.parallel = border(pattern) <= (1 if self.mode == WORD else 0)
+        # слово длиннее любого слова строки поиска не совпадёт ни с одним из них
+        self.__longest_word = max(map(len, TOKEN_PATTERN.findall(pattern)), default=0)
+        self.__partial = ''
+        self.__edge = ''
+
+    def split(self, chunk: str) -> str:
+        """Часть текста, которую можно обрабатывать независимо от следующих"""
+        if self.mode != WORD:
+            return chunk
+        text = self.__partial + chunk
+        match = LAST_NON_WORD_PATTERN.match(text)
+        start = match.end() if match else 0
+        # от слова, которое уже не совпадёт, достаточно хранить начало
+        self.__partial = text[start:start + self.__longest_word + 1]
+        return text[:start]
+
+    def piece_arguments(self, piece: str) -> dict[str, str]:
+        return {'text': piece, 'findtext': self.findtext, 'mode': self.mode}
+
+    def add(self, result: tuple[int, str, str]) -> None:
+        """Учитывает результат count_piece для следующей по порядку части"""
+        count, head, tail = result
+        joined = self.__edge + head
+        self.count += count + count_matches(joined, self.matcher.pattern)
+        self.__edge = tail if len(head) == self.__edge_length else joined[max(0, len(joined) - self.__edge_length):]
+
+    def feed(self, piece: str) -> None:
+        if self.parallel:
+            self.add(count_piece(**self.piece_arguments(piece)))
+            return
+        text = self.__edge + self.matcher.normalize(piece)
+        count, end = scan_matches(text, self.matcher.pattern)
+        self.count += count
+        self.__edge = text[max(end, len(text) - self.__edge_length):]
+
+    def total(self) -> int:
+        if self.__partial:
+            # в конце текста незаконченное слово закончено
+            partial, self.__partial = self.__partial, ''
+            self.feed(partial)
+        return self.count
+
+
+def count_piece(text: str, findtext: str, mode: str) -> tuple[int, str, str]:
+    """Количество вхождений в части текста и начало и конец её нормализованного
+    вида длиной len(pattern) - 1 для поиска вхождений на границах частей"""
+    matcher = Matcher(findtext, mode)
+    normalized = matcher.normalize(text)
+    edge = len(matcher.pattern) - 1
+    return count_matches(normalized, matcher.pattern), normalized[:edge], normalized[max(0, len(normalized) - edge):]
+
+
+def count_matches(text: str, pattern: str) -> int:
+    """Количество неперекрывающихся вхождений pattern в text"""
+    if LINEAR_STR_SEARCH or len(pattern) <= SHORT_PATTERN_LENGTH:
+        return text.count(pattern)
+    return kmp_scan(text, pattern)[0]
+
+
+def scan_matches(text: str, pattern: str) -> tuple[int, int]:
+    """Количество неперекрывающихся вхождений pattern в text, найденных слева
+    направо, и конец последнего из них (0, если вхождений нет)"""
+    if not LINEAR_STR_SEARCH and len(pattern) > SHORT_PATTERN_LENGTH:
+        return kmp_scan(text, pattern)
+    count = position = end = 0
+    while (position := text.find(pattern, position)) >= 0:
+        count += 1
+        position = end = position + len(pattern)
+    return count, end
+
+
+def kmp_scan(text: str, pattern: str) -> tuple[int, int]:
+    """scan_matches алгоритмом Кнута-Морриса-Пратта: не больше 2n сравнений
+    символов при любой строке поиска"""
+    prefix = prefix_function(pattern)
+    count = end = k = 0
+    for i, char in enumerate(text):
+        while k and char != pattern[k]:
+            k = prefix[k - 1]
+        if char == pattern[k]:
+            k += 1
+        if k == len(pattern):
+            # следующее вхождение начинается после этого
+            count, end, k = count + 1, i + 1, 0
+    return count, end
+
+
+def prefix_function(pattern: str) -> list[int]:
+    """Префикс-функция Кнута-Морриса-Пратта: длины наибольших собственных
+    граней всех префиксов строки"""
+    prefix = [0] * len(pattern)
+    for i in range(1, len(pattern)):
+        k = prefix[i - 1]
+        while k and pattern[i] != pattern[k]:
+            k = prefix[k - 1]
+        prefix[i] = k + (pattern[i] == pattern[k])
+    return prefix
+
+
+def border(pattern: str) -> int:
+    """Длина наибольшей собственной грани строки"""
+    return prefix_function(pattern)[-1] if pattern else 0
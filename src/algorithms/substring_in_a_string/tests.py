@@ -1,7 +1,21 @@
+import time
 import unittest
+from unittest import mock
 
 
-from src.algorithms.substring_in_a_string.function import main
+from src.algorithms.substring_in_a_string.function import main, TextStream
+from src.algorithms.substring_in_a_string.matcher import kmp_scan, scan_matches
+
+
+def stream_count(text: str, findtext: str, mode: str, size: int, parallel: bool = True) -> dict[str, int]:
+    stream = TextStream(findtext, mode)
+    for start in range(0, len(text), size):
+        piece = stream.split(text[start:start + size])
+        if parallel and stream.parallel:
+            stream.add(stream.piece_function(**stream.piece_arguments(piece)))
+        else:
+            stream.feed(piece)
+    return stream.finish()
 
 
 class TestCase(unittest.TestCase):
@@ -25,6 +39,84 @@ class TestCase(unittest.TestCase):
     def test_equal_texts(self):
         self.assertEqual(main("texts", "texts"), {'num_count': 1})
 
+    def test_words(self):
+        text = "Hello, world! Hello   world\nhelloworld hello worlds"
+        self.assertEqual(main(text, "hello world", "word"), {'num_count': 2})
+        self.assertEqual(main(text, "hello world", "substring"), {'num_count': 1})
+        self.assertEqual(main(text, "world", "word"), {'num_count': 2})
+        self.assertEqual(main(text, "world", "substring"), {'num_count': 4})
+
+    def test_multi_word_sequence(self):
+        # слова строки поиска должны идти подряд и в том же порядке
+        self.assertEqual(main("one two three two one three", "two one", "word"), {'num_count': 1})
+        self.assertEqual(main("one two three", "three two", "word"), {'num_count': 0})
+
+    def test_not_overlapping(self):
+        self.assertEqual(main("aaaa", "aa", "substring"), {'num_count': 2})
+        self.assertEqual(main("a a a a a", "a a", "word"), {'num_count': 2})
+
+    def test_wrong_parameters(self):
+        self.assertRaisesRegex(ValueError, 'Строка для поиска пуста', main, "text", "")
+        self.assertRaisesRegex(ValueError, 'Строка для поиска пуста', main, "text", "...", "word")
+        self.assertRaisesRegex(ValueError, 'Неизвестный режим поиска', main, "text", "t", "regex")
+
+    def test_large_text(self):
+        text = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 20000
+        start = time.perf_counter()
+        self.assertEqual(main(text, "dolor sit", "word"), {'num_count': 20000})
+        self.assertEqual(main(text, "or", "substring"), {'num_count': 40000})
+        self.assertLess(time.perf_counter() - start, 2)
+
+    def test_kmp_scan(self):
+        # алгоритм для строк поиска длиннее SHORT_PATTERN_LENGTH до Python 3.10
+        import random
+        rnd = random.Random(1)
+        for _ in range(2000):
+            text = ''.join(rnd.choice('ab') for _ in range(rnd.randrange(40)))
+            pattern = ''.join(rnd.choice('ab') for _ in range(rnd.randrange(1, 5)))
+            self.assertEqual(scan_matches(text, pattern), kmp_scan(text, pattern), (text, pattern))
+        text, pattern = 'a' * 10 ** 5, 'a' * 1000 + 'b' + 'a' * 1000
+        start = time.perf_counter()
+        self.assertEqual((0, 0), kmp_scan(text, pattern))
+        self.assertLess(time.perf_counter() - start, 1)
+        findtext = "lorem ipsum dolor sit amet consectetur"
+        text = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 100
+        with mock.patch('src.algorithms.substring_in_a_string.matcher.LINEAR_STR_SEARCH', False):
+            self.assertEqual({'num_count': 100}, main(text, findtext))
+            self.assertEqual({'num_count': 100}, stream_count(text, findtext, "word", 7))
+
+    def test_stream_matches_whole_text(self):
+        text = "Hello, world! Hello   world\nhelloworld hello worlds. aaaa a a a a a ab aba"
+        for findtext, mode in (("hello world", "word"), ("world", "substring"), ("aa", "substring"),
+                               ("a a", "word"), ("aba", "auto"), ("o", "auto")):
+            expected = main(text, findtext, mode)
+            for size in (1, 2, 3, 5, 8, len(text)):
+                for parallel in (True, False):
+                    self.assertEqual(stream_count(text, findtext, mode, size, parallel), expected,
+                                     (findtext, mode, size, parallel))
+
+    def test_stream_parallel_only_without_overlaps(self):
+        # вхождения "aa" в "aaa" перекрываются, части считаются по порядку
+        self.assertFalse(TextStream("aa", "substring").parallel)
+        self.assertTrue(TextStream("ab", "substring").parallel)
+        self.assertTrue(TextStream("hello world", "word").parallel)
+        self.assertFalse(TextStream("a a", "word").parallel)
+        self.assertFalse(TextStream("a b a", "word").parallel)
+
+    def test_stream_split_long_token(self):
+        # незаконченное слово ищется за линейное время
+        stream = TextStream("hello world", "word")
+        start = time.perf_counter()
+        self.assertEqual("ab" * 500000 + " ", stream.split("ab" * 500000 + " tail"))
+        self.assertEqual("", stream.split("x" * 1000000))
+        self.assertLess(time.perf_counter() - start, 1)
+
+    def test_stream_long_word(self):
+        # от слова длиннее строки поиска хранится только начало
+        text = "x" * 10000 + " hello world " + "y" * 10000
+        self.assertEqual(stream_count(text, "hello world", "word", 7), {'num_count': 1})
+        self.assertEqual(stream_count(text, "xx yy", "word", 7), {'num_count': 0})
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,177 +1,481 @@
+import asyncio
+import codecs
+import json
+import logging
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Callable, Iterator, Optional
+
 from fastapi import HTTPException
-from sqlalchemy import select
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import to_json
 from starlette import status
+from starlette.concurrency import run_in_threadpool
+
+from src.schemas.algorithms import (FibonacciInputVariables, FibonacciOutputVariables,
+                                    FibonacciListInputVariables, FibonacciListOutputVariables,
+                                    MatrixPairInputVariables, MatrixInputVariables,
+                                    MatrixSolveInputVariables, MatrixOutputVariables, MatrixDetOutputVariables,
+                                    MatrixSolveOutputVariables,
+                                    QuadraticEquationInputVariables, QuadraticEquationOutputVariables,
+                                    SubstringInStringInputVariables, SubstringInStringOutputVariables,
+                                    PerfectNumbersInputVariables, PerfectNumbersOutputVariables,
+                                    FuelConsumptionInputVariables, FuelConsumptionOutputVariables,
+                                    SimplexMethodInputVariables, SimplexMethodOutputVariables)
 
-from src.schemas.algorithms import (FibonacciOutputVariables, MatrixSubOutputVariables,
-                                    FibonacciListOutputVariables,
-                                    QuadraticEquationOutputVariables,
-                                    SubstringInStringOutputVariables,
-                                    PerfectNumbersOutputVariables,
-                                    FuelConsumptionOutputVariables, SimplexMethodOutputVariables)
-
-from src.algorithms.fibonacci.function import fibonacci
-from src.algorithms.fibonacci_list.function import fibonacci as fibonacci_list
-from src.algorithms.fuel_consumption.function import main as fuel_consumption
-from src.algorithms.matrix_sub.function import main as matrix_sub
-from src.algorithms.perfect_numbers.function import main as perfect_numbers
-from src.algorithms.quadratic_equation.function import main as quadratic_equation
-from src.algorithms.substring_in_a_string.function import main as substring_in_a_string
-from src.algorithms.simplex_method.function import main as simplex_method
-
-from src.database import async_session_maker
+from src.algorithms.fibonacci.function import main as fibonacci, NOT_NATURAL_MSG as FIBONACCI_NOT_NATURAL_MSG
+from src.algorithms.fibonacci_list.function import main as fibonacci_list, fibonacci_window, \
+    NEGATIVE_WINDOW_MSG as FIBONACCI_LIST_NEGATIVE_WINDOW_MSG, TOO_LARGE_WINDOW_MSG as FIBONACCI_LIST_TOO_LARGE_WINDOW_MSG
+from src.algorithms.fuel_consumption.function import main as fuel_consumption, \
+    main_batch as fuel_consumption_batch
+from src.algorithms.matrix_sub.function import main as matrix_sub, main_file as matrix_sub_file
+from src.algorithms.matrix_add.function import main as matrix_add, main_file as matrix_add_file
+from src.algorithms.matrix_mul.function import main as matrix_mul, main_file as matrix_mul_file
+from src.algorithms.matrix_transpose.function import main as matrix_transpose, main_file as matrix_transpose_file
+from src.algorithms.matrix_det.function import main as matrix_det
+from src.algorithms.matrix_inv.function import main as matrix_inv
+from src.algorithms.matrix_solve.function import main as matrix_solve
+from src.algorithms.matrix_engine import MATRIX_LENGTHS_MSG, WRONG_COLUMNS_MSG, MISSING_VALUE_MSG, EMPTY_MATRIX_MSG, \
+    NOT_SQUARE_MSG, NOT_MULTIPLIABLE_MSG, SINGULAR_MSG, TOO_LARGE_MSG, NOT_NUMERIC_MSG
+from src.algorithms.perfect_numbers.function import main as perfect_numbers, \
+    EMPTY_LIST_MSG as PERFECT_NUMBERS_EMPTY_LIST_MSG, RANGE_INCOMPLETE_MSG as PERFECT_NUMBERS_RANGE_INCOMPLETE_MSG, \
+    RANGE_INVALID_MSG as PERFECT_NUMBERS_RANGE_INVALID_MSG, RANGE_TOO_LARGE_MSG as PERFECT_NUMBERS_RANGE_TOO_LARGE_MSG, \
+    NUMBER_TOO_LARGE_MSG as PERFECT_NUMBERS_NUMBER_TOO_LARGE_MSG
+from src.algorithms.quadratic_equation.function import main as quadratic_equation, \
+    main_batch as quadratic_equation_batch
+from src.algorithms.substring_in_a_string.function import main as substring_in_a_string, \
+    TextStream as SubstringInStringTextStream
+from src.algorithms.substring_in_a_string.matcher import EMPTY_FINDTEXT_MSG as SUBSTRING_EMPTY_FINDTEXT_MSG, \
+    UNKNOWN_MODE_MSG as SUBSTRING_UNKNOWN_MODE_MSG
+from src.algorithms.simplex_method.function import main as simplex_method, is_complete as simplex_method_is_complete, \
+    UNKNOWN_PIVOT_RULE_MSG as SIMPLEX_METHOD_UNKNOWN_PIVOT_RULE_MSG
+from src.algorithms.simplex_method.revised import INCORRECT_INPUT_MSG as SIMPLEX_METHOD_INCORRECT_INPUT_MSG, \
+    OTHER_PROBLEM_MSG as SIMPLEX_METHOD_OTHER_PROBLEM_MSG
+from src.algorithms.simplex_method.limits import BUDGET_EXCEEDED_MSG as SIMPLEX_METHOD_BUDGET_EXCEEDED_MSG
+
+from src import TIME_OVER_MSG, EXECUTE_TIMEOUT, EXECUTE_TIMEOUTS, BATCH_MAX_SIZE, MSGPACK_MEDIA_TYPE
+from src.algorithm_spec import AlgorithmSpec
+from src.algorithms_registry import algorithms_registry
+from src.cache import result_cache
+from src.config import settings
 from src.errors import ErrorMessages
-from src.models import Calculations
+from src.executor import algorithm_executor, call_each, AlgorithmTimeoutError, THREAD, PROCESS
+from src.spool import spool
+from src.wire_formats import decode, MSGPACK_AVAILABLE
 
+MATRIX_ERRORS = (
+    (ValueError, MATRIX_LENGTHS_MSG, ErrorMessages.THE_LENGTHS_OF_THE_MATRICES_DO_NOT_MATCH),
+    (ValueError, WRONG_COLUMNS_MSG, ErrorMessages.INCORRECT_NUMBER_OF_MATRIX_COLUMNS),
+    (ValueError, MISSING_VALUE_MSG, ErrorMessages.NO_VALUE_ENTERED_IN_THE_MATRIX),
+    (ValueError, EMPTY_MATRIX_MSG, ErrorMessages.THE_MATRIX_IS_EMPTY),
+    (ValueError, NOT_SQUARE_MSG, ErrorMessages.THE_MATRIX_IS_NOT_SQUARE),
+    (ValueError, NOT_MULTIPLIABLE_MSG, ErrorMessages.THE_MATRICES_CANNOT_BE_MULTIPLIED),
+    (ValueError, SINGULAR_MSG, ErrorMessages.THE_MATRIX_IS_SINGULAR),
+    (ValueError, TOO_LARGE_MSG, ErrorMessages.THE_RESULT_IS_TOO_LARGE),
+    (ValueError, NOT_NUMERIC_MSG, ErrorMessages.THE_FILE_IS_NOT_A_NUMERIC_MATRIX),
+)
+"""Ошибки матричных алгоритмов, общие для всех операций matrix_engine"""
 
-class AlgorithmsManager:
+ALGORITHMS: dict[str, AlgorithmSpec] = {spec.name: spec for spec in (
+    AlgorithmSpec('fibonacci', fibonacci, FibonacciInputVariables, FibonacciOutputVariables,
+                  errors=(
+                      (ValueError, FIBONACCI_NOT_NATURAL_MSG, ErrorMessages.THE_NUMBER_MUST_BE_NATURAL),
+                      (ValueError, None, ErrorMessages.THE_NUMBER_IS_TOO_LARGE),
+                  ),
+                  backend=THREAD),
+    AlgorithmSpec('fibonacci_list', fibonacci_list, FibonacciListInputVariables, FibonacciListOutputVariables,
+                  errors=(
+                      (ValueError, FIBONACCI_LIST_NEGATIVE_WINDOW_MSG,
+                       ErrorMessages.THE_OFFSET_AND_LIMIT_CANNOT_BE_NEGATIVE),
+                      (ValueError, FIBONACCI_LIST_TOO_LARGE_WINDOW_MSG, ErrorMessages.THE_REQUESTED_SLICE_IS_TOO_LARGE),
+                      (ValueError, None, ErrorMessages.THE_NUMBER_IS_TOO_LARGE),
+                  ),
+                  backend=THREAD,
+                  stream_function=fibonacci_window),
+    AlgorithmSpec('perfect_numbers', perfect_numbers, PerfectNumbersInputVariables, PerfectNumbersOutputVariables,
+                  errors=(
+                      (ValueError, PERFECT_NUMBERS_EMPTY_LIST_MSG, ErrorMessages.THE_LIST_OF_NUMBERS_IS_EMPTY),
+                      (ValueError, 'Список чисел содержит отрицательное значение',
+                       ErrorMessages.THE_LIST_OF_NUMBERS_CONTAINS_NEGATIVE_VALUE),
+                      (ValueError, PERFECT_NUMBERS_RANGE_INCOMPLETE_MSG, ErrorMessages.BOTH_RANGE_BOUNDS_ARE_REQUIRED),
+                      (ValueError, PERFECT_NUMBERS_RANGE_INVALID_MSG, ErrorMessages.INVALID_RANGE_BOUNDS),
+                      (ValueError, PERFECT_NUMBERS_RANGE_TOO_LARGE_MSG, ErrorMessages.THE_RANGE_IS_TOO_LARGE),
+                      (ValueError, PERFECT_NUMBERS_NUMBER_TOO_LARGE_MSG, ErrorMessages.THE_NUMBER_IS_TOO_LARGE),
+                  ),
+                  backend=PROCESS),
+    AlgorithmSpec('matrix_sub', matrix_sub, MatrixPairInputVariables, MatrixOutputVariables,
+                  errors=MATRIX_ERRORS, backend=THREAD, file_function=matrix_sub_file),
+    AlgorithmSpec('matrix_add', matrix_add, MatrixPairInputVariables, MatrixOutputVariables,
+                  errors=MATRIX_ERRORS, backend=THREAD, file_function=matrix_add_file),
+    AlgorithmSpec('matrix_mul', matrix_mul, MatrixPairInputVariables, MatrixOutputVariables,
+                  errors=MATRIX_ERRORS, backend=THREAD, file_function=matrix_mul_file),
+    AlgorithmSpec('matrix_transpose', matrix_transpose, MatrixInputVariables, MatrixOutputVariables,
+                  errors=MATRIX_ERRORS, backend=THREAD, file_function=matrix_transpose_file),
+    AlgorithmSpec('matrix_det', matrix_det, MatrixInputVariables, MatrixDetOutputVariables,
+                  errors=MATRIX_ERRORS, backend=THREAD),
+    AlgorithmSpec('matrix_inv', matrix_inv, MatrixInputVariables, MatrixOutputVariables,
+                  errors=MATRIX_ERRORS, backend=THREAD),
+    AlgorithmSpec('matrix_solve', matrix_solve, MatrixSolveInputVariables, MatrixSolveOutputVariables,
+                  errors=MATRIX_ERRORS, backend=THREAD),
+    AlgorithmSpec('fuel_consumption', fuel_consumption, FuelConsumptionInputVariables,
+                  FuelConsumptionOutputVariables,
+                  errors=(
+                      (ValueError, None, ErrorMessages.THE_PARAMETER_VALUE_IS_LESS_THAN_ZERO),
+                  ),
+                  batch_function=fuel_consumption_batch),
+    AlgorithmSpec('quadratic_equation', quadratic_equation, QuadraticEquationInputVariables,
+                  QuadraticEquationOutputVariables,
+                  errors=(
+                      (TypeError, None, ErrorMessages.THE_COEFFICIENTS_MUST_BE_NUMBERS),
+                      (ValueError, None, ErrorMessages.THE_COEFFICIENT_FOR_X2_CANNOT_BE_EQUAL_TO_0),
+                  ),
+                  batch_function=quadratic_equation_batch),
+    AlgorithmSpec('substring_in_a_string', substring_in_a_string, SubstringInStringInputVariables,
+                  SubstringInStringOutputVariables,
+                  errors=(
+                      (ValueError, SUBSTRING_EMPTY_FINDTEXT_MSG, ErrorMessages.THE_SEARCH_TEXT_IS_EMPTY),
+                      (ValueError, SUBSTRING_UNKNOWN_MODE_MSG, ErrorMessages.UNKNOWN_SEARCH_MODE),
+                  ),
+                  backend=THREAD,
+                  text_function=SubstringInStringTextStream),
+    AlgorithmSpec('simplex_method', simplex_method, SimplexMethodInputVariables, SimplexMethodOutputVariables,
+                  errors=(
+                      (ValueError, 'Эта таблица бесконечна', ErrorMessages.THIS_TABLE_IS_ENDLESS),
+                      (ValueError, 'Решения нет', ErrorMessages.THERE_IS_NO_SOLUTION),
+                      (ValueError, SIMPLEX_METHOD_UNKNOWN_PIVOT_RULE_MSG, ErrorMessages.UNKNOWN_PIVOT_RULE),
+                      (ValueError, SIMPLEX_METHOD_BUDGET_EXCEEDED_MSG, ErrorMessages.THE_ITERATION_OR_TIME_LIMIT_IS_EXCEEDED),
+                      (ValueError, SIMPLEX_METHOD_OTHER_PROBLEM_MSG, ErrorMessages.THE_BASIS_BELONGS_TO_ANOTHER_PROBLEM),
+                      (ValueError, SIMPLEX_METHOD_INCORRECT_INPUT_MSG, ErrorMessages.INCORRECT_INPUT_DATA),
+                      (IndexError, None, ErrorMessages.INCORRECT_INPUT_DATA),
+                  ),
+                  backend=PROCESS,
+                  cacheable=simplex_method_is_complete,
+                  time_budget='time_budget'),
+)}
+"""Реализованные алгоритмы: добавление алгоритма сводится к новой записи"""
 
-    @classmethod
-    async def fibonacci_result(cls, **parameters) -> FibonacciOutputVariables:
-        await cls.__is_algorithm_exist('fibonacci')
-        n = parameters.get('n')
-        res = fibonacci(n)
-        return FibonacciOutputVariables(result=res)
+STREAM_CHUNK_SIZE = 64 * 1024
+"""Размер буфера потокового ответа в байтах"""
 
-    @classmethod
-    async def fibonacci_list_result(cls, **parameters) -> FibonacciListOutputVariables:
-        await cls.__is_algorithm_exist('fibonacci_list')
-        n = parameters.get('n')
-        res = fibonacci_list(n)
-        return FibonacciListOutputVariables(result=res)
+TEXT_PIECE_SIZE = 1 << 20
+"""Размер части текста потокового режима в символах"""
 
-    @classmethod
-    async def perfect_numbers_result(cls, **parameters) -> PerfectNumbersOutputVariables:
-        await cls.__is_algorithm_exist('perfect_numbers')
-        numbers = parameters.get('numbers')
-        try:
-            result = perfect_numbers(numbers)
-            result = PerfectNumbersOutputVariables(**result)
-            return result
-        except ValueError as e:
-            exception_message = str(e)
-            if exception_message == 'Список чисел пуст':
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=ErrorMessages.THE_LIST_OF_NUMBERS_IS_EMPTY,
-                )
-            if exception_message == 'Список чисел содержит отрицательное значение':
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=ErrorMessages.THE_LIST_OF_NUMBERS_CONTAINS_NEGATIVE_VALUE,
-                )
+TEXT_PIECES_IN_FLIGHT = 4
+"""Наибольшее количество частей текста, вычисляемых в пуле процессов
+одновременно: вместе с TEXT_PIECE_SIZE ограничивает память запроса"""
+
+TIME_BUDGET_SHARE = 0.8
+"""Доля execute_timeout, передаваемая алгоритмам с параметром time_budget:
+остаток уходит на передачу ответа из рабочего процесса"""
+
+FILES_ADAPTER = TypeAdapter(dict[str, str])
+"""Тело запроса к алгоритму над файлами: идентификаторы файлов параметров"""
+
+
+class AlgorithmsManager:
 
     @classmethod
-    async def matrix_sub_result(cls, **parameters) -> MatrixSubOutputVariables:
-        await cls.__is_algorithm_exist('matrix_sub')
-        n = parameters.get('n')
-        m = parameters.get('m')
+    async def execute(cls, name: str, body: bytes, media_type: Optional[str] = None,
+                      accept: Optional[str] = None) -> bytes:
+        """Выполняет алгоритм. media_type - двоичный формат тела запроса,
+        accept - формат ответа (wire_formats), None - JSON"""
+        spec = cls.get_spec(name)
         try:
-            result = matrix_sub(n, m)
-            result = MatrixSubOutputVariables(**result)
-            return result
-        except ValueError as e:
-            exception_message = str(e)
-            if exception_message == 'Длины матриц не совпадают!':
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=ErrorMessages.THE_LENGTHS_OF_THE_MATRICES_DO_NOT_MATCH,
-                )
-            if 'Введено неверное количество столбцов для' in exception_message:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=ErrorMessages.INCORRECT_NUMBER_OF_MATRIX_COLUMNS,
-                )
-            if 'Не введено значение в матрице' in exception_message:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=ErrorMessages.NO_VALUE_ENTERED_IN_THE_MATRIX,
-                )
+            if media_type is None:
+                parameters = spec.parse_parameters(body)
+            else:
+                parameters = spec.parse_values(cls.__decode(body, media_type))
+        except ValidationError as e:
+            raise RequestValidationError(e.errors())
+        cached = await result_cache.get(name, parameters, accept)
+        if cached is not None:
+            return cached
+        try:
+            result = await cls.__run(spec, spec.function, spec.with_time_budget(parameters, cls.__time_budget(name)))
+        except HTTPException:
+            raise
+        except Exception as e:
+            http_exception = spec.to_http_exception(e)
+            if http_exception is None:
+                raise
+            raise http_exception
+        try:
+            serialized = spec.serialize_result(result, accept)
+        except ValueError:
+            # двоичные форматы не вмещают, например, целые длиннее 64 бит
+            raise HTTPException(
+                status_code=status.HTTP_406_NOT_ACCEPTABLE,
+                detail=ErrorMessages.THE_RESULT_CANNOT_BE_ENCODED,
+            )
+        if spec.is_cacheable(result):
+            await result_cache.set(name, parameters, serialized, accept)
+        return serialized
 
-    @classmethod
-    async def fuel_consumption_result(cls, **parameters) -> FuelConsumptionOutputVariables:
-        await cls.__is_algorithm_exist('fuel_consumption')
-        distance = parameters.get('distance')
-        mean_consumption = parameters.get('mean_consumption')
-        price = parameters.get('price')
-        need_round = parameters.get('need_round')
+    @staticmethod
+    def __decode(body: bytes, media_type: str) -> dict[str, Any]:
+        if media_type == MSGPACK_MEDIA_TYPE and not MSGPACK_AVAILABLE:
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                detail=ErrorMessages.THE_MEDIA_TYPE_IS_NOT_SUPPORTED,
+            )
         try:
-            result = fuel_consumption(distance, mean_consumption, price, need_round)
-            result = FuelConsumptionOutputVariables(**result)
-            return result
+            return decode(body, media_type)
         except ValueError:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=ErrorMessages.THE_PARAMETER_VALUE_IS_LESS_THAN_ZERO,
+                detail=ErrorMessages.THE_REQUEST_BODY_CANNOT_BE_DECODED,
             )
 
     @classmethod
-    async def quadratic_equation_result(cls, **parameters) -> QuadraticEquationOutputVariables:
-        await cls.__is_algorithm_exist('quadratic_equation')
-        a = parameters.get('a')
-        b = parameters.get('b')
-        c = parameters.get('c')
+    def stream(cls, name: str, body: bytes) -> Optional[Iterator[bytes]]:
+        """Возвращает генератор частей ответа в формате NDJSON (по одному
+        элементу списка в строке) либо None, если алгоритм не поддерживает
+        потоковый ответ.
+
+        Элементы вычисляются в пуле потоков вне executor, поэтому время
+        ответа ограничивается здесь же: по истечении execute_timeout
+        алгоритма ответ завершается строкой с ошибкой
+        ALGORITHM_EXECUTION_TIME_IS_OVER - код состояния к этому моменту уже
+        отправлен."""
+        spec = cls.get_spec(name)
+        if spec.stream_function is None:
+            return None
         try:
-            result = quadratic_equation(a, b, c)
-            result = QuadraticEquationOutputVariables(**result)
-            return result
-        except TypeError:
+            parameters = spec.parse_parameters(body)
+        except ValidationError as e:
+            raise RequestValidationError(e.errors())
+        try:
+            elements = spec.stream_function(**parameters)
+        except Exception as e:
+            http_exception = spec.to_http_exception(e)
+            if http_exception is None:
+                raise
+            raise http_exception
+        timeout = cls.timeout_for(name)
+        return cls.__ndjson_chunks(name, elements, time.monotonic() + timeout if timeout > 0 else None)
+
+    @staticmethod
+    def __ndjson_chunks(name: str, elements: Iterator[Any], deadline: Optional[float]) -> Iterator[bytes]:
+        # Элементы группируются, чтобы не передавать каждый из них
+        # из пула потоков в цикл событий по отдельности
+        buffer = bytearray()
+        for element in elements:
+            buffer += to_json(element)
+            buffer += b'\n'
+            if deadline is not None and time.monotonic() > deadline:
+                logging.getLogger(__name__).warning('%s: %s', name, TIME_OVER_MSG)
+                buffer += to_json({'error': ErrorMessages.ALGORITHM_EXECUTION_TIME_IS_OVER}) + b'\n'
+                break
+            if len(buffer) >= STREAM_CHUNK_SIZE:
+                yield bytes(buffer)
+                buffer.clear()
+        if buffer:
+            yield bytes(buffer)
+
+    @classmethod
+    async def execute_files(cls, name: str, body: bytes) -> bytes:
+        """Выполняет матричный алгоритм над загруженными файлами.
+
+        Тело запроса - JSON-объект с идентификаторами файлов для параметров
+        алгоритма, ответ содержит идентификатор файла результата file_id и
+        размер результата shape.
+        """
+        spec = cls.get_spec(name)
+        if spec.file_function is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=ErrorMessages.THE_COEFFICIENTS_MUST_BE_NUMBERS,
+                detail=ErrorMessages.THE_ALGORITHM_DOES_NOT_ACCEPT_FILES,
             )
-        except ValueError:
+        try:
+            files = FILES_ADAPTER.validate_json(body)
+        except ValidationError as e:
+            raise RequestValidationError(e.errors())
+        required = [parameter for parameter, field in spec.input_model.model_fields.items() if field.is_required()]
+        missing = [{'type': 'missing', 'loc': ('body', parameter), 'msg': 'Field required'}
+                   for parameter in required if parameter not in files]
+        if missing:
+            raise RequestValidationError(missing)
+        parameters = {parameter: spool.path(files[parameter]) for parameter in required}
+        file_id, parameters['result'] = spool.create()
+        try:
+            with spool.use([files[parameter] for parameter in required] + [file_id]):
+                result = await cls.__run(spec, spec.file_function, parameters, spool.execute_timeout)
+        except HTTPException:
+            spool.remove(file_id)
+            raise
+        except Exception as e:
+            spool.remove(file_id)
+            http_exception = spec.to_http_exception(e)
+            if http_exception is None:
+                raise
+            raise http_exception
+        spool.commit(file_id)
+        return to_json({'file_id': file_id, **result})
+
+    @classmethod
+    async def execute_text(cls, name: str, chunks: AsyncIterator[bytes], query: dict[str, str]) -> bytes:
+        """Выполняет алгоритм над текстом в кодировке UTF-8, поступающим
+        частями chunks, остальные параметры передаются в query.
+
+        Текст собирается в части по TEXT_PIECE_SIZE символов. Если части
+        независимы, они вычисляются в пуле процессов, не больше
+        TEXT_PIECES_IN_FLIGHT одновременно, и учитываются по порядку; иначе
+        учитываются по очереди в пуле потоков. Память не зависит от размера
+        текста.
+        """
+        spec = cls.get_spec(name)
+        if spec.text_function is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=ErrorMessages.THE_COEFFICIENT_FOR_X2_CANNOT_BE_EQUAL_TO_0,
+                detail=ErrorMessages.THE_ALGORITHM_DOES_NOT_ACCEPT_TEXT_STREAMS,
             )
+        try:
+            parameters = spec.parse_item({**query, spec.text_parameter: ''})
+        except ValidationError as e:
+            raise RequestValidationError(e.errors())
+        del parameters[spec.text_parameter]
+        # символ UTF-8 может быть разрезан между частями тела запроса
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        pending: deque = deque()
+        try:
+            stream = spec.text_function(**parameters)
+            buffer, size = [], 0
+            async for chunk in chunks:
+                buffer.append(decoder.decode(chunk))
+                size += len(buffer[-1])
+                if size >= TEXT_PIECE_SIZE:
+                    await cls.__add_piece(spec, stream, ''.join(buffer), pending)
+                    buffer, size = [], 0
+            buffer.append(decoder.decode(b'', final=True))
+            await cls.__add_piece(spec, stream, ''.join(buffer), pending)
+            while pending:
+                stream.add(await pending.popleft())
+            result = await run_in_threadpool(stream.finish)
+        except HTTPException:
+            raise
+        except Exception as e:
+            http_exception = spec.to_http_exception(e)
+            if http_exception is None:
+                raise
+            raise http_exception
+        finally:
+            # при ошибке или обрыве соединения оставшиеся части не нужны
+            for task in pending:
+                task.cancel()
+        return spec.serialize_result(result)
 
     @classmethod
-    async def substring_in_a_string_result(cls, **parameters) -> SubstringInStringOutputVariables:
-        await cls.__is_algorithm_exist('substring_in_a_string')
-        text = parameters.get('text')
-        findtext = parameters.get('findtext')
-        result = substring_in_a_string(text, findtext)
-        result = SubstringInStringOutputVariables(**result)
-        return result
+    async def __add_piece(cls, spec: AlgorithmSpec, stream: Any, chunk: str, pending: deque) -> None:
+        piece = await run_in_threadpool(stream.split, chunk)
+        if not piece:
+            return
+        if not stream.parallel:
+            await run_in_threadpool(stream.feed, piece)
+            return
+        # части вычисляются одновременно, но учитываются в порядке следования
+        pending.append(asyncio.ensure_future(
+            cls.__run(spec, stream.piece_function, stream.piece_arguments(piece), backend=PROCESS)))
+        while len(pending) >= TEXT_PIECES_IN_FLIGHT:
+            stream.add(await pending.popleft())
 
     @classmethod
-    async def simplex_method_result(cls, **parameters) -> SimplexMethodOutputVariables:
-        await cls.__is_algorithm_exist('simplex_method')
-        tableau = parameters.get('tableau')
-        basic_var = parameters.get('basic_var')
+    async def execute_batch(cls, name: str, body: bytes) -> bytes:
+        """Выполняет алгоритм для списка наборов параметров.
+
+        Ответ - JSON-массив той же длины, где каждый элемент содержит либо
+        ключ result с результатом, либо ключ error с кодом ошибки или
+        списком ошибок валидации этого набора.
+        """
+        spec = cls.get_spec(name)
         try:
-            result = simplex_method(tableau, basic_var)
-            result = SimplexMethodOutputVariables(**result)
-            return result
+            items = json.loads(body)
         except ValueError as e:
-            exception_message = str(e)
-            if exception_message == 'Эта таблица бесконечна':
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=ErrorMessages.THIS_TABLE_IS_ENDLESS,
-                )
-            if exception_message == 'Решения нет':
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=ErrorMessages.THERE_IS_NO_SOLUTION,
-                )
-        except IndexError:
+            raise RequestValidationError([{'type': 'json_invalid', 'loc': ('body',), 'msg': str(e)}])
+        if not isinstance(items, list):
+            raise RequestValidationError([{'type': 'list_type', 'loc': ('body',), 'msg': 'Input should be a list'}])
+        if len(items) > settings.algorithm_config.get(BATCH_MAX_SIZE, 0):
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=ErrorMessages.INCORRECT_INPUT_DATA,
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=ErrorMessages.THE_BATCH_IS_TOO_LARGE,
+            )
+        answers: list[bytes] = [b''] * len(items)
+        parameters, positions = [], []
+        for i, item in enumerate(items):
+            try:
+                params = spec.parse_item(item)
+            except ValidationError as e:
+                answers[i] = cls.__batch_error(json.loads(e.json(include_url=False)))
+                continue
+            cached = await result_cache.get(name, params)
+            if cached is not None:
+                answers[i] = b'{"result":' + cached + b'}'
+                continue
+            parameters.append(params)
+            positions.append(i)
+        if parameters:
+            if spec.batch_function is not None:
+                results = await cls.__run(spec, spec.batch_function, {'parameters': parameters})
+            else:
+                # одно время выполнения на весь пакет делится между наборами,
+                # чтобы медленные наборы не лишили результатов остальные
+                results = await cls.__run(spec, call_each, {
+                    'function': spec.function, 'parameters': parameters,
+                    'budget_parameter': spec.time_budget, 'budget': cls.__time_budget(name)})
+            for i, params, result in zip(positions, parameters, results):
+                if isinstance(result, AlgorithmTimeoutError):
+                    answers[i] = cls.__batch_error(ErrorMessages.ALGORITHM_EXECUTION_TIME_IS_OVER)
+                elif isinstance(result, Exception):
+                    answers[i] = cls.__batch_error(spec.error_detail(result) or
+                                                   ErrorMessages.ALGORITHM_EXECUTION_FAILED)
+                else:
+                    serialized = spec.serialize_result(result)
+                    if spec.is_cacheable(result):
+                        await result_cache.set(name, params, serialized)
+                    answers[i] = b'{"result":' + serialized + b'}'
+        return b'[' + b','.join(answers) + b']'
+
+    @classmethod
+    async def __run(cls, spec: AlgorithmSpec, function: Callable[..., Any], parameters: dict[str, Any],
+                    timeout: Optional[float] = None, backend: Optional[str] = None) -> Any:
+        backend = backend or algorithm_executor.backend_for(spec.name, spec.backend)
+        if timeout is None:
+            timeout = cls.timeout_for(spec.name)
+        try:
+            return await algorithm_executor.run(backend, function, parameters, timeout)
+        except AlgorithmTimeoutError:
+            logging.getLogger(__name__).warning('%s: %s', spec.name, TIME_OVER_MSG)
+            raise HTTPException(
+                status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                detail=ErrorMessages.ALGORITHM_EXECUTION_TIME_IS_OVER,
             )
 
+    @staticmethod
+    def __batch_error(detail: Any) -> bytes:
+        return json.dumps({'error': detail}, ensure_ascii=False, separators=(',', ':')).encode()
+
+    @classmethod
+    def timeout_for(cls, name: str) -> float:
+        algorithm_config = settings.algorithm_config
+        return algorithm_config.get(EXECUTE_TIMEOUTS, {}).get(name, algorithm_config.get(EXECUTE_TIMEOUT, 0))
+
     @classmethod
-    async def __is_algorithm_exist(cls, name):
-        async with async_session_maker() as session:
-            query = select(Calculations.id).filter_by(name=name)
-            fibonacci_calc = await session.execute(query)
-            fibonacci_calc = fibonacci_calc.all()
-            if not fibonacci_calc:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=ErrorMessages.GET_ALGORITHM_ALGORITHM_NOT_EXISTS
-                )
+    def __time_budget(cls, name: str) -> float:
+        return cls.timeout_for(name) * TIME_BUDGET_SHARE
+
+    @classmethod
+    def modules(cls) -> set[str]:
+        return {spec.function.__module__ for spec in ALGORITHMS.values()}
+
+    @classmethod
+    def get_spec(cls, name: str) -> AlgorithmSpec:
+        spec = ALGORITHMS.get(name)
+        if spec is None or not algorithms_registry.exists(name):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=ErrorMessages.GET_ALGORITHM_ALGORITHM_NOT_EXISTS
+            )
+        return spec
 
 
 algorithms_manager = AlgorithmsManager()
@@ -0,0 +1,116 @@
+"""Реестр алгоритмов, хранящийся в памяти процесса.
+
+Реестр одним запросом загружает алгоритмы вместе с их параметрами и
+выходными данными при старте приложения и затем обновляется по расписанию
+либо после изменений, внесённых через административную панель. Благодаря
+этому проверка существования алгоритма при вычислении и выдача описания
+алгоритма не обращаются к базе данных.
+"""
+import asyncio
+import hashlib
+import logging
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload
+
+from src.database import async_session_maker
+from src.models import Calculations
+from src.schemas.calculations import ReadAlgorithm, ReadParameters, ReadOutput
+
+RETRY_DELAY = 1.
+"""Задержка (в секундах) перед повторной загрузкой реестра после ошибки,
+удваивается после каждой следующей ошибки подряд"""
+
+MAX_RETRY_DELAY = 30.
+"""Наибольшая задержка (в секундах) перед повторной загрузкой реестра после ошибки"""
+
+
+class AlgorithmDefinition:
+    """Описание алгоритма, заранее сериализованное в JSON"""
+
+    def __init__(self, algorithm: ReadAlgorithm):
+        self.body = algorithm.model_dump_json().encode()
+        self.etag = '"' + hashlib.sha256(self.body).hexdigest()[:32] + '"'
+
+
+class AlgorithmsRegistry:
+
+    def __init__(self):
+        self.__names: frozenset[str] = frozenset()
+        self.__definitions: dict[str, AlgorithmDefinition] = {}
+        self.__refresh_task: Optional[asyncio.Task] = None
+        self.__failures = 0
+        self.__logger = logging.getLogger(__name__)
+
+    @property
+    def names(self) -> frozenset[str]:
+        return self.__names
+
+    def exists(self, name: str) -> bool:
+        return name in self.__names
+
+    def definition(self, name: str) -> Optional[AlgorithmDefinition]:
+        return self.__definitions.get(name)
+
+    async def load(self) -> None:
+        query = select(Calculations).options(joinedload(Calculations.parameters),
+                                             joinedload(Calculations.outputs))
+        async with async_session_maker() as session:
+            result = await session.execute(query)
+            calculations = result.unique().scalars().all()
+        definitions = {calculation.name: AlgorithmDefinition(self.__to_schema(calculation))
+                       for calculation in calculations}
+        # Словари заменяются целиком, поэтому читатели всегда видят
+        # согласованное состояние без блокировок
+        self.__definitions = definitions
+        self.__names = frozenset(definitions)
+        self.__logger.info('Algorithms registry loaded: %s', sorted(self.__names))
+
+    async def refresh(self) -> bool:
+        try:
+            await self.load()
+        except Exception:
+            self.__failures += 1
+            self.__logger.exception('Algorithms registry refresh failed')
+            return False
+        self.__failures = 0
+        return True
+
+    def start(self, interval: float) -> None:
+        # После неудачной загрузки при старте реестр пуст, и все алгоритмы
+        # отвечают 404, поэтому загрузка повторяется и без периодического обновления
+        if (interval > 0 or self.__failures) and self.__refresh_task is None:
+            self.__refresh_task = asyncio.create_task(self.__refresh_periodically(interval))
+
+    async def stop(self) -> None:
+        if self.__refresh_task is not None:
+            self.__refresh_task.cancel()
+            try:
+                await self.__refresh_task
+            except asyncio.CancelledError:
+                pass
+            self.__refresh_task = None
+
+    @staticmethod
+    def __to_schema(calculation: Calculations) -> ReadAlgorithm:
+        parameters = [ReadParameters(title=row.title, description=row.description, name=row.name,
+                                     data_type=row.data_type, data_shape=row.data_shape)
+                      for row in sorted(calculation.parameters, key=lambda row: row.id)]
+        outputs = [ReadOutput(title=row.title, description=row.description, name=row.name,
+                              data_type=row.data_type, data_shape=row.data_shape)
+                   for row in sorted(calculation.outputs, key=lambda row: row.id)]
+        return ReadAlgorithm(parameters=parameters, outputs=outputs, description=calculation.description,
+                             name=calculation.name, title=calculation.title)
+
+    async def __refresh_periodically(self, interval: float) -> None:
+        while interval > 0 or self.__failures:
+            if self.__failures:
+                await asyncio.sleep(min(RETRY_DELAY * 2 ** (self.__failures - 1), MAX_RETRY_DELAY))
+            else:
+                await asyncio.sleep(interval)
+            await self.refresh()
+        self.__refresh_task = None
+
+
+algorithms_registry = AlgorithmsRegistry()
@@ -0,0 +1,90 @@
+import asyncio
+import time
+import unittest
+from unittest import mock
+
+from src.cache import ResultCache, MemoryCacheBackend, BACKEND, MEMORY_BACKEND, DEFAULT_LIMITS, \
+    ALGORITHM_LIMITS, TTL, SIZE, MAX_BYTES, BACKEND_COOLDOWN
+
+CONFIG = {
+    BACKEND: MEMORY_BACKEND,
+    DEFAULT_LIMITS: {TTL: 60, SIZE: 2},
+    ALGORITHM_LIMITS: {'disabled': {TTL: 0}, 'matrix_mul': {MAX_BYTES: 10}},
+}
+
+
+class CacheTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.cache = ResultCache()
+        self.cache.start(CONFIG, '')
+
+    def tearDown(self) -> None:
+        asyncio.run(self.cache.close())
+
+    def test_miss_then_hit(self):
+        async def scenario():
+            self.assertIsNone(await self.cache.get('fibonacci', {'n': 10}))
+            await self.cache.set('fibonacci', {'n': 10}, b'{"result":55}')
+            return await self.cache.get('fibonacci', {'n': 10})
+        self.assertEqual(b'{"result":55}', asyncio.run(scenario()))
+        stats = self.cache.stats('fibonacci')
+        self.assertEqual(1, stats['misses'])
+        self.assertEqual(1, stats['local_hits'])
+
+    def test_key_is_canonical(self):
+        self.assertEqual(ResultCache.key('quadratic_equation', {'a': 1., 'b': 2., 'c': 3.}),
+                         ResultCache.key('quadratic_equation', {'c': 3., 'b': 2., 'a': 1.}))
+        self.assertNotEqual(ResultCache.key('fibonacci', {'n': 1}),
+                            ResultCache.key('fibonacci_list', {'n': 1}))
+
+    def test_lru_eviction_falls_back_to_backend(self):
+        async def scenario():
+            for n in range(3):
+                await self.cache.set('fibonacci', {'n': n}, str(n).encode())
+            return await self.cache.get('fibonacci', {'n': 0})
+        self.assertEqual(b'0', asyncio.run(scenario()))
+        stats = self.cache.stats('fibonacci')
+        self.assertEqual(1, stats['remote_hits'])
+        self.assertEqual(2, stats['local_size'])
+
+    def test_lru_is_bounded_by_bytes(self):
+        async def scenario():
+            await self.cache.set('matrix_mul', {'n': 1}, b'123456')
+            await self.cache.set('matrix_mul', {'n': 2}, b'12345')
+            await self.cache.set('matrix_mul', {'n': 3}, b'12345678901')
+            local_bytes = self.cache.stats('matrix_mul')['local_bytes']
+            return local_bytes, [await self.cache.get('matrix_mul', {'n': n}) for n in (1, 2, 3)]
+        # первая запись вытеснена из LRU по размеру, слишком большая не сохранена нигде
+        self.assertEqual((5, [b'123456', b'12345', None]), asyncio.run(scenario()))
+
+    def test_unavailable_backend_is_skipped_during_cooldown(self):
+        self.cache.start({**CONFIG, BACKEND_COOLDOWN: 0.2}, '')
+        failing = mock.AsyncMock(side_effect=ConnectionError('Connection refused'))
+
+        async def scenario():
+            with mock.patch.object(MemoryCacheBackend, 'get', failing), \
+                    mock.patch.object(MemoryCacheBackend, 'set', failing):
+                for n in range(5):
+                    await self.cache.set('fibonacci', {'n': n}, str(n).encode())
+                    await self.cache.get('fibonacci', {'n': n + 10})
+            time.sleep(0.2)
+            # после паузы хранилище снова используется
+            await self.cache.set('fibonacci', {'n': 0}, b'0')
+            return await self.cache.get('fibonacci', {'n': 0})
+        with self.assertLogs('src.cache', 'WARNING') as logs:
+            self.assertEqual(b'0', asyncio.run(scenario()))
+        self.assertEqual(1, failing.await_count)
+        self.assertEqual(2, len(logs.output))
+        self.assertIn('unavailable', logs.output[0])
+        self.assertIn('available again', logs.output[1])
+
+    def test_disabled_algorithm(self):
+        async def scenario():
+            await self.cache.set('disabled', {'n': 1}, b'1')
+            return await self.cache.get('disabled', {'n': 1})
+        self.assertIsNone(asyncio.run(scenario()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+import asyncio
+import multiprocessing
+import os
+import subprocess
+import sys
+import threading
+import time
+import unittest
+from unittest import mock
+
+from src.executor import AlgorithmExecutor, AlgorithmTimeoutError, ProcessWorkerPool, call_each, \
+    NODE_POOL_SIZE, PROCESS, PROCESS_POOL_SIZE, THREAD, THREAD_POOL_SIZE
+
+
+def sleep(seconds: float) -> int:
+    time.sleep(seconds)
+    return os.getpid()
+
+
+def pid() -> int:
+    return os.getpid()
+
+
+def spend(seconds: float, budget: float) -> float:
+    time.sleep(min(seconds, budget))
+    return budget
+
+
+def start_child() -> int:
+    return subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)']).pid
+
+
+def node_pool_pids(queue=None) -> tuple[int, list[int]]:
+    from src.algorithms.simplex_method.branch_and_bound import node_pool, node_pool_size
+    # процессы пула запускаются по мере поступления заданий
+    pids = sorted(set(node_pool().map(sleep, [0.2] * node_pool_size())))
+    if queue is not None:
+        queue.put(pids)
+    return node_pool_size(), pids
+
+
+def alive(process_id: int) -> bool:
+    try:
+        with open(f'/proc/{process_id}/stat') as stat:
+            # завершённый процесс, которого не дождался init контейнера, остаётся зомби
+            return stat.read().rsplit(')', 1)[1].split()[0] != 'Z'
+    except FileNotFoundError:
+        return False
+
+
+class ExecutorTests(unittest.TestCase):
+
+    def test_process_timeout_replaces_worker(self):
+        async def run():
+            pool = ProcessWorkerPool(1, 1, (__name__,))
+            try:
+                first = await pool.run(pid, {})
+                with self.assertRaises(AlgorithmTimeoutError):
+                    await pool.run(sleep, {'seconds': 30}, 0.5)
+                second = await pool.run(pid, {})
+                return first, second
+            finally:
+                pool.shutdown()
+
+        started = time.monotonic()
+        first, second = asyncio.run(run())
+        self.assertNotEqual(first, second)
+        self.assertLess(time.monotonic() - started, 20)
+
+    @unittest.skipUnless(hasattr(os, 'killpg') and os.path.exists('/proc'), 'нужны группы процессов и /proc')
+    def test_replaced_worker_takes_its_children(self):
+        async def run():
+            pool = ProcessWorkerPool(1, 1, (__name__,))
+            try:
+                child = await pool.run(start_child, {})
+                with self.assertRaises(AlgorithmTimeoutError):
+                    await pool.run(sleep, {'seconds': 30}, 0.5)
+                return child
+            finally:
+                pool.shutdown()
+
+        child = asyncio.run(run())
+        deadline = time.monotonic() + 5
+        while alive(child) and time.monotonic() < deadline:
+            time.sleep(0.1)
+        self.assertFalse(alive(child))
+
+    def test_waiting_for_idle_worker_counts_against_timeout(self):
+        async def run():
+            pool = ProcessWorkerPool(1, 1, (__name__,))
+            try:
+                await pool.run(pid, {})
+                busy = asyncio.ensure_future(pool.run(sleep, {'seconds': 2}))
+                await asyncio.sleep(0.1)
+                started = time.monotonic()
+                with self.assertRaises(AlgorithmTimeoutError):
+                    await pool.run(pid, {}, 0.5)
+                elapsed = time.monotonic() - started
+                await busy
+                return elapsed
+            finally:
+                pool.shutdown()
+
+        self.assertLess(asyncio.run(run()), 1.5)
+
+    def test_thread_with_timeout_runs_in_process_pool(self):
+        async def run():
+            executor = AlgorithmExecutor()
+            executor.start({THREAD_POOL_SIZE: 1, PROCESS_POOL_SIZE: 1}, (__name__,))
+            try:
+                await executor.warm_up()
+                with self.assertRaises(AlgorithmTimeoutError):
+                    await executor.run(THREAD, sleep, {'seconds': 30}, 0.5)
+                return await executor.run(THREAD, pid, {}, 5)
+            finally:
+                executor.shutdown()
+
+        self.assertNotEqual(asyncio.run(run()), os.getpid())
+
+    def test_thread_timeout_replaces_thread_pool(self):
+        release = threading.Event()
+
+        async def run():
+            executor = AlgorithmExecutor()
+            executor.start({THREAD_POOL_SIZE: 1}, ())
+            try:
+                with self.assertRaises(AlgorithmTimeoutError):
+                    await executor.run(THREAD, release.wait, {'timeout': 30}, 0.2)
+                # единственный поток старого пула занят, задание выполняет новый пул
+                return await executor.run(THREAD, pid, {}, 2)
+            finally:
+                release.set()
+                executor.shutdown()
+
+        self.assertEqual(asyncio.run(run()), os.getpid())
+
+    def test_node_pool_size_from_config(self):
+        async def run():
+            executor = AlgorithmExecutor()
+            executor.start({THREAD_POOL_SIZE: 1, PROCESS_POOL_SIZE: 1, NODE_POOL_SIZE: 2}, (__name__,))
+            try:
+                return await executor.run(PROCESS, node_pool_pids, {}, 60)
+            finally:
+                executor.shutdown()
+
+        with mock.patch.dict(os.environ):
+            size, pids = asyncio.run(run())
+        self.assertEqual(2, size)
+        self.assertLessEqual(len(pids), 2)
+
+    @unittest.skipUnless(os.path.exists('/proc'), 'нужен /proc')
+    def test_node_pool_stops_with_process(self):
+        context = multiprocessing.get_context('spawn')
+        queue = context.Queue()
+        process = context.Process(target=node_pool_pids, args=(queue,))
+        process.start()
+        pids = queue.get(timeout=60)
+        process.join(60)
+        self.assertEqual(0, process.exitcode)
+        self.assertTrue(pids)
+        self.assertFalse(any(alive(node_pid) for node_pid in pids))
+
+    def test_call_each_shares_budget(self):
+        results = call_each(spend, [{'seconds': 10}, {'seconds': 0}, {'seconds': 0}], 'budget', 0.3)
+        # первый набор расходует свою треть, остальные делят оставшееся время
+        self.assertAlmostEqual(0.1, results[0], delta=0.02)
+        self.assertAlmostEqual(0.1, results[1], delta=0.02)
+        self.assertAlmostEqual(0.2, results[2], delta=0.02)
+        self.assertIsInstance(call_each(spend, [{'seconds': 1, 'budget': 1}], 'budget', 1e-9)[0],
+                              AlgorithmTimeoutError)
+        self.assertEqual([5], call_each(spend, [{'seconds': 0, 'budget': 5}]))
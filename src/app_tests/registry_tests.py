@@ -0,0 +1,40 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from src.algorithms_registry import AlgorithmsRegistry
+
+
+class RegistryTests(unittest.TestCase):
+
+    def test_failed_load_is_retried(self):
+        registry = AlgorithmsRegistry()
+        load = mock.AsyncMock(side_effect=[ConnectionError, ConnectionError, None])
+
+        async def scenario():
+            with mock.patch.object(registry, 'load', load), \
+                    mock.patch('src.algorithms_registry.RETRY_DELAY', 0.01), \
+                    self.assertLogs('src.algorithms_registry'):
+                self.assertFalse(await registry.refresh())
+                # без периодического обновления загрузка всё равно повторяется до успеха
+                registry.start(0)
+                for _ in range(100):
+                    if load.await_count == 3:
+                        break
+                    await asyncio.sleep(0.01)
+                await registry.stop()
+        asyncio.run(scenario())
+        self.assertEqual(3, load.await_count)
+
+    def test_loaded_registry_is_not_refreshed_without_interval(self):
+        registry = AlgorithmsRegistry()
+        load = mock.AsyncMock()
+
+        async def scenario():
+            with mock.patch.object(registry, 'load', load):
+                self.assertTrue(await registry.refresh())
+                registry.start(0)
+                await asyncio.sleep(0.05)
+                await registry.stop()
+        asyncio.run(scenario())
+        self.assertEqual(1, load.await_count)
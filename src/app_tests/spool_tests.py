@@ -0,0 +1,106 @@
+import asyncio
+import io
+import os
+import tempfile
+import time
+import unittest
+
+import numpy as np
+from fastapi import HTTPException
+
+from src.errors import ErrorMessages
+from src.spool import Spool, DIRECTORY, MAX_FILE_SIZE, MAX_TOTAL_SIZE, TTL
+
+
+async def chunks(data: bytes, size: int = 7):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+def npy(array: np.ndarray) -> bytes:
+    buffer = io.BytesIO()
+    np.save(buffer, array)
+    return buffer.getvalue()
+
+
+class SpoolTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.spool = Spool()
+        self.spool.start({DIRECTORY: self.directory.name, MAX_FILE_SIZE: 1024, MAX_TOTAL_SIZE: 2048, TTL: 60})
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def save(self, data: bytes, *args) -> str:
+        return asyncio.run(self.spool.save(chunks(data), *args))
+
+    def assertDetail(self, detail: ErrorMessages, data: bytes, *args) -> None:
+        with self.assertRaises(HTTPException) as context:
+            self.save(data, *args)
+        self.assertEqual(detail, context.exception.detail)
+        # недогруженный файл не остаётся в каталоге
+        self.assertEqual([], os.listdir(self.directory.name))
+
+    def test_npy_file(self):
+        matrix = np.arange(6.).reshape(2, 3)
+        file_id = self.save(npy(matrix))
+        self.assertEqual({'file_id': file_id, 'shape': [2, 3], 'dtype': '<f8'}, self.spool.describe(file_id))
+        self.assertTrue(np.array_equal(matrix, np.load(self.spool.path(file_id), mmap_mode='r')))
+
+    def test_raw_file(self):
+        matrix = np.arange(6, dtype=np.int32).reshape(3, 2)
+        file_id = self.save(matrix.tobytes(), (3, 2), 'int32')
+        self.assertTrue(np.array_equal(matrix, np.load(self.spool.path(file_id))))
+
+    def test_wrong_files(self):
+        self.assertDetail(ErrorMessages.THE_FILE_SIZE_DOES_NOT_MATCH_THE_SHAPE, bytes(40), (3, 2), 'float64')
+        self.assertDetail(ErrorMessages.THE_FILE_IS_NOT_A_NUMERIC_MATRIX, bytes(48), (3, 2), 'object')
+        self.assertDetail(ErrorMessages.THE_FILE_IS_NOT_A_NUMERIC_MATRIX, npy(np.arange(3.)))
+        self.assertDetail(ErrorMessages.THE_FILE_IS_NOT_A_NUMERIC_MATRIX, b'not a matrix')
+        self.assertDetail(ErrorMessages.THE_FILE_IS_TOO_LARGE, npy(np.zeros((20, 20))))
+
+    def test_unknown_file(self):
+        for file_id in ('0' * 32, '../' + '0' * 29):
+            with self.assertRaises(HTTPException) as context:
+                self.spool.path(file_id)
+            self.assertEqual(404, context.exception.status_code)
+
+    def test_expired_files_are_removed(self):
+        file_id = self.save(npy(np.eye(2)))
+        past = time.time() - 120
+        os.utime(self.spool.path(file_id), (past, past))
+        self.spool.create()
+        self.assertEqual([], os.listdir(self.directory.name))
+
+    def test_ttl_counts_from_last_access(self):
+        file_id = self.save(npy(np.eye(2)))
+        past = time.time() - 120
+        os.utime(self.spool.path(file_id), (past, past))
+        self.spool.describe(file_id)
+        self.spool.create()
+        self.assertEqual([file_id + '.npy'], os.listdir(self.directory.name))
+
+    def test_files_in_use_are_kept(self):
+        file_id = self.save(npy(np.eye(2)))
+        past = time.time() - 120
+        with self.spool.use([file_id]):
+            os.utime(self.spool.path(file_id), (past, past))
+            self.spool.create()
+            self.assertEqual([file_id + '.npy'], os.listdir(self.directory.name))
+        self.spool.create()
+        self.assertEqual([], os.listdir(self.directory.name))
+
+    def test_total_size_quota(self):
+        first, second = self.save(npy(np.zeros((10, 10)))), self.save(npy(np.zeros((10, 10))))
+        with self.assertRaises(HTTPException) as context:
+            self.save(npy(np.zeros((10, 10))))
+        self.assertEqual(ErrorMessages.THE_FILE_STORAGE_IS_FULL, context.exception.detail)
+        self.assertEqual({first + '.npy', second + '.npy'}, set(os.listdir(self.directory.name)))
+        self.spool.remove(first)
+        self.save(npy(np.zeros((10, 10))))
+
+
+if __name__ == '__main__':
+    unittest.main()
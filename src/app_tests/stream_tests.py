@@ -0,0 +1,32 @@
+import json
+import unittest
+from unittest import mock
+
+from src.algorithms_manager import algorithms_manager, AlgorithmsManager
+from src.algorithms_registry import algorithms_registry
+from src.errors import ErrorMessages
+
+
+class StreamTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        patcher = mock.patch.object(algorithms_registry, 'exists', return_value=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def lines(self, body: bytes, timeout: float) -> list:
+        with mock.patch.object(AlgorithmsManager, 'timeout_for', return_value=timeout):
+            chunks = algorithms_manager.stream('fibonacci_list', body)
+        return [json.loads(line) for chunk in chunks for line in chunk.splitlines()]
+
+    def test_stream(self):
+        self.assertEqual([1, 1, 2, 3, 5], self.lines(b'{"n": 5}', 0))
+
+    def test_stream_stops_at_deadline(self):
+        lines = self.lines(b'{"n": 30000}', 1e-3)
+        self.assertLess(len(lines), 30000)
+        self.assertEqual({'error': ErrorMessages.ALGORITHM_EXECUTION_TIME_IS_OVER}, lines[-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
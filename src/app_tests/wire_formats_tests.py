@@ -0,0 +1,85 @@
+import io
+import unittest
+
+import numpy as np
+from pydantic import ValidationError
+
+from src import NPY_MEDIA_TYPE, MSGPACK_MEDIA_TYPE
+from src.algorithms_manager import ALGORITHMS
+from src.cache import ResultCache
+from src.wire_formats import decode, encode, request_format, response_format, MSGPACK_AVAILABLE, \
+    DECODE_FAILED_MSG, ENCODE_FAILED_MSG
+
+
+def npz(**arrays) -> bytes:
+    buffer = io.BytesIO()
+    np.savez(buffer, **arrays)
+    return buffer.getvalue()
+
+
+class WireFormatsTests(unittest.TestCase):
+
+    def test_negotiation(self):
+        self.assertEqual(NPY_MEDIA_TYPE, request_format(NPY_MEDIA_TYPE))
+        self.assertIsNone(request_format('application/json'))
+        self.assertEqual(NPY_MEDIA_TYPE, response_format(f'application/json, {NPY_MEDIA_TYPE}'))
+        self.assertIsNone(response_format('*/*'))
+        self.assertEqual(MSGPACK_MEDIA_TYPE if MSGPACK_AVAILABLE else None, response_format(MSGPACK_MEDIA_TYPE))
+
+    def test_npz_matrix_parameters(self):
+        spec = ALGORITHMS['matrix_mul']
+        parameters = spec.parse_values(decode(npz(n=np.eye(2), m=np.array([[1, 2], [3, 4]])), NPY_MEDIA_TYPE))
+        self.assertIsInstance(parameters['m'], np.ndarray)
+        self.assertEqual(np.float64, parameters['m'].dtype)
+        result = spec.serialize_result(spec.function(**parameters), NPY_MEDIA_TYPE)
+        with np.load(io.BytesIO(result)) as archive:
+            np.testing.assert_array_equal([[1., 2.], [3., 4.]], archive['result'])
+
+    def test_npz_scalars_and_integer_lists(self):
+        spec = ALGORITHMS['simplex_method']
+        tableau = np.array([[0., -1., -1., 0., 0.], [24., 6., 4., 1., 0.], [6., 3., -2., 0., 1.]])
+        parameters = spec.parse_values(decode(npz(tableau=tableau, basic_var=np.array([3, 4]),
+                                                  pivot_rule=np.array('dantzig')), NPY_MEDIA_TYPE))
+        self.assertEqual([3, 4], parameters['basic_var'])
+        self.assertEqual('dantzig', parameters['pivot_rule'])
+        result = spec.serialize_result(spec.function(**parameters), NPY_MEDIA_TYPE)
+        with np.load(io.BytesIO(result)) as archive:
+            self.assertEqual(-6., archive['optimal_value'])
+            self.assertNotIn('gap', archive.files)
+
+    def test_wrong_dimension_is_validated_by_model(self):
+        spec = ALGORITHMS['matrix_add']
+        with self.assertRaises(ValidationError):
+            spec.parse_values(decode(npz(n=np.eye(2), m=np.array([1., 2.])), NPY_MEDIA_TYPE))
+
+    def test_broken_body(self):
+        for body in (b'not an archive', io.BytesIO().getvalue()):
+            with self.assertRaisesRegex(ValueError, DECODE_FAILED_MSG):
+                decode(body, NPY_MEDIA_TYPE)
+
+    def test_too_large_integer_cannot_be_encoded(self):
+        with self.assertRaisesRegex(ValueError, ENCODE_FAILED_MSG):
+            encode({'result': [2 ** 70]}, NPY_MEDIA_TYPE)
+
+    def test_cache_key_of_arrays(self):
+        first = {'n': np.eye(2)}
+        self.assertEqual(ResultCache.key('matrix_inv', first), ResultCache.key('matrix_inv', {'n': np.eye(2)}))
+        self.assertNotEqual(ResultCache.key('matrix_inv', first), ResultCache.key('matrix_inv', {'n': 2 * np.eye(2)}))
+        self.assertNotEqual(ResultCache.key('matrix_inv', first),
+                            ResultCache.key('matrix_inv', first, NPY_MEDIA_TYPE))
+
+    @unittest.skipUnless(MSGPACK_AVAILABLE, 'msgpack is not installed')
+    def test_msgpack_round_trip(self):
+        import msgpack
+        spec = ALGORITHMS['matrix_solve']
+        body = encode({'n': [[2., 0.], [0., 4.]], 'b': [2., 8.]}, MSGPACK_MEDIA_TYPE)
+        parameters = spec.parse_values(decode(body, MSGPACK_MEDIA_TYPE))
+        self.assertIsInstance(parameters['n'], np.ndarray)
+        result = decode(spec.serialize_result(spec.function(**parameters), MSGPACK_MEDIA_TYPE), MSGPACK_MEDIA_TYPE)
+        np.testing.assert_array_equal([1., 2.], result['result'])
+        with self.assertRaisesRegex(ValueError, DECODE_FAILED_MSG):
+            decode(msgpack.packb([1, 2]), MSGPACK_MEDIA_TYPE)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,265 @@
+"""Кэш результатов детерминированных алгоритмов.
+
+Результат (сериализованный ответ) хранится под ключом, составленным из имени
+алгоритма, канонического представления его параметров и формата ответа
+(wire_formats), если он не JSON. Массивы NumPy из двоичных тел запросов
+представлены в ключе хэшем своего содержимого. Кэш двухуровневый:
+ограниченный LRU в памяти процесса и общий для всех процессов Redis. Вместо
+Redis может использоваться хранилище в памяти, не требующее внешних сервисов.
+Если Redis недоступен, кэш на время BACKEND_COOLDOWN работает только в
+памяти процесса и не тратит время запросов на попытки соединения.
+"""
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+import numpy as np
+
+BACKEND = 'backend'
+"""Ключ конфигурации: второй уровень кэша (redis, memory или none)"""
+
+DEFAULT_LIMITS = 'default'
+"""Ключ конфигурации: ограничения, действующие для всех алгоритмов"""
+
+ALGORITHM_LIMITS = 'algorithms'
+"""Ключ конфигурации: ограничения для отдельных алгоритмов"""
+
+TTL = 'ttl'
+"""Ключ конфигурации: время жизни записи в секундах (0 - не кэшировать)"""
+
+SIZE = 'size'
+"""Ключ конфигурации: количество записей LRU в памяти процесса"""
+
+MAX_BYTES = 'max_bytes'
+"""Ключ конфигурации: суммарный размер записей LRU в памяти процесса в байтах
+(0 - без ограничения). Результат больше этого размера не кэшируется"""
+
+BACKEND_COOLDOWN = 'backend_cooldown'
+"""Ключ конфигурации: время в секундах, на которое второй уровень кэша
+отключается после ошибки обращения к нему"""
+
+DEFAULT_BACKEND_COOLDOWN = 30
+"""Время отключения второго уровня кэша после ошибки по умолчанию"""
+
+REDIS_TIMEOUT = 1.
+"""Наибольшее время соединения с Redis и ожидания его ответа в секундах"""
+
+REDIS_BACKEND = 'redis'
+MEMORY_BACKEND = 'memory'
+NO_BACKEND = 'none'
+
+KEY_PREFIX = 'algoscalc:result:'
+"""Префикс ключей кэша во внешнем хранилище"""
+
+
+class MemoryCacheBackend:
+    """Хранилище в памяти с тем же интерфейсом, что и RedisCacheBackend"""
+
+    def __init__(self):
+        self.__values: dict[str, tuple[float, bytes]] = {}
+
+    async def get(self, key: str) -> Optional[bytes]:
+        item = self.__values.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self.__values[key]
+            return None
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        self.__values[key] = (time.monotonic() + ttl, value)
+
+    async def close(self) -> None:
+        self.__values.clear()
+
+
+class RedisCacheBackend:
+
+    def __init__(self, url: str):
+        import redis.asyncio as redis
+        self.__client = redis.from_url(url, socket_connect_timeout=REDIS_TIMEOUT, socket_timeout=REDIS_TIMEOUT)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.__client.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        await self.__client.set(key, value, ex=ttl)
+
+    async def close(self) -> None:
+        await self.__client.aclose()
+
+
+class _LRU:
+
+    def __init__(self, size: int, max_bytes: int = 0):
+        self.size = size
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.__items: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+    def get(self, key: str) -> Optional[bytes]:
+        item = self.__items.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            self.__remove(key)
+            return None
+        self.__items.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        if self.size <= 0 or 0 < self.max_bytes < len(value):
+            return
+        if key in self.__items:
+            self.__remove(key)
+        self.__items[key] = (time.monotonic() + ttl, value)
+        self.nbytes += len(value)
+        while len(self.__items) > self.size or 0 < self.max_bytes < self.nbytes:
+            self.__remove(next(iter(self.__items)))
+
+    def __remove(self, key: str) -> None:
+        _, value = self.__items.pop(key)
+        self.nbytes -= len(value)
+
+    def __len__(self):
+        return len(self.__items)
+
+
+class CacheStats:
+
+    def __init__(self):
+        self.local_hits = 0
+        self.remote_hits = 0
+        self.misses = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {'local_hits': self.local_hits, 'remote_hits': self.remote_hits,
+                'hits': self.local_hits + self.remote_hits, 'misses': self.misses}
+
+
+class ResultCache:
+
+    def __init__(self):
+        self.__backend = None
+        self.__default_limits: dict[str, int] = {TTL: 0, SIZE: 0, MAX_BYTES: 0}
+        self.__algorithm_limits: dict[str, dict[str, int]] = {}
+        self.__local: dict[str, _LRU] = {}
+        self.__stats: dict[str, CacheStats] = {}
+        self.__cooldown = DEFAULT_BACKEND_COOLDOWN
+        # время (time.monotonic), до которого второй уровень не используется после ошибки
+        self.__backend_down_until: Optional[float] = None
+        self.__logger = logging.getLogger(__name__)
+
+    def start(self, config: dict[str, Any], redis_url: str) -> None:
+        self.__default_limits = {**self.__default_limits, **config.get(DEFAULT_LIMITS, {})}
+        self.__algorithm_limits = dict(config.get(ALGORITHM_LIMITS, {}))
+        self.__cooldown = config.get(BACKEND_COOLDOWN, DEFAULT_BACKEND_COOLDOWN)
+        self.__backend_down_until = None
+        self.__local.clear()
+        backend = config.get(BACKEND, NO_BACKEND)
+        if backend == REDIS_BACKEND:
+            self.__backend = RedisCacheBackend(redis_url)
+        elif backend == MEMORY_BACKEND:
+            self.__backend = MemoryCacheBackend()
+        else:
+            self.__backend = None
+
+    async def close(self) -> None:
+        if self.__backend is not None:
+            await self.__backend.close()
+            self.__backend = None
+
+    def stats(self, name: str) -> dict[str, int]:
+        stats = self.__stats.get(name, CacheStats()).as_dict()
+        local = self.__local.get(name)
+        stats['local_size'] = len(local) if local is not None else 0
+        stats['local_bytes'] = local.nbytes if local is not None else 0
+        return stats
+
+    @classmethod
+    def key(cls, name: str, parameters: dict[str, Any], media_type: Optional[str] = None) -> str:
+        canonical = json.dumps(parameters, sort_keys=True, separators=(',', ':'), ensure_ascii=False,
+                               default=cls.__canonical_array)
+        if media_type is not None:
+            canonical += media_type
+        return KEY_PREFIX + name + ':' + hashlib.sha256(canonical.encode()).hexdigest()
+
+    @staticmethod
+    def __canonical_array(value: Any) -> dict[str, Any]:
+        if not isinstance(value, np.ndarray):
+            raise TypeError(f'{type(value).__name__} is not JSON serializable')
+        digest = hashlib.sha256(np.ascontiguousarray(value)).hexdigest()
+        return {'dtype': value.dtype.str, 'shape': value.shape, 'sha256': digest}
+
+    async def get(self, name: str, parameters: dict[str, Any], media_type: Optional[str] = None) -> Optional[bytes]:
+        ttl = self.__limit(name, TTL)
+        if ttl <= 0:
+            return None
+        stats = self.__stats.setdefault(name, CacheStats())
+        key = self.key(name, parameters, media_type)
+        local = self.__local_for(name)
+        value = local.get(key)
+        if value is not None:
+            stats.local_hits += 1
+            return value
+        if self.__backend_available():
+            try:
+                value = await self.__backend.get(key)
+            except Exception as e:
+                self.__backend_failed(e)
+            else:
+                self.__backend_succeeded()
+        if value is None:
+            stats.misses += 1
+            return None
+        stats.remote_hits += 1
+        local.set(key, value, ttl)
+        return value
+
+    async def set(self, name: str, parameters: dict[str, Any], value: bytes,
+                  media_type: Optional[str] = None) -> None:
+        ttl = self.__limit(name, TTL)
+        if ttl <= 0 or 0 < self.__limit(name, MAX_BYTES) < len(value):
+            return
+        key = self.key(name, parameters, media_type)
+        self.__local_for(name).set(key, value, ttl)
+        if self.__backend_available():
+            try:
+                await self.__backend.set(key, value, ttl)
+            except Exception as e:
+                self.__backend_failed(e)
+            else:
+                self.__backend_succeeded()
+
+    def __backend_available(self) -> bool:
+        return self.__backend is not None and (self.__backend_down_until is None or
+                                               self.__backend_down_until <= time.monotonic())
+
+    def __backend_failed(self, error: Exception) -> None:
+        # об отказе сообщается один раз, а не при каждом запросе, пока хранилище недоступно
+        if self.__backend_down_until is None:
+            self.__logger.warning('Result cache backend is unavailable, using the local cache only: %r', error)
+        self.__backend_down_until = time.monotonic() + self.__cooldown
+
+    def __backend_succeeded(self) -> None:
+        if self.__backend_down_until is not None:
+            self.__logger.warning('Result cache backend is available again')
+            self.__backend_down_until = None
+
+    def __limit(self, name: str, limit: str) -> int:
+        return self.__algorithm_limits.get(name, {}).get(limit, self.__default_limits[limit])
+
+    def __local_for(self, name: str) -> _LRU:
+        local = self.__local.get(name)
+        if local is None:
+            local = self.__local[name] = _LRU(self.__limit(name, SIZE), self.__limit(name, MAX_BYTES))
+        return local
+
+
+result_cache = ResultCache()
@@ -4,7 +4,9 @@ import os
 import logging.config
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from src import LOG_CONFIG_FILE_PATH, APP_CONFIG_FILE_PATH, PATH_CONFIG, ALGORITHM_CONFIG, IS_TEST_APP, EXECUTE_TIMEOUT
+from src import LOG_CONFIG_FILE_PATH, APP_CONFIG_FILE_PATH, PATH_CONFIG, ALGORITHM_CONFIG, IS_TEST_APP, EXECUTE_TIMEOUT, \
+    EXECUTE_TIMEOUTS, CACHE_CONFIG, SPOOL_CONFIG
+from src.cache import BACKEND as CACHE_BACKEND, MEMORY_BACKEND
 
 
 class Settings(BaseSettings):
@@ -48,10 +50,17 @@ class Settings(BaseSettings):
             config = json.load(conf_file)
         path_config = config[PATH_CONFIG]
         algorithm_config = config[ALGORITHM_CONFIG]
+        cache_config = config.get(CACHE_CONFIG, {})
+        spool_config = config.get(SPOOL_CONFIG, {})
         if bool(os.environ.get(IS_TEST_APP)):
             algorithm_config[EXECUTE_TIMEOUT] = 0
+            algorithm_config[EXECUTE_TIMEOUTS] = {}
+            # Тесты не требуют запущенного Redis
+            cache_config[CACHE_BACKEND] = MEMORY_BACKEND
         self.__path_config = path_config
         self.__algorithm_config = algorithm_config
+        self.__cache_config = cache_config
+        self.__spool_config = spool_config
         self.__web_config = config['web_config']
 
     @property
@@ -62,6 +71,14 @@ class Settings(BaseSettings):
     def algorithm_config(self):
         return self.__algorithm_config
 
+    @property
+    def cache_config(self):
+        return self.__cache_config
+
+    @property
+    def spool_config(self):
+        return self.__spool_config
+
     @property
     def path_config(self):
         return self.__path_config
@@ -3,16 +3,52 @@ import enum
 
 class ErrorMessages(str, enum.Enum):
     GET_ALGORITHM_ALGORITHM_NOT_EXISTS = "ALGORITHM_DOES_NOT_EXISTS"
+    ALGORITHM_EXECUTION_TIME_IS_OVER = 'ALGORITHM_EXECUTION_TIME_IS_OVER'
+    ALGORITHM_EXECUTION_FAILED = 'ALGORITHM_EXECUTION_FAILED'
+    THE_BATCH_IS_TOO_LARGE = 'THE_BATCH_IS_TOO_LARGE'
+    THE_REQUEST_BODY_CANNOT_BE_DECODED = 'THE_REQUEST_BODY_CANNOT_BE_DECODED'
+    THE_MEDIA_TYPE_IS_NOT_SUPPORTED = 'THE_MEDIA_TYPE_IS_NOT_SUPPORTED'
+    THE_RESULT_CANNOT_BE_ENCODED = 'THE_RESULT_CANNOT_BE_ENCODED'
+
+    # files
+    THE_FILE_DOES_NOT_EXIST = 'THE_FILE_DOES_NOT_EXIST'
+    THE_FILE_IS_TOO_LARGE = 'THE_FILE_IS_TOO_LARGE'
+    THE_FILE_STORAGE_IS_FULL = 'THE_FILE_STORAGE_IS_FULL'
+    THE_FILE_IS_NOT_A_NUMERIC_MATRIX = 'THE_FILE_IS_NOT_A_NUMERIC_MATRIX'
+    THE_FILE_SIZE_DOES_NOT_MATCH_THE_SHAPE = 'THE_FILE_SIZE_DOES_NOT_MATCH_THE_SHAPE'
+    THE_ALGORITHM_DOES_NOT_ACCEPT_FILES = 'THE_ALGORITHM_DOES_NOT_ACCEPT_FILES'
+    THE_ALGORITHM_DOES_NOT_ACCEPT_TEXT_STREAMS = 'THE_ALGORITHM_DOES_NOT_ACCEPT_TEXT_STREAMS'
+    THE_TEXT_FILE_IS_MISSING = 'THE_TEXT_FILE_IS_MISSING'
+
+    # fibonacci
+    THE_NUMBER_MUST_BE_NATURAL = 'THE_NUMBER_MUST_BE_NATURAL'
+    THE_NUMBER_IS_TOO_LARGE = 'THE_NUMBER_IS_TOO_LARGE'
+    THE_OFFSET_AND_LIMIT_CANNOT_BE_NEGATIVE = 'THE_OFFSET_AND_LIMIT_CANNOT_BE_NEGATIVE'
+    THE_REQUESTED_SLICE_IS_TOO_LARGE = 'THE_REQUESTED_SLICE_IS_TOO_LARGE'
 
     # perfect numbers
     THE_LIST_OF_NUMBERS_IS_EMPTY = 'THE_LIST_OF_NUMBERS_IS_EMPTY'
     THE_LIST_OF_NUMBERS_CONTAINS_NEGATIVE_VALUE = 'THE_LIST_OF_NUMBERS_CONTAINS_NEGATIVE_VALUE'
+    BOTH_RANGE_BOUNDS_ARE_REQUIRED = 'BOTH_RANGE_BOUNDS_ARE_REQUIRED'
+    INVALID_RANGE_BOUNDS = 'INVALID_RANGE_BOUNDS'
+    THE_RANGE_IS_TOO_LARGE = 'THE_RANGE_IS_TOO_LARGE'
 
     # matrix sub
     THE_LENGTHS_OF_THE_MATRICES_DO_NOT_MATCH = 'THE_LENGTHS_OF_THE_MATRICES_DO_NOT_MATCH'
     INCORRECT_NUMBER_OF_MATRIX_COLUMNS = 'INCORRECT_NUMBER_OF_MATRIX_COLUMNS'
     NO_VALUE_ENTERED_IN_THE_MATRIX = 'NO_VALUE_ENTERED_IN_THE_MATRIX'
 
+    # matrix operations
+    THE_MATRIX_IS_EMPTY = 'THE_MATRIX_IS_EMPTY'
+    THE_MATRIX_IS_NOT_SQUARE = 'THE_MATRIX_IS_NOT_SQUARE'
+    THE_MATRICES_CANNOT_BE_MULTIPLIED = 'THE_MATRICES_CANNOT_BE_MULTIPLIED'
+    THE_MATRIX_IS_SINGULAR = 'THE_MATRIX_IS_SINGULAR'
+    THE_RESULT_IS_TOO_LARGE = 'THE_RESULT_IS_TOO_LARGE'
+
+    # substring in a string
+    THE_SEARCH_TEXT_IS_EMPTY = 'THE_SEARCH_TEXT_IS_EMPTY'
+    UNKNOWN_SEARCH_MODE = 'UNKNOWN_SEARCH_MODE'
+
     # quadratic equation
     THE_COEFFICIENTS_MUST_BE_NUMBERS = 'THE_COEFFICIENTS_MUST_BE_NUMBERS'
     THE_COEFFICIENT_FOR_X2_CANNOT_BE_EQUAL_TO_0 = 'THE_COEFFICIENT_FOR_X2_CANNOT_BE_EQUAL_TO_0'
@@ -24,3 +60,6 @@ class ErrorMessages(str, enum.Enum):
     THIS_TABLE_IS_ENDLESS = 'THIS_TABLE_IS_ENDLESS'
     THERE_IS_NO_SOLUTION = 'THERE_IS_NO_SOLUTION'
     INCORRECT_INPUT_DATA = 'INCORRECT_INPUT_DATA'
+    UNKNOWN_PIVOT_RULE = 'UNKNOWN_PIVOT_RULE'
+    THE_ITERATION_OR_TIME_LIMIT_IS_EXCEEDED = 'THE_ITERATION_OR_TIME_LIMIT_IS_EXCEEDED'
+    THE_BASIS_BELONGS_TO_ANOTHER_PROBLEM = 'THE_BASIS_BELONGS_TO_ANOTHER_PROBLEM'
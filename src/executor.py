@@ -0,0 +1,299 @@
+"""Выполнение алгоритмов вне цикла событий.
+
+Для каждого алгоритма выбирается способ выполнения:
+
+- inline - непосредственно в обработчике запроса (для тривиальных алгоритмов);
+- thread - в пуле потоков;
+- process - в пуле процессов с заранее запущенными рабочими процессами,
+  которые уже импортировали модули алгоритмов.
+
+Время выполнения ограничивается для потоков и процессов. Рабочий процесс,
+не уложившийся в отведённое время, принудительно завершается и заменяется
+новым. Поток прервать нельзя, поэтому алгоритм thread с ограниченным
+временем выполняется в пуле процессов, если он запущен. Без пула процессов
+по истечении времени прекращается только ожидание результата, а пул потоков
+заменяется новым, чтобы зависшие потоки не занимали его.
+
+Модуль не импортирует настройки приложения, так как загружается и в
+рабочих процессах пула.
+"""
+import asyncio
+import functools
+import importlib
+import multiprocessing
+import multiprocessing.util
+import os
+import signal
+import time
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.connection import Connection
+from typing import Any, Callable, Iterable, Optional
+
+INLINE = 'inline'
+"""Выполнение в обработчике запроса"""
+
+THREAD = 'thread'
+"""Выполнение в пуле потоков"""
+
+PROCESS = 'process'
+"""Выполнение в пуле процессов"""
+
+BACKENDS = (INLINE, THREAD, PROCESS)
+
+THREAD_POOL_SIZE = 'thread_pool_size'
+"""Ключ конфигурации: количество потоков в пуле потоков"""
+
+PROCESS_POOL_SIZE = 'process_pool_size'
+"""Ключ конфигурации: количество рабочих процессов в пуле процессов"""
+
+BLAS_THREADS = 'blas_threads'
+"""Ключ конфигурации: количество потоков BLAS в каждом рабочем процессе"""
+
+NODE_POOL_SIZE = 'node_pool_size'
+"""Ключ конфигурации: количество процессов, которые алгоритм может запустить для
+параллельных вычислений в каждом рабочем процессе (и в процессе сервера)"""
+
+ALGORITHM_BACKENDS = 'backends'
+"""Ключ конфигурации: переопределение способа выполнения для алгоритмов"""
+
+BLAS_THREADS_ENV = ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS',
+                    'VECLIB_MAXIMUM_THREADS', 'NUMEXPR_NUM_THREADS')
+"""Переменные среды, ограничивающие число потоков библиотек линейной алгебры"""
+
+NODE_POOL_SIZE_ENV = 'ALGORITHM_NODE_POOL_SIZE'
+"""Переменная среды, из которой алгоритмы берут размер своего пула процессов"""
+
+
+class AlgorithmTimeoutError(TimeoutError):
+    """Алгоритм не уложился в отведённое время выполнения"""
+
+
+class WorkerDiedError(RuntimeError):
+    """Рабочий процесс завершился, не вернув результат"""
+
+
+def _init_worker(blas_threads: int, modules: tuple[str, ...]) -> None:
+    # Переменные среды должны быть заданы до первого импорта numpy
+    for variable in BLAS_THREADS_ENV:
+        os.environ[variable] = str(blas_threads)
+    for module in modules:
+        importlib.import_module(module)
+
+
+def _worker_loop(connection: Connection, blas_threads: int, modules: tuple[str, ...]) -> None:
+    if hasattr(os, 'setpgrp'):
+        # своя группа процессов: при замене рабочего процесса завершаются и запущенные им
+        os.setpgrp()
+    _init_worker(blas_threads, modules)
+    while True:
+        try:
+            function, parameters = connection.recv()
+        except EOFError:
+            return
+        try:
+            answer = (True, function(**parameters))
+        except Exception as e:
+            answer = (False, e)
+        try:
+            connection.send(answer)
+        except Exception as e:
+            # Результат или исключение не удалось передать через канал
+            connection.send((False, RuntimeError(f'{type(e).__name__}: {e}')))
+
+
+class _Worker:
+
+    def __init__(self, context, blas_threads: int, modules: tuple[str, ...]):
+        self.connection, child_connection = context.Pipe()
+        # Не демон: алгоритм может запускать собственные процессы (метод ветвей
+        # и границ вычисляет узлы параллельно). При выходе процессы завершает пул
+        # вместе с их группами
+        self.process = context.Process(target=_worker_loop, args=(child_connection, blas_threads, modules))
+        self.process.start()
+        child_connection.close()
+
+    def call(self, function: Callable[..., Any], parameters: dict[str, Any]) -> tuple[bool, Any]:
+        self.connection.send((function, parameters))
+        return self.connection.recv()
+
+    def kill(self) -> None:
+        try:
+            os.killpg(self.process.pid, signal.SIGKILL)
+        except (AttributeError, OSError):
+            # нет групп процессов или группа ещё не создана
+            self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+
+def _kill_workers(workers: list[_Worker]) -> None:
+    for worker in workers:
+        worker.kill()
+
+
+class ProcessWorkerPool:
+    """Пул рабочих процессов с возможностью завершить зависшее вычисление.
+
+    В отличие от ProcessPoolExecutor каждый процесс обслуживает отдельный
+    канал, поэтому процесс, превысивший время выполнения, можно завершить
+    и заменить, не затрагивая остальные вычисления.
+    """
+
+    def __init__(self, size: int, blas_threads: int, modules: tuple[str, ...]):
+        # spawn вместо fork: рабочие процессы не наследуют цикл событий и
+        # потоки сервера, а ограничения BLAS применяются до импорта numpy
+        self.__context = multiprocessing.get_context('spawn')
+        self.__blas_threads = blas_threads
+        self.__modules = modules
+        self.__workers = [self.__spawn() for _ in range(size)]
+        # Ожидание завершения процессов при выходе из интерпретатора не должно
+        # зависнуть, если пул не был остановлен явно
+        multiprocessing.util.Finalize(self, _kill_workers, args=(self.__workers,), exitpriority=0)
+        self.__idle: asyncio.Queue = asyncio.Queue()
+        for worker in self.__workers:
+            self.__idle.put_nowait(worker)
+        # Ожидание ответа рабочего процесса блокирует поток, а не цикл событий
+        self.__waiters = ThreadPoolExecutor(max_workers=size, thread_name_prefix='worker-wait')
+
+    @property
+    def size(self) -> int:
+        return len(self.__workers)
+
+    async def run(self, function: Callable[..., Any], parameters: dict[str, Any],
+                  timeout: Optional[float] = None) -> Any:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout else None
+        try:
+            # ожидание свободного процесса входит в отведённое время
+            worker = await asyncio.wait_for(self.__idle.get(), timeout or None)
+        except asyncio.TimeoutError:
+            raise AlgorithmTimeoutError()
+        try:
+            success, value = await asyncio.wait_for(
+                loop.run_in_executor(self.__waiters, worker.call, function, parameters),
+                max(deadline - loop.time(), 0) if deadline is not None else None)
+        except asyncio.TimeoutError:
+            worker = self.__replace(worker)
+            raise AlgorithmTimeoutError()
+        except (EOFError, OSError):
+            worker = self.__replace(worker)
+            raise WorkerDiedError()
+        except asyncio.CancelledError:
+            # Процесс продолжает вычисление, результат которого уже никому не нужен
+            worker = self.__replace(worker)
+            raise
+        finally:
+            self.__idle.put_nowait(worker)
+        if not success:
+            raise value
+        return value
+
+    def shutdown(self) -> None:
+        for worker in self.__workers:
+            worker.kill()
+        self.__workers.clear()
+        self.__waiters.shutdown(wait=False, cancel_futures=True)
+
+    def __spawn(self) -> _Worker:
+        return _Worker(self.__context, self.__blas_threads, self.__modules)
+
+    def __replace(self, worker: _Worker) -> _Worker:
+        worker.kill()
+        new_worker = self.__spawn()
+        self.__workers[self.__workers.index(worker)] = new_worker
+        return new_worker
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def call_each(function: Callable[..., Any], parameters: list[dict[str, Any]],
+              budget_parameter: Optional[str] = None, budget: float = 0) -> list[Any]:
+    """Вызывает функцию для каждого набора параметров, возвращая вместо
+    результата исключение, если вызов завершился ошибкой.
+
+    Если задано имя параметра budget_parameter и время budget (в секундах),
+    время делится между вызовами: каждый получает равную долю оставшегося,
+    а набору, которому времени не осталось, вместо вызова достаётся
+    AlgorithmTimeoutError"""
+    results = []
+    deadline = time.monotonic() + budget
+    for k, params in enumerate(parameters):
+        if budget_parameter is not None and budget > 0:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                results.append(AlgorithmTimeoutError())
+                continue
+            params = {**params, budget_parameter: remaining / (len(parameters) - k)}
+        try:
+            results.append(function(**params))
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+class AlgorithmExecutor:
+
+    def __init__(self):
+        self.__thread_pool: Optional[ThreadPoolExecutor] = None
+        self.__thread_pool_size = 0
+        self.__process_pool: Optional[ProcessWorkerPool] = None
+        self.__backends: dict[str, str] = {}
+
+    def start(self, config: dict[str, Any], modules: Iterable[str]) -> None:
+        self.__backends = dict(config.get(ALGORITHM_BACKENDS, {}))
+        for name, backend in self.__backends.items():
+            if backend not in BACKENDS:
+                raise ValueError(f'Неизвестный способ выполнения {backend} для алгоритма {name}')
+        self.__thread_pool_size = config.get(THREAD_POOL_SIZE, 4)
+        self.__thread_pool = self.__new_thread_pool()
+        process_pool_size = config.get(PROCESS_POOL_SIZE, 0)
+        # рабочие процессы (spawn) наследуют переменные среды процесса сервера
+        os.environ[NODE_POOL_SIZE_ENV] = str(config.get(NODE_POOL_SIZE, 1))
+        if process_pool_size > 0:
+            self.__process_pool = ProcessWorkerPool(process_pool_size, config.get(BLAS_THREADS, 1),
+                                                    tuple(sorted(set(modules))))
+
+    async def warm_up(self) -> None:
+        if self.__process_pool is None:
+            return
+        await asyncio.gather(*(self.__process_pool.run(_ping, {}) for _ in range(self.__process_pool.size)))
+
+    def shutdown(self) -> None:
+        if self.__thread_pool is not None:
+            self.__thread_pool.shutdown(wait=False, cancel_futures=True)
+            self.__thread_pool = None
+        if self.__process_pool is not None:
+            self.__process_pool.shutdown()
+            self.__process_pool = None
+
+    def backend_for(self, name: str, default: str) -> str:
+        return self.__backends.get(name, default)
+
+    async def run(self, backend: str, function: Callable[..., Any], parameters: dict[str, Any],
+                  timeout: Optional[float] = None) -> Any:
+        if self.__process_pool is not None and (backend == PROCESS or (backend == THREAD and timeout)):
+            # поток, превысивший время, не прервать, а рабочий процесс - можно
+            return await self.__process_pool.run(function, parameters, timeout)
+        if backend in (THREAD, PROCESS) and self.__thread_pool is not None:
+            # Без пула процессов тяжёлые алгоритмы хотя бы не блокируют цикл событий
+            loop = asyncio.get_running_loop()
+            thread_pool = self.__thread_pool
+            try:
+                return await asyncio.wait_for(
+                    loop.run_in_executor(thread_pool, functools.partial(function, **parameters)),
+                    timeout or None)
+            except asyncio.TimeoutError:
+                if self.__thread_pool is thread_pool:
+                    # зависший поток продолжает работу вне пула, новые задания его не ждут
+                    self.__thread_pool = self.__new_thread_pool()
+                    thread_pool.shutdown(wait=False)
+                raise AlgorithmTimeoutError()
+        return function(**parameters)
+
+    def __new_thread_pool(self) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(max_workers=self.__thread_pool_size, thread_name_prefix='algorithm')
+
+
+algorithm_executor = AlgorithmExecutor()
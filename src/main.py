@@ -1,17 +1,46 @@
 """Реализация API для онлайн-калькулятора с использованием фреймворка FastAPI.
 """
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi_pagination import add_pagination
 from sqladmin import Admin
 
-from src import ALGORITHMS_ENDPOINT
+from src import ALGORITHMS_ENDPOINT, FILES_ENDPOINT, REGISTRY_REFRESH_INTERVAL, EXECUTOR_CONFIG
 from src.routers.algorithm import router as algorithm_router
+from src.routers.files import router as files_router
 from src.admin import CalculationsAdmin, ParametersAdmin, OutputAdmin
+from src.algorithms_manager import algorithms_manager
+from src.algorithms_registry import algorithms_registry
+from src.cache import result_cache
 from src.database import engine
+from src.spool import spool
+from src.executor import algorithm_executor
 from src.config import settings
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Реестр алгоритмов загружается один раз при старте и далее обновляется
+    # в фоне, чтобы при вычислениях не обращаться к БД. Ошибка загрузки не
+    # прерывает старт: таблицы могут быть ещё не созданы миграциями, поэтому
+    # загрузка повторяется с нарастающей задержкой до первого успеха
+    await algorithms_registry.refresh()
+    algorithms_registry.start(settings.algorithm_config.get(REGISTRY_REFRESH_INTERVAL, 0))
+    # Рабочие процессы запускаются и импортируют алгоритмы до первого запроса
+    algorithm_executor.start(settings.algorithm_config.get(EXECUTOR_CONFIG, {}), algorithms_manager.modules())
+    await algorithm_executor.warm_up()
+    result_cache.start(settings.cache_config, settings.redis_url)
+    spool.start(settings.spool_config)
+    yield
+    await spool.stop()
+    await result_cache.close()
+    algorithm_executor.shutdown()
+    await algorithms_registry.stop()
+
+
+app = FastAPI(lifespan=lifespan)
 
 # Добавление заголовков к HTTP ответам
 app.add_middleware(
@@ -32,4 +61,9 @@ app.include_router(
     prefix=ALGORITHMS_ENDPOINT,
 )
 
+app.include_router(
+    files_router,
+    prefix=FILES_ENDPOINT,
+)
+
 add_pagination(app)
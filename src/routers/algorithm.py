@@ -1,29 +1,30 @@
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from fastapi_pagination import Page
 from fastapi_pagination.ext.sqlalchemy import paginate
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 from starlette import status
-from fastapi import APIRouter, HTTPException, Depends
-
-from src.schemas.algorithms import (FibonacciOutputVariables, FibonacciInputVariables, MatrixSubOutputVariables,
-                                    MatrixSubInputVariables, FibonacciListInputVariables,
-                                    FibonacciListOutputVariables, QuadraticEquationInputVariables,
-                                    QuadraticEquationOutputVariables, SubstringInStringInputVariables,
-                                    SubstringInStringOutputVariables, PerfectNumbersInputVariables,
-                                    PerfectNumbersOutputVariables, FuelConsumptionInputVariables,
-                                    FuelConsumptionOutputVariables, SimplexMethodOutputVariables,
-                                    SimplexMethodInputVariables)
-from src.database import async_session_maker, get_async_session
-from src.schemas.calculations import (ReadCalculation, ReadAlgorithm, ReadOutput, ReadParameters)
+from starlette.datastructures import UploadFile
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
+from fastapi.responses import StreamingResponse
+
+from src import NDJSON_MEDIA_TYPE, NPY_MEDIA_TYPE, MSGPACK_MEDIA_TYPE
+from src.database import get_async_session
+from src.schemas.calculations import ReadCalculation, ReadAlgorithm
 
 from src.errors import ErrorMessages
-from src.models import Calculations, Parameters as ParametersModel, Outputs as OutputsModel
-from src.algorithms_manager import algorithms_manager
+from src.models import Calculations
+from src.algorithms_manager import algorithms_manager, ALGORITHMS
+from src.algorithms_registry import algorithms_registry
+from src.cache import result_cache
+from src.wire_formats import request_format, response_format
 
 router = APIRouter()
 
+UPLOAD_CHUNK_SIZE = 1 << 20
+"""Размер части загруженного файла, читаемой за один раз"""
+
 
 @router.get(
     '/',
@@ -43,124 +44,136 @@ async def get_algorithms(db: Session = Depends(get_async_session), name: Optiona
     response_model=ReadAlgorithm,
     tags=['db_algorithm'],
 )
-async def get_specific_algorithm(algorithm_name: str):
-    async with async_session_maker() as session:
-        stmt = select(Calculations).filter_by(name=algorithm_name)
-        res = await session.execute(stmt)
-        algorithm = res.scalar()
-
-        if not algorithm:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=ErrorMessages.GET_ALGORITHM_ALGORITHM_NOT_EXISTS
-            )
-
-        parameters_stmt = select(ParametersModel).join(ParametersModel.calculation).filter(
-            Calculations.id == algorithm.id)
-        outputs_stmt = select(OutputsModel).join(OutputsModel.calculation).filter(Calculations.id == algorithm.id)
-
-        parameters = await session.execute(parameters_stmt)
-        outputs = await session.execute(outputs_stmt)
-
-        parameters = parameters.all()
-        outputs = outputs.all()
-
-        parameters_rows = []
-        for parameter in parameters:
-            for row in parameter:
-                parameters_rows.append(
-                    ReadParameters(
-                        title=row.title,
-                        description=row.description,
-                        name=row.name,
-                        data_type=row.data_type,
-                        data_shape=row.data_shape,
-                    )
-                )
-        outputs_rows = []
-        for output in outputs:
-            for row in output:
-                outputs_rows.append(
-                    ReadOutput(
-                        title=row.title,
-                        description=row.description,
-                        name=row.name,
-                        data_type=row.data_type,
-                        data_shape=row.data_shape,
-                    )
-                )
-        result = ReadAlgorithm(parameters=parameters_rows, outputs=outputs_rows, description=algorithm.description,
-                               name=algorithm.name, title=algorithm.title)
-        return result
-
-
-@router.post(
-    '/fibonacci',
-    tags=['algorithms'],
-    response_model=FibonacciOutputVariables,
-)
-async def get_fibonacci_result(parameters: FibonacciInputVariables):
-    return await algorithms_manager.fibonacci_result(**parameters.__dict__)
-
-
-@router.post(
-    '/perfect_numbers',
-    tags=['algorithms'],
-    response_model=PerfectNumbersOutputVariables,
-)
-async def get_perfect_numbers_result(parameters: PerfectNumbersInputVariables):
-    return await algorithms_manager.perfect_numbers_result(**parameters.__dict__)
+async def get_specific_algorithm(algorithm_name: str, request: Request):
+    definition = algorithms_registry.definition(algorithm_name)
+    if definition is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=ErrorMessages.GET_ALGORITHM_ALGORITHM_NOT_EXISTS
+        )
+    headers = {'ETag': definition.etag, 'Cache-Control': 'no-cache'}
+    if_none_match = request.headers.get('if-none-match')
+    if if_none_match is not None:
+        etags = {etag.strip().removeprefix('W/') for etag in if_none_match.split(',')}
+        if definition.etag in etags or '*' in etags:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=definition.body, media_type='application/json', headers=headers)
+
+
+def __algorithm_endpoint(name: str):
+    async def endpoint(request: Request):
+        return await get_algorithm_result(name, request)
+    return endpoint
+
+
+# Пути алгоритмов объявлены раньше общего пути /{algorithm_name}, поэтому
+# запросы к известным алгоритмам обрабатывают они, а схема OpenAPI содержит
+# модели параметров и результата каждого алгоритма
+for spec in ALGORITHMS.values():
+    router.add_api_route(
+        f'/{spec.name}',
+        __algorithm_endpoint(spec.name),
+        methods=['POST'],
+        name=f'get_{spec.name}_result',
+        tags=['algorithms'],
+        response_class=Response,
+        responses={status.HTTP_200_OK: {'content': {
+            'application/json': {'schema': spec.output_model.model_json_schema()},
+            NDJSON_MEDIA_TYPE: {}, NPY_MEDIA_TYPE: {}, MSGPACK_MEDIA_TYPE: {}}}},
+        openapi_extra={'requestBody': {'required': True, 'content': {
+            'application/json': {'schema': spec.input_model.model_json_schema()},
+            NPY_MEDIA_TYPE: {'schema': {'type': 'string', 'format': 'binary'}},
+            MSGPACK_MEDIA_TYPE: {'schema': {'type': 'string', 'format': 'binary'}}}}},
+    )
 
 
 @router.post(
-    '/matrix_sub',
+    '/{algorithm_name}',
     tags=['algorithms'],
-    response_model=MatrixSubOutputVariables,
+    response_class=Response,
 )
-async def get_matrix_sub_result(parameters: MatrixSubInputVariables):
-    return await algorithms_manager.matrix_sub_result(**parameters.__dict__)
+async def get_algorithm_result(algorithm_name: str, request: Request):
+    body = await request.body()
+    if NDJSON_MEDIA_TYPE in request.headers.get('accept', ''):
+        # Потоковый ответ для алгоритмов со списком на выходе: элементы
+        # вычисляются в пуле потоков по мере отправки
+        chunks = algorithms_manager.stream(algorithm_name, body)
+        if chunks is not None:
+            return StreamingResponse(chunks, media_type=NDJSON_MEDIA_TYPE)
+    # Списки и матрицы в двоичных форматах читаются сразу в массивы NumPy
+    accept = response_format(request.headers.get('accept', ''))
+    result = await algorithms_manager.execute(algorithm_name, body,
+                                              request_format(request.headers.get('content-type', '')), accept)
+    return Response(content=result, media_type=accept or 'application/json')
 
 
 @router.post(
-    '/fibonacci_list',
-    tags=['algorithms'],
-    response_model=FibonacciListOutputVariables,
+    '/{algorithm_name}/files',
+    tags=['algorithms', 'files'],
+    response_class=Response,
+    responses={status.HTTP_200_OK: {'content': {'application/json': {}}}},
+    openapi_extra={'requestBody': {'required': True, 'content': {
+        'application/json': {'schema': {'type': 'object', 'additionalProperties': {'type': 'string'}}}}}},
 )
-async def get_fibonacci_list_result(parameters: FibonacciListInputVariables):
-    return await algorithms_manager.fibonacci_list_result(**parameters.__dict__)
+async def get_algorithm_file_result(algorithm_name: str, request: Request):
+    # Матрицы читаются из загруженных файлов (/api/files) по блокам,
+    # результат записывается в новый файл, доступный для скачивания
+    result = await algorithms_manager.execute_files(algorithm_name, await request.body())
+    return Response(content=result, media_type='application/json')
 
 
 @router.post(
-    '/fuel_consumption',
+    '/{algorithm_name}/text',
     tags=['algorithms'],
-    response_model=FuelConsumptionOutputVariables,
+    response_class=Response,
+    responses={status.HTTP_200_OK: {'content': {'application/json': {}}}},
+    openapi_extra={'requestBody': {'required': True, 'content': {
+        'text/plain': {'schema': {'type': 'string'}},
+        'multipart/form-data': {'schema': {'type': 'object', 'properties': {
+            'text': {'type': 'string', 'format': 'binary'}}}}}}},
 )
-async def get_fuel_consumption_result(parameters: FuelConsumptionInputVariables):
-    return await algorithms_manager.fuel_consumption_result(**parameters.__dict__)
+async def get_algorithm_text_result(algorithm_name: str, request: Request):
+    # Текст в UTF-8 - тело запроса или файл text формы, остальные параметры
+    # передаются в строке запроса. Текст обрабатывается по частям по мере
+    # получения и целиком в памяти не хранится
+    query = dict(request.query_params)
+    if 'multipart/form-data' not in request.headers.get('content-type', ''):
+        return Response(content=await algorithms_manager.execute_text(algorithm_name, request.stream(), query),
+                        media_type='application/json')
+    # файлы формы Starlette хранит на диске, если они больше 1 МБ
+    async with request.form() as form:
+        upload = form.get('text')
+        if not isinstance(upload, UploadFile):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=ErrorMessages.THE_TEXT_FILE_IS_MISSING,
+            )
+        result = await algorithms_manager.execute_text(algorithm_name, __read_upload(upload), query)
+    return Response(content=result, media_type='application/json')
 
 
-@router.post(
-    '/quadratic_equation',
-    tags=['algorithms'],
-    response_model=QuadraticEquationOutputVariables,
-)
-async def get_quadratic_equation_result(parameters: QuadraticEquationInputVariables):
-    return await algorithms_manager.quadratic_equation_result(**parameters.__dict__)
+async def __read_upload(upload: UploadFile) -> AsyncIterator[bytes]:
+    while chunk := await upload.read(UPLOAD_CHUNK_SIZE):
+        yield chunk
 
 
 @router.post(
-    '/substring_in_a_string',
+    '/{algorithm_name}/batch',
     tags=['algorithms'],
-    response_model=SubstringInStringOutputVariables,
+    response_class=Response,
+    responses={status.HTTP_200_OK: {'content': {'application/json': {}}}},
+    openapi_extra={'requestBody': {'required': True, 'content': {
+        'application/json': {'schema': {'type': 'array', 'items': {'type': 'object'}}}}}},
 )
-async def get_substring_in_a_string_result(parameters: SubstringInStringInputVariables):
-    return await algorithms_manager.substring_in_a_string_result(**parameters.__dict__)
+async def get_algorithm_batch_result(algorithm_name: str, request: Request):
+    result = await algorithms_manager.execute_batch(algorithm_name, await request.body())
+    return Response(content=result, media_type='application/json')
 
 
-@router.post(
-    '/simplex_method',
-    tags=['algorithms'],
-    response_model=SimplexMethodOutputVariables,
+@router.get(
+    '/{algorithm_name}/cache',
+    tags=['cache'],
 )
-async def get_substring_in_a_string_result(parameters: SimplexMethodInputVariables):
-    return await algorithms_manager.simplex_method_result(**parameters.__dict__)
+async def get_algorithm_cache_stats(algorithm_name: str):
+    algorithms_manager.get_spec(algorithm_name)
+    return result_cache.stats(algorithm_name)
@@ -0,0 +1,59 @@
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import FileResponse
+from starlette import status
+
+from src.errors import ErrorMessages
+from src.spool import spool
+
+router = APIRouter()
+
+
+@router.post(
+    '',
+    tags=['files'],
+    openapi_extra={'requestBody': {'required': True, 'content': {
+        'application/octet-stream': {'schema': {'type': 'string', 'format': 'binary'}}}}},
+)
+async def upload_file(request: Request, rows: Optional[int] = None, columns: Optional[int] = None,
+                      dtype: str = 'float64'):
+    # Тело - файл .npy либо, если заданы rows и columns, сырые данные
+    # матрицы по строкам. Файл пишется на диск по мере получения
+    if (rows is None) != (columns is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ErrorMessages.THE_FILE_IS_NOT_A_NUMERIC_MATRIX,
+        )
+    shape = (rows, columns) if rows is not None else None
+    file_id = await spool.save(request.stream(), shape, dtype)
+    return spool.describe(file_id)
+
+
+@router.get(
+    '/{file_id}',
+    tags=['files'],
+    response_class=FileResponse,
+)
+async def download_file(file_id: str):
+    return FileResponse(spool.path(file_id), media_type='application/octet-stream', filename=f'{file_id}.npy')
+
+
+@router.get(
+    '/{file_id}/info',
+    tags=['files'],
+)
+async def get_file_info(file_id: str):
+    return spool.describe(file_id)
+
+
+@router.delete(
+    '/{file_id}',
+    tags=['files'],
+    status_code=status.HTTP_204_NO_CONTENT,
+    response_class=Response,
+)
+async def delete_file(file_id: str):
+    # проверка идентификатора и 404 для отсутствующего файла
+    spool.path(file_id)
+    spool.remove(file_id)
@@ -10,13 +10,24 @@ class FibonacciInputVariables(BaseModel):
 
 class FibonacciListInputVariables(BaseModel):
     n: int
+    offset: int = 0
+    limit: Optional[int] = None
 
 
-class MatrixSubInputVariables(BaseModel):
+class MatrixPairInputVariables(BaseModel):
     n: list[list[float]]
     m: list[list[float]]
 
 
+class MatrixInputVariables(BaseModel):
+    n: list[list[float]]
+
+
+class MatrixSolveInputVariables(BaseModel):
+    n: list[list[float]]
+    b: list[float]
+
+
 class QuadraticEquationInputVariables(BaseModel):
     a: float
     b: float
@@ -26,10 +37,14 @@ class QuadraticEquationInputVariables(BaseModel):
 class SubstringInStringInputVariables(BaseModel):
     text: str
     findtext: str
+    mode: str = 'auto'
 
 
 class PerfectNumbersInputVariables(BaseModel):
-    numbers: list[int]
+    numbers: list[int] = []
+    lo: Optional[int] = None
+    hi: Optional[int] = None
+    classify: bool = False
 
 
 class FuelConsumptionInputVariables(BaseModel):
@@ -40,8 +55,19 @@ class FuelConsumptionInputVariables(BaseModel):
 
 
 class SimplexMethodInputVariables(BaseModel):
-    tableau: list[list[float]]
-    basic_var: list[int]
+    tableau: Optional[list[list[float]]] = None
+    basic_var: Optional[list[int]] = None
+    pivot_rule: Optional[str] = None
+    c: Optional[list[float]] = None
+    b: Optional[list[float]] = None
+    a_rows: Optional[list[int]] = None
+    a_cols: Optional[list[int]] = None
+    a_values: Optional[list[float]] = None
+    problem_id: Optional[str] = None
+    max_iterations: Optional[int] = None
+    time_limit: Optional[float] = None
+    integer_var: Optional[list[int]] = None
+    workers: int = 1
 
 
 # OUTPUT SCHEMAS
@@ -55,10 +81,18 @@ class FibonacciListOutputVariables(BaseModel):
     result: list[int]
 
 
-class MatrixSubOutputVariables(BaseModel):
+class MatrixOutputVariables(BaseModel):
     result: list[list[float]]
 
 
+class MatrixDetOutputVariables(BaseModel):
+    result: float
+
+
+class MatrixSolveOutputVariables(BaseModel):
+    result: list[float]
+
+
 class QuadraticEquationOutputVariables(BaseModel):
     roots: str
 
@@ -70,6 +104,8 @@ class SubstringInStringOutputVariables(BaseModel):
 class PerfectNumbersOutputVariables(BaseModel):
     has_perfect: bool
     perfect_numbers: list[int]
+    abundant_count: Optional[int] = None
+    deficient_count: Optional[int] = None
 
 
 class FuelConsumptionOutputVariables(BaseModel):
@@ -80,3 +116,10 @@ class FuelConsumptionOutputVariables(BaseModel):
 class SimplexMethodOutputVariables(BaseModel):
     optimal_solution: list[float]
     optimal_value: float
+    iterations: int
+    basis: Optional[list[int]] = None
+    problem_id: str
+    shadow_prices: Optional[list[float]] = None
+    reduced_costs: Optional[list[float]] = None
+    gap: Optional[float] = None
+    nodes: Optional[int] = None
@@ -0,0 +1,254 @@
+"""Каталог загруженных файлов матриц (spool).
+
+Файл принимается потоком по частям и сразу пишется на диск, поэтому размер
+матрицы ограничен не памятью процесса, а max_file_size. Все файлы каталога
+хранятся в формате .npy: загруженный файл .npy сохраняется как есть, а к
+сырым двоичным данным (матрица заданного типа и размера, построчно) при
+загрузке дописывается заголовок .npy. Матричные алгоритмы открывают файлы
+отображением в память (matrix_engine.open_matrix) и пишут результат в новый
+файл этого же каталога, который скачивается как файл .npy.
+
+Файл становится доступен по идентификатору только после проверки, до этого
+он хранится с суффиксом PARTIAL_SUFFIX. Файл удаляется через ttl секунд
+после последнего обращения (время изменения файла обновляется при каждом
+обращении) - при создании новых файлов и раз в cleanup_interval секунд.
+Файлы выполняемых операций (use) не удаляются. Суммарный размер файлов
+каталога ограничен max_total_size.
+"""
+import asyncio
+import logging
+import math
+import os
+import re
+import time
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, AsyncIterator, Iterator, Optional
+
+import numpy as np
+from fastapi import HTTPException
+from starlette import status
+from starlette.concurrency import run_in_threadpool
+
+from src.errors import ErrorMessages
+
+DIRECTORY = 'directory'
+"""Ключ конфигурации: каталог файлов"""
+
+MAX_FILE_SIZE = 'max_file_size'
+"""Ключ конфигурации: наибольший размер загружаемого файла в байтах (0 - без
+ограничения)"""
+
+MAX_TOTAL_SIZE = 'max_total_size'
+"""Ключ конфигурации: наибольший суммарный размер файлов каталога в байтах
+(0 - без ограничения)"""
+
+TTL = 'ttl'
+"""Ключ конфигурации: время хранения файла после последнего обращения в секундах"""
+
+CLEANUP_INTERVAL = 'cleanup_interval'
+"""Ключ конфигурации: период удаления устаревших файлов в секундах (0 - только
+при создании файлов)"""
+
+EXECUTE_TIMEOUT = 'execute_timeout'
+"""Ключ конфигурации: время выполнения операции над файлами в секундах
+(0 - без ограничения), заменяет execute_timeout алгоритма"""
+
+NPY_SUFFIX = '.npy'
+PARTIAL_SUFFIX = '.part'
+
+FILE_ID_PATTERN = re.compile('[0-9a-f]{32}')
+"""Идентификатор файла; проверяется, чтобы он не мог указать путь вне каталога"""
+
+
+class Spool:
+
+    def __init__(self):
+        self.__directory: Optional[str] = None
+        self.__limits: dict[str, int] = {MAX_FILE_SIZE: 0, MAX_TOTAL_SIZE: 0, TTL: 0, CLEANUP_INTERVAL: 0,
+                                         EXECUTE_TIMEOUT: 0}
+        self.__in_use: Counter[str] = Counter()
+        self.__cleanup_task: Optional[asyncio.Task] = None
+        self.__logger = logging.getLogger(__name__)
+
+    def start(self, config: dict[str, Any]) -> None:
+        self.__directory = config.get(DIRECTORY, 'spool')
+        self.__limits = {**self.__limits, **{key: config[key] for key in self.__limits if key in config}}
+        os.makedirs(self.__directory, exist_ok=True)
+        self.__remove_expired()
+        interval = self.__limits[CLEANUP_INTERVAL]
+        if interval > 0 and self.__limits[TTL] > 0 and self.__cleanup_task is None:
+            self.__cleanup_task = asyncio.create_task(self.__cleanup_periodically(interval))
+
+    async def stop(self) -> None:
+        if self.__cleanup_task is not None:
+            self.__cleanup_task.cancel()
+            try:
+                await self.__cleanup_task
+            except asyncio.CancelledError:
+                pass
+            self.__cleanup_task = None
+
+    @property
+    def execute_timeout(self) -> int:
+        return self.__limits[EXECUTE_TIMEOUT]
+
+    def path(self, file_id: str) -> str:
+        """Путь к файлу по идентификатору, 404 - если файла нет. Обращение
+        продлевает хранение файла на ttl"""
+        path = self.__path(file_id) if FILE_ID_PATTERN.fullmatch(file_id) else None
+        try:
+            if path is None:
+                raise FileNotFoundError(file_id)
+            os.utime(path)
+        except FileNotFoundError:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=ErrorMessages.THE_FILE_DOES_NOT_EXIST,
+            )
+        return path
+
+    @contextmanager
+    def use(self, file_ids: list[str]) -> Iterator[None]:
+        """Файлы file_ids не удаляются как устаревшие, пока выполняется
+        операция над ними"""
+        self.__in_use.update(file_ids)
+        try:
+            yield
+        finally:
+            self.__in_use.subtract(file_ids)
+            # сложение с пустым Counter удаляет нулевые счётчики
+            self.__in_use += Counter()
+
+    def create(self) -> tuple[str, str]:
+        """Идентификатор и временный путь нового файла, который становится
+        доступен после commit. 507 - если каталог уже заполнен"""
+        self.__remove_expired()
+        if 0 < self.__limits[MAX_TOTAL_SIZE] <= self.total_size():
+            raise self.__spool_is_full()
+        file_id = uuid.uuid4().hex
+        return file_id, self.__path(file_id) + PARTIAL_SUFFIX
+
+    def total_size(self) -> int:
+        """Суммарный размер файлов каталога в байтах"""
+        total = 0
+        for entry in os.scandir(self.__directory):
+            try:
+                total += entry.stat().st_size if entry.is_file() else 0
+            except FileNotFoundError:
+                pass
+        return total
+
+    def commit(self, file_id: str) -> None:
+        os.replace(self.__path(file_id) + PARTIAL_SUFFIX, self.__path(file_id))
+
+    def remove(self, file_id: str) -> None:
+        for path in (self.__path(file_id), self.__path(file_id) + PARTIAL_SUFFIX):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def describe(self, file_id: str) -> dict[str, Any]:
+        """Размер и тип элементов матрицы по заголовку .npy"""
+        # отображение в память читает только заголовок
+        matrix = np.load(self.path(file_id), mmap_mode='r', allow_pickle=False)
+        return {'file_id': file_id, 'shape': list(matrix.shape), 'dtype': matrix.dtype.str}
+
+    async def save(self, chunks: AsyncIterator[bytes], shape: Optional[tuple[int, int]] = None,
+                   dtype: str = 'float64') -> str:
+        """Сохраняет файл .npy или, если задан размер shape, сырые данные
+        матрицы с элементами типа dtype. Возвращает идентификатор файла"""
+        header = self.__raw_header(dtype, shape) if shape is not None else None
+        file_id, path = self.create()
+        # место в каталоге, оставшееся на момент начала загрузки
+        free = self.__limits[MAX_TOTAL_SIZE] - self.total_size() if self.__limits[MAX_TOTAL_SIZE] > 0 else None
+        try:
+            size = 0
+            with open(path, 'wb') as file:
+                if header is not None:
+                    np.lib.format.write_array_header_1_0(file, header)
+                    data_offset = file.tell()
+                async for chunk in chunks:
+                    size += len(chunk)
+                    if 0 < self.__limits[MAX_FILE_SIZE] < size:
+                        raise HTTPException(
+                            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                            detail=ErrorMessages.THE_FILE_IS_TOO_LARGE,
+                        )
+                    if free is not None and size > free:
+                        raise self.__spool_is_full()
+                    await run_in_threadpool(file.write, chunk)
+            if header is not None:
+                expected = math.prod(shape) * np.dtype(dtype).itemsize
+                if os.path.getsize(path) - data_offset != expected:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail=ErrorMessages.THE_FILE_SIZE_DOES_NOT_MATCH_THE_SHAPE,
+                    )
+            else:
+                self.__check_npy(path)
+        except BaseException:
+            self.remove(file_id)
+            raise
+        self.commit(file_id)
+        return file_id
+
+    def __path(self, file_id: str) -> str:
+        return os.path.join(self.__directory, file_id + NPY_SUFFIX)
+
+    @staticmethod
+    def __spool_is_full() -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_507_INSUFFICIENT_STORAGE,
+            detail=ErrorMessages.THE_FILE_STORAGE_IS_FULL,
+        )
+
+    @staticmethod
+    def __raw_header(dtype: str, shape: tuple[int, int]) -> dict[str, Any]:
+        try:
+            dtype = np.dtype(dtype)
+        except TypeError:
+            dtype = None
+        if dtype is None or dtype.kind not in 'biuf' or len(shape) != 2 or min(shape) <= 0:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=ErrorMessages.THE_FILE_IS_NOT_A_NUMERIC_MATRIX,
+            )
+        return {'descr': np.lib.format.dtype_to_descr(dtype), 'fortran_order': False, 'shape': tuple(shape)}
+
+    @staticmethod
+    def __check_npy(path: str) -> None:
+        # заголовок и размер данных проверяются отображением файла без чтения
+        try:
+            matrix = np.load(path, mmap_mode='r', allow_pickle=False)
+            valid = isinstance(matrix, np.ndarray) and matrix.ndim == 2 and matrix.dtype.kind in 'biuf'
+        except (ValueError, OSError, EOFError):
+            valid = False
+        if not valid:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=ErrorMessages.THE_FILE_IS_NOT_A_NUMERIC_MATRIX,
+            )
+
+    def __remove_expired(self) -> None:
+        if self.__directory is None or self.__limits[TTL] <= 0:
+            return
+        expired = time.time() - self.__limits[TTL]
+        for entry in os.scandir(self.__directory):
+            if entry.name.split('.')[0] in self.__in_use:
+                continue
+            try:
+                if entry.is_file() and entry.stat().st_mtime < expired:
+                    os.remove(entry.path)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                self.__logger.exception('Spool cleanup failed')
+
+    async def __cleanup_periodically(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            await run_in_threadpool(self.__remove_expired)
+
+
+spool = Spool()
@@ -7,6 +7,12 @@ from core_tests.data_element_tests import DataElementTests
 from core_tests.data_type_tests import DataTypeTests
 from core_tests.data_shape_tests import DataShapeTests
 from app_tests.app_tests import AppTest
+from app_tests.cache_tests import CacheTests
+from app_tests.wire_formats_tests import WireFormatsTests
+from app_tests.spool_tests import SpoolTests
+from app_tests.stream_tests import StreamTests
+from app_tests.executor_tests import ExecutorTests
+from app_tests.registry_tests import RegistryTests
 
 if __name__ == '__main__':
     if os.path.exists(os.path.basename(__file__)):
@@ -19,6 +25,12 @@ if __name__ == '__main__':
     suite.addTest(unittest.makeSuite(AlgorithmBuilderTest))
     suite.addTest(unittest.makeSuite(AlgorithmCollectionTests))
     suite.addTest(unittest.makeSuite(AppTest))
+    suite.addTest(unittest.makeSuite(CacheTests))
+    suite.addTest(unittest.makeSuite(WireFormatsTests))
+    suite.addTest(unittest.makeSuite(SpoolTests))
+    suite.addTest(unittest.makeSuite(StreamTests))
+    suite.addTest(unittest.makeSuite(ExecutorTests))
+    suite.addTest(unittest.makeSuite(RegistryTests))
 
     runner = unittest.TextTestRunner(verbosity=2)
     runner.run(suite)
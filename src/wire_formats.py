@@ -0,0 +1,123 @@
+"""Двоичные форматы тел запросов и ответов алгоритмов.
+
+Параметры формы LIST и MATRIX передаются массивами NumPy, которые читаются
+из заголовка .npy и буфера данных целиком, без объекта Python на каждый
+элемент и без pickle:
+    - application/x-npy - архив .npz (zip из файлов .npy) с файлом на каждый
+      параметр; скалярные параметры - массивы нулевой размерности;
+    - application/msgpack - словарь параметров MessagePack, массивы в котором
+      передаются расширением NPY_EXT_TYPE с содержимым файла .npy.
+Формат по умолчанию - JSON, для него функции модуля не вызываются.
+"""
+import importlib.util
+import io
+import zipfile
+from typing import Any, Optional
+
+import numpy as np
+
+from src import NPY_MEDIA_TYPE, MSGPACK_MEDIA_TYPE
+
+NPY_EXT_TYPE = 1
+"""Код расширения MessagePack для массива в формате .npy"""
+
+MSGPACK_AVAILABLE = importlib.util.find_spec('msgpack') is not None
+"""Установлен ли пакет msgpack; без него формат MessagePack не поддерживается"""
+
+DECODE_FAILED_MSG = 'Не удалось прочитать тело запроса'
+ENCODE_FAILED_MSG = 'Результат не представим в запрошенном формате'
+
+
+def request_format(content_type: str) -> Optional[str]:
+    """Двоичный формат тела запроса по заголовку Content-Type, None - JSON"""
+    for media_type in (NPY_MEDIA_TYPE, MSGPACK_MEDIA_TYPE):
+        if media_type in content_type:
+            return media_type
+    return None
+
+
+def response_format(accept: str) -> Optional[str]:
+    """Двоичный формат ответа по заголовку Accept, None - JSON. MessagePack
+    без установленного пакета msgpack не предлагается"""
+    if NPY_MEDIA_TYPE in accept:
+        return NPY_MEDIA_TYPE
+    if MSGPACK_MEDIA_TYPE in accept and MSGPACK_AVAILABLE:
+        return MSGPACK_MEDIA_TYPE
+    return None
+
+
+def decode(body: bytes, media_type: str) -> dict[str, Any]:
+    """Словарь параметров из двоичного тела запроса. Списки и матрицы
+    становятся массивами NumPy, проверка их формы и типа элементов остаётся
+    за AlgorithmSpec.parse_values"""
+    if media_type == NPY_MEDIA_TYPE:
+        return __read_npz(body)
+    return __read_msgpack(body)
+
+
+def encode(values: dict[str, Any], media_type: str) -> bytes:
+    """Двоичный ответ из значений выходной модели. Отсутствующие значения
+    (None) не передаются"""
+    values = {name: value for name, value in values.items() if value is not None}
+    if media_type == NPY_MEDIA_TYPE:
+        buffer = io.BytesIO()
+        np.savez(buffer, **{name: __to_array(value) for name, value in values.items()})
+        return buffer.getvalue()
+    import msgpack
+    try:
+        return msgpack.packb({name: __to_ext(value) if isinstance(value, list) else value
+                              for name, value in values.items()})
+    except OverflowError:
+        raise ValueError(ENCODE_FAILED_MSG)
+
+
+def __read_npz(body: bytes) -> dict[str, Any]:
+    try:
+        archive = np.load(io.BytesIO(body), allow_pickle=False)
+        if not isinstance(archive, np.lib.npyio.NpzFile):
+            # одиночный файл .npy не несёт имени параметра
+            raise ValueError(DECODE_FAILED_MSG)
+        with archive:
+            return {name: __from_array(archive[name]) for name in archive.files}
+    except (ValueError, OSError, EOFError, zipfile.BadZipFile):
+        raise ValueError(DECODE_FAILED_MSG)
+
+
+def __read_msgpack(body: bytes) -> dict[str, Any]:
+    import msgpack
+
+    def ext_hook(code: int, data: bytes) -> Any:
+        if code != NPY_EXT_TYPE:
+            return msgpack.ExtType(code, data)
+        return np.lib.format.read_array(io.BytesIO(data), allow_pickle=False)
+
+    try:
+        values = msgpack.unpackb(body, ext_hook=ext_hook)
+    except (ValueError, EOFError, msgpack.UnpackException):
+        raise ValueError(DECODE_FAILED_MSG)
+    if not isinstance(values, dict):
+        raise ValueError(DECODE_FAILED_MSG)
+    return values
+
+
+def __from_array(array: np.ndarray) -> Any:
+    # скалярный параметр хранится массивом нулевой размерности
+    return array.item() if array.ndim == 0 else array
+
+
+def __to_array(value: Any) -> np.ndarray:
+    try:
+        array = np.asarray(value)
+    except (ValueError, OverflowError):
+        raise ValueError(ENCODE_FAILED_MSG)
+    # целые длиннее 64 бит NumPy хранит как объекты Python
+    if array.dtype == object:
+        raise ValueError(ENCODE_FAILED_MSG)
+    return array
+
+
+def __to_ext(value: list) -> Any:
+    import msgpack
+    buffer = io.BytesIO()
+    np.save(buffer, __to_array(value), allow_pickle=False)
+    return msgpack.ExtType(NPY_EXT_TYPE, buffer.getvalue())